@@ -15,6 +15,7 @@ import sys
 import argparse
 import ipaddress
 import multiprocessing
+import signal
 from datetime import datetime
 
 
@@ -26,6 +27,7 @@ from switchmap.core.daemon import Daemon, GracefulDaemon
 from switchmap.core import files
 from switchmap.core import log
 from switchmap.core.configuration import ConfigCore
+from switchmap.core import configuration
 from switchmap.core.variables import AgentAPIVariable
 
 
@@ -112,6 +114,9 @@ class _AgentRun:
             None
 
         """
+        # Read the configuration files again on SIGHUP
+        signal.signal(signal.SIGHUP, configuration.reload)
+
         # Start polling. (Poller decides frequency)
         while True:
             self._agent_.query()
@@ -3,12 +3,27 @@
 import os.path
 import os
 import multiprocessing
+import threading
+import time
 
 # Import project libraries
 from switchmap.core import files
 from switchmap.core import log
 from switchmap.core import general
 
+# Process wide cache of parsed configuration files keyed by filepath. The
+# parsed data is shared by all configuration objects and must not be modified
+_CACHE = {}
+_LOCK = threading.Lock()
+
+# Cached configuration read before the latest reload() is stale. The counter
+# is updated without locking so that reload() can be a signal handler
+_GENERATION = 0
+
+# Files modified less than this many nanoseconds before they were read are
+# read again, as later writes may not change their modification time
+_RACY = 2 * 10**9
+
 
 class _Config:
     """Class gathers all configuration information."""
@@ -25,7 +40,71 @@ class _Config:
         """
         # Initialize key variables
         filepath = files.config_filepath()
-        self._config_complete = files.read_yaml_file(filepath)
+        self._config_complete = _read(filepath)
+
+
+def reload(signum=None, frame=None):
+    """Discard the cached configuration so that it is read again.
+
+    This can be used as a SIGHUP signal handler. Handlers interrupt the
+    main thread, possibly while it holds _LOCK, so no lock is taken here.
+
+    Args:
+        signum: Signal number
+        frame: Stack frame
+
+    Returns:
+        None
+
+    """
+    # Invalidate the cache
+    global _GENERATION
+    _GENERATION += 1
+
+
+def _read(filepath):
+    """Read a configuration file, parsing it only if it has changed.
+
+    Args:
+        filepath: Configuration file
+
+    Returns:
+        result: Dict of configuration
+
+    """
+    # Get the file's signature
+    try:
+        status = os.stat(filepath)
+        signature = (status.st_mtime_ns, status.st_size, status.st_ino)
+    except OSError:
+        signature = None
+
+    # Use the cached configuration if the file is unchanged
+    generation = _GENERATION
+    with _LOCK:
+        cached = _CACHE.get(filepath)
+    if cached is not None and signature is not None:
+        if (
+            cached["signature"] == signature
+            and cached["read"] - signature[0] > _RACY
+            and cached["generation"] == generation
+        ):
+            return cached["data"]
+
+    # Parse the file
+    read = time.time_ns()
+    result = files.read_yaml_file(filepath)
+    if signature is not None:
+        with _LOCK:
+            _CACHE[filepath] = {
+                "signature": signature,
+                "read": read,
+                "generation": generation,
+                "data": result,
+            }
+
+    # Return
+    return result
 
 
 class ConfigCore(_Config):
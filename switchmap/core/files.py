@@ -4,6 +4,8 @@ import os
 import sys
 import subprocess
 import shutil
+import gzip
+import json
 
 # PIP imports
 import yaml
@@ -12,6 +14,10 @@ import yaml
 from switchmap.core import log
 from switchmap.core import general
 
+# Formats of the cache files posted by pollers. The format is also the file
+# extension. YAML is slow to parse and is only intended for debugging
+CACHE_FORMATS = ("json", "json.gz", "yaml")
+
 
 class _Directory:
     """A class for creating the names of system directories."""
@@ -72,6 +78,62 @@ class _Directory:
         value = "{}{}snmp".format(self._system_root, os.sep)
         return value
 
+    def capability(self):
+        """Define the system device capability directory.
+
+        Args:
+            None
+
+        Returns:
+            value: capability directory
+
+        """
+        # Return
+        value = "{}{}capability".format(self._system_root, os.sep)
+        return value
+
+    def repetitions(self):
+        """Define the system bulkwalk tuning directory.
+
+        Args:
+            None
+
+        Returns:
+            value: repetitions directory
+
+        """
+        # Return
+        value = "{}{}repetitions".format(self._system_root, os.sep)
+        return value
+
+    def snapshot(self):
+        """Define the system interface snapshot directory.
+
+        Args:
+            None
+
+        Returns:
+            value: snapshot directory
+
+        """
+        # Return
+        value = "{}{}snapshot".format(self._system_root, os.sep)
+        return value
+
+    def spool(self):
+        """Define the system spool directory for unposted device data.
+
+        Args:
+            None
+
+        Returns:
+            value: spool directory
+
+        """
+        # Return
+        value = "{}{}spool".format(self._system_root, os.sep)
+        return value
+
 
 class _File:
     """A class for creating the names of system files."""
@@ -151,9 +213,88 @@ class _File:
         value = "{}{}{}.snmp".format(self._directory.snmp(), os.sep, prefix)
         return value
 
+    def credentials(self):
+        """Define the SNMP credential store file.
+
+        Args:
+            None
+
+        Returns:
+            value: SNMP credential store file
+
+        """
+        # Return
+        mkdir(self._directory.snmp())
+        value = "{}{}credentials.db".format(self._directory.snmp(), os.sep)
+        return value
+
+    def capability(self, prefix):
+        """Define the device capability file.
 
-def move_yaml_files(src, dst):
-    """Move all yaml files from source to destination directory.
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: capability file
+
+        """
+        # Return
+        mkdir(self._directory.capability())
+        value = "{}{}{}.yaml".format(
+            self._directory.capability(), os.sep, prefix
+        )
+        return value
+
+    def repetitions(self, prefix):
+        """Define the device bulkwalk tuning file.
+
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: repetitions file
+
+        """
+        # Return
+        mkdir(self._directory.repetitions())
+        value = "{}{}{}.yaml".format(
+            self._directory.repetitions(), os.sep, prefix
+        )
+        return value
+
+    def snapshot(self, prefix):
+        """Define the device interface snapshot file.
+
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: snapshot file
+
+        """
+        # Return
+        mkdir(self._directory.snapshot())
+        value = "{}{}{}.yaml".format(self._directory.snapshot(), os.sep, prefix)
+        return value
+
+    def spool(self, prefix):
+        """Define the spool file of unposted device data.
+
+        Args:
+            prefix: Prefix of file
+
+        Returns:
+            value: spool file
+
+        """
+        # Return
+        mkdir(self._directory.spool())
+        value = "{}{}{}.json.gz".format(self._directory.spool(), os.sep, prefix)
+        return value
+
+
+def move_cache_files(src, dst):
+    """Move all cache files from source to destination directory.
 
     Args:
         src: Source directory
@@ -167,10 +308,209 @@ def move_yaml_files(src, dst):
     src_files = os.listdir(src)
     for filename in src_files:
         filepath = os.path.join(src, filename)
-        if os.path.isfile(filepath) and filepath.lower().endswith(".yaml"):
+        if os.path.isfile(filepath) and bool(cache_format(filepath)) is True:
             shutil.move(filepath, dst)
 
 
+def cache_format(filepath):
+    """Get the format of a cache file from its extension.
+
+    Args:
+        filepath: Path to the cache file
+
+    Returns:
+        result: Format of the file, None if it isn't a cache file
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get result
+    for item in CACHE_FORMATS:
+        if filepath.lower().endswith(".{}".format(item)):
+            result = item
+            break
+
+    # Return
+    return result
+
+
+def read_cache_file(filepath, die=True):
+    """Read the contents of a cache file in any of the cache formats.
+
+    Args:
+        filepath: Path to file to be read
+        die: Die if there is an error
+
+    Returns:
+        result: Dict of data read
+
+    """
+    # Initialize key variables
+    result = {}
+    _format = cache_format(filepath)
+
+    # YAML files
+    if _format == "yaml":
+        return read_yaml_file(filepath, die=die)
+
+    # JSON files
+    try:
+        if _format == "json.gz":
+            with gzip.open(filepath, "rt") as f_handle:
+                result = json.load(f_handle)
+        elif _format == "json":
+            with open(filepath, "r") as f_handle:
+                result = json.load(f_handle)
+        else:
+            raise ValueError("Unknown cache file format")
+    except:
+        log_message = (
+            "Error reading cache file {}. Check permissions, "
+            "existence and file format.".format(filepath)
+        )
+        if bool(die) is True:
+            log.log2die_safe(2026, log_message)
+        else:
+            log.log2debug(2027, log_message)
+            return {}
+
+    # Convert all dict keys to int
+    result = general.consistent_keys(result)
+
+    # Return
+    return result
+
+
+def write_cache_file(filepath, data):
+    """Write data to a cache file in the format given by its extension.
+
+    The file is written under a temporary name and then renamed so that the
+    ingester never reads a partially written file.
+
+    Args:
+        filepath: Path to the cache file
+        data: Data to write
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    _format = cache_format(filepath)
+    tmp_filepath = "{}.tmp".format(filepath)
+
+    # Write the file. The fastest compression level is used as the files
+    # are short lived
+    if _format == "json.gz":
+        with gzip.open(tmp_filepath, "wt", compresslevel=1) as f_handle:
+            json.dump(data, f_handle, separators=(",", ":"))
+    elif _format == "json":
+        with open(tmp_filepath, "w") as f_handle:
+            json.dump(data, f_handle, separators=(",", ":"))
+    elif _format == "yaml":
+        with open(tmp_filepath, "w") as f_handle:
+            yaml.dump(data, f_handle)
+    else:
+        log_message = "{} is not a cache file.".format(filepath)
+        log.log2die_safe(2028, log_message)
+    os.replace(tmp_filepath, filepath)
+
+
+def write_cache_stream(filepath, stream, compressed=False, misc=None):
+    """Write JSON data read from a file object to a cache file.
+
+    JSON data is copied to a temporary file without being decoded, so the
+    complete document is never held in memory while it is received. The
+    temporary file is then validated and renamed so that the ingester never
+    reads a partially written or invalid file.
+
+    Args:
+        filepath: Path to the cache file
+        stream: File object to read JSON data from
+        compressed: True if the data read from the stream is gzip compressed
+        misc: Dict of values the "misc" key of the data must have
+
+    Returns:
+        success: True if successful
+
+    """
+    # Initialize key variables
+    success = False
+    _format = cache_format(filepath)
+    tmp_filepath = "{}.tmp".format(filepath)
+
+    # Write the file. Uncompressed data is compressed with the fastest
+    # compression level as the files are short lived
+    try:
+        if _format == "yaml":
+            if compressed is True:
+                stream = gzip.GzipFile(fileobj=stream, mode="rb")
+            data = json.load(stream)
+            _validate_cache(data, misc)
+            write_cache_file(filepath, data)
+        else:
+            with open(tmp_filepath, "wb") as f_handle:
+                if _format == "json.gz" and compressed is False:
+                    with gzip.GzipFile(
+                        fileobj=f_handle, mode="wb", compresslevel=1
+                    ) as g_handle:
+                        shutil.copyfileobj(stream, g_handle)
+                elif _format == "json" and compressed is True:
+                    shutil.copyfileobj(
+                        gzip.GzipFile(fileobj=stream, mode="rb"), f_handle
+                    )
+                else:
+                    shutil.copyfileobj(stream, f_handle)
+
+            # Only complete documents of the expected device are kept
+            if _format == "json.gz":
+                with gzip.open(tmp_filepath, "rb") as f_handle:
+                    _validate_cache(json.load(f_handle), misc)
+            else:
+                with open(tmp_filepath, "rb") as f_handle:
+                    _validate_cache(json.load(f_handle), misc)
+            os.replace(tmp_filepath, filepath)
+        success = True
+    except Exception as exception_error:
+        log_message = "Cannot write cache file {}: {}".format(
+            filepath, exception_error
+        )
+        log.log2warning(2031, log_message)
+        if os.path.exists(tmp_filepath) is True:
+            os.remove(tmp_filepath)
+
+    # Return
+    return success
+
+
+def _validate_cache(data, misc=None):
+    """Validate the data of a cache file.
+
+    Args:
+        data: Data read from the cache file
+        misc: Dict of values the "misc" key of the data must have
+
+    Returns:
+        None
+
+    """
+    # Cache files contain a dict of device data
+    if isinstance(data, dict) is False:
+        raise ValueError("Data isn't a dict")
+
+    # Data must be of the expected device
+    for key, value in (misc or {}).items():
+        try:
+            found = data["misc"][key]
+        except:
+            found = None
+        if found != value:
+            raise ValueError(
+                'Data has "{}" value {} not {}'.format(key, found, value)
+            )
+
+
 def read_yaml_files(directories):
     """Read the contents of all yaml files in a directory.
 
@@ -392,6 +732,90 @@ def snmp_file(hostname, config):
     return result
 
 
+def credentials_file(config):
+    """Get the SNMP credential store file.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of SNMP credential store file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.credentials()
+    return result
+
+
+def capability_file(hostname, config):
+    """Get the device capability cache file for a host.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of capability file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.capability(hostname)
+    return result
+
+
+def repetitions_file(hostname, config):
+    """Get the bulkwalk tuning file for a host.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of repetitions file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.repetitions(hostname)
+    return result
+
+
+def snapshot_file(hostname, config):
+    """Get the interface snapshot file for a host.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of snapshot file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.snapshot(hostname)
+    return result
+
+
+def spool_file(prefix, config):
+    """Get the spool file of unposted device data.
+
+    Args:
+        prefix: Prefix of file
+        config: Config object
+
+    Returns:
+        result: Name of spool file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.spool(prefix)
+    return result
+
+
 def execute(command, die=True):
     """Run the command UNIX CLI command and record output.
 
@@ -1,7 +1,12 @@
 """Functions for creating URIs."""
 
 # Standard imports
+import os
 import sys
+import json
+import threading
+import itertools
+import zlib
 import requests
 from collections import namedtuple
 
@@ -11,8 +16,16 @@ from switchmap.core import log
 from switchmap import API_PREFIX
 from switchmap.core.log import ExceptionWrapper
 
+# Requests sessions keyed by (process ID, thread ID). Sessions keep the
+# connection to the server open between posts but must not be shared between
+# threads or inherited by forked processes
+_SESSIONS = {}
 
-def post(uri, data, config, server=True):
+# Approximate number of bytes of JSON compressed at a time
+_CHUNK_SIZE = 65536
+
+
+def post(uri, data, config, server=True, compress=False, params=None):
     """Create URI for datacenter RRD and oid_id data.
 
     Args:
@@ -20,79 +33,80 @@ def post(uri, data, config, server=True):
         data: Data to post
         config: ConfitAPIClient object
         server: Posting to a server if True, API if False
+        compress: Stream the data gzip compressed if True. The data is sent
+            again uncompressed if the server rejects the compression.
+        params: Dict of query string parameters
 
     Returns:
         data: Post named tuple
 
     """
     # Initialize key variables
-    success = False
-    response = False
-    Post = namedtuple("Post", "success response")
+    url, auth = _target(uri, config, server)
+    compress = bool(compress)
+
+    # Post compressed data
+    if compress is True:
+        result = _send(
+            url,
+            auth,
+            data=_encoded([data], compress=True),
+            params=params,
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
 
-    # Create the URL for posting
-    # config = ConfigAPIClient()
-    username = config.server_username()
-    password = config.server_password()
+        # Servers that can't decompress posts reject them. Other errors
+        # aren't related to the compression and aren't retried.
+        if _rejected(result) is True:
+            compress = False
+            log_message = (
+                "Server {} rejected a compressed post. Posting "
+                "uncompressed data instead.".format(url)
+            )
+            log.log2info(2030, log_message)
 
-    # Create the URL for posting
-    if bool(server) is True:
-        url_root = config.server_url_root()
-    else:
-        url_root = config.api_url_root()
-    url = _clean_url("{}/{}/{}".format(url_root, API_PREFIX, uri))
+    # Post uncompressed data
+    if compress is False:
+        result = _send(url, auth, document=data, params=params)
 
-    # Log
-    log_message = "Attempting to post data to {}.".format(url)
-    log.log2info(1583, log_message)
+    # Return
+    return result
 
-    # Post data save to cache if this fails
-    with requests.Session() as session:
 
-        # if bool(username) is False or bool(password) is False:
-        #     result = session.post(url, json=data)
-        # else:
-        #     result = session.post(url, json=data, auth=(username, password))
-        # response = True
+def post_batch(uri, items, config, server=True, compress=False):
+    """Post many documents as newline delimited JSON in a single request.
 
-        try:
-            with requests.Session() as session:
-                if bool(username) is False or bool(password) is False:
-                    result = session.post(url, json=data)
-                else:
-                    result = session.post(
-                        url, json=data, auth=(username, password)
-                    )
-                response = True
-        except Exception as error:
-            log_message = "Error posting to {}".format(url)
-            log.log2warning(1537, log_message)
-            log.log2exception(1641, sys.exc_info())
-            return ExceptionWrapper(error)
-        except:
-            log_message = "Failed to post data to API server URL {}.".format(
-                url
-            )
-            log.log2info(1038, log_message)
+    Documents are encoded as they are sent, so only one document needs to
+    be in memory at a time.
 
-    # Define success
-    if response is True:
-        if result.status_code == 200:
-            success = True
+    Args:
+        uri: URI for posting
+        items: Iterable of data to post
+        config: ConfitAPIClient object
+        server: Posting to a server if True, API if False
+        compress: Stream the data gzip compressed if True
 
-            # Log
-            log_message = "Successfully posted data to {}.".format(url)
-            log.log2info(1037, log_message)
-        else:
-            # Log
-            log_message = "Error {} for post to {}.".format(
-                result.status_code, url
-            )
-            log.log2info(1039, log_message)
+    Returns:
+        data: Post named tuple
 
-    # Return
-    data = Post(success=success, response=result)
-    return data
+    """
+    # Initialize key variables
+    url, auth = _target(uri, config, server)
+    headers = {"Content-Type": "application/x-ndjson"}
+    if bool(compress) is True:
+        headers["Content-Encoding"] = "gzip"
+
+    # Post
+    result = _send(
+        url,
+        auth,
+        data=_encoded(items, compress=bool(compress), delimiter="\n"),
+        headers=headers,
+    )
+    return result
 
 
 def get(uri, config, server=True, die=True):
@@ -238,6 +252,198 @@ def _get(url, config, die=True, query=None, stream=False):
     return response
 
 
+def _session():
+    """Get the requests session of the current process and thread.
+
+    Args:
+        None
+
+    Returns:
+        session: requests.Session object
+
+    """
+    # Initialize key variables
+    key = (os.getpid(), threading.get_ident())
+
+    # Create a session
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        _SESSIONS[key] = session
+
+    # Return
+    return session
+
+
+def _target(uri, config, server):
+    """Get the URL and credentials for posting.
+
+    Args:
+        uri: URI for posting
+        config: ConfitAPIClient object
+        server: Posting to a server if True, API if False
+
+    Returns:
+        result: Tuple of (URL, requests auth tuple or None)
+
+    """
+    # Get the credentials
+    username = config.server_username()
+    password = config.server_password()
+    if bool(username) is False or bool(password) is False:
+        auth = None
+    else:
+        auth = (username, password)
+
+    # Create the URL for posting
+    if bool(server) is True:
+        url_root = config.server_url_root()
+    else:
+        url_root = config.api_url_root()
+    url = _clean_url("{}/{}/{}".format(url_root, API_PREFIX, uri))
+
+    # Return
+    result = (url, auth)
+    return result
+
+
+def _send(url, auth, data=None, document=None, params=None, headers=None):
+    """Post data with the session of the current process and thread.
+
+    Args:
+        url: URL for posting
+        auth: Requests auth tuple, None if not required
+        data: Bytes or iterable of bytes to post
+        document: Data to post as JSON if data is None
+        params: Dict of query string parameters
+        headers: Dict of HTTP headers
+
+    Returns:
+        data: Post named tuple, ExceptionWrapper object on errors
+
+    """
+    # Initialize key variables
+    success = False
+    response = False
+    Post = namedtuple("Post", "success response")
+
+    # Log
+    log_message = "Attempting to post data to {}.".format(url)
+    log.log2info(1583, log_message)
+
+    # Post data save to cache if this fails
+    try:
+        result = _session().post(
+            url,
+            data=data,
+            json=document,
+            params=params,
+            headers=headers,
+            auth=auth,
+        )
+        response = True
+    except Exception as error:
+        log_message = "Error posting to {}".format(url)
+        log.log2warning(1537, log_message)
+        log.log2exception(1641, sys.exc_info())
+        return ExceptionWrapper(error)
+    except:
+        log_message = "Failed to post data to API server URL {}.".format(url)
+        log.log2info(1038, log_message)
+
+    # Define success
+    if response is True:
+        if result.status_code == 200:
+            success = True
+
+            # Log
+            log_message = "Successfully posted data to {}.".format(url)
+            log.log2info(1037, log_message)
+        else:
+            # Log
+            log_message = "Error {} for post to {}.".format(
+                result.status_code, url
+            )
+            log.log2info(1039, log_message)
+
+    # Return
+    data = Post(success=success, response=result)
+    return data
+
+
+def _rejected(result):
+    """Determine whether a server rejected the compression of a post.
+
+    Args:
+        result: Post named tuple returned by _send
+
+    Returns:
+        rejected: True if the server doesn't accept the Content-Encoding
+
+    """
+    # Initialize key variables
+    rejected = False
+
+    # Failed connections don't have responses
+    if isinstance(result, ExceptionWrapper) is True:
+        return rejected
+    status = getattr(result.response, "status_code", None)
+
+    # HTTP 415 is the status for an unsupported Content-Encoding. HTTP 400
+    # is only treated as a rejection if it is about the encoding.
+    if status == 415:
+        rejected = True
+    elif status == 400:
+        text = str(getattr(result.response, "text", "")).lower()
+        rejected = any(_ in text for _ in ["encoding", "gzip", "compress"])
+
+    # Return
+    return rejected
+
+
+def _encoded(items, compress=False, delimiter=""):
+    """Encode documents as JSON a chunk at a time.
+
+    The complete JSON documents are never held in memory.
+
+    Args:
+        items: Iterable of documents to encode
+        compress: Gzip compress the JSON if True
+        delimiter: String appended to each document
+
+    Returns:
+        result: Yield encoded bytes
+    """
+    # Initialize key variables
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    chunks = []
+    size = 0
+    if bool(compress) is True:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    else:
+        compressor = None
+
+    # Encode
+    for item in items:
+        for chunk in itertools.chain(encoder.iterencode(item), [delimiter]):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _CHUNK_SIZE:
+                result = "".join(chunks).encode()
+                chunks = []
+                size = 0
+                if compressor is not None:
+                    result = compressor.compress(result)
+                if bool(result) is True:
+                    yield result
+
+    # Encode the remaining data
+    result = "".join(chunks).encode()
+    if compressor is not None:
+        result = compressor.compress(result) + compressor.flush()
+    yield result
+
+
 def _clean_url(url):
     """Remove excess / from url.
 
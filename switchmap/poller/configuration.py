@@ -2,6 +2,7 @@
 
 from switchmap.core.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import general
 from switchmap.poller import ZONE, SNMP
 
 
@@ -36,6 +37,97 @@ class ConfigPoller(ConfigAPIClient):
             )
             log.log2die_safe(1007, log_message)
 
+    def bulkwalk_adaptive(self):
+        """Get bulkwalk_adaptive.
+
+        Args:
+            None
+
+        Returns:
+            result: True if max_repetitions is tuned per device
+
+        """
+        # Get result
+        result = general.make_bool(
+            self._config_poller.get("bulkwalk_adaptive", False)
+        )
+        return result
+
+    def bulkwalk_max_pdu_size(self):
+        """Get bulkwalk_max_pdu_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum estimated size in bytes of bulkwalk responses
+                when max_repetitions is tuned per device
+
+        """
+        # Get result
+        result = max(
+            484, int(self._config_poller.get("bulkwalk_max_pdu_size", 16384))
+        )
+        return result
+
+    def bulkwalk_max_repetitions(self):
+        """Get bulkwalk_max_repetitions.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of rows requested per bulkwalk PDU. This is the
+                starting value if max_repetitions is tuned per device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("bulkwalk_max_repetitions", 25))
+        )
+        return result
+
+    def capability_cache_ttl(self):
+        """Get capability_cache_ttl.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of seconds MIB support probes are cached for a
+                device. Caching is disabled if 0
+
+        """
+        # Get result
+        result = max(
+            0, int(self._config_poller.get("capability_cache_ttl", 86400))
+        )
+        return result
+
+    def host_polling_intervals(self):
+        """Get host_polling_intervals.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of polling intervals in seconds keyed by hostname
+
+        """
+        # Initialize key variables
+        result = {}
+        candidates = self._config_poller.get("host_polling_intervals", {})
+
+        # Get result
+        if isinstance(candidates, dict) is True:
+            for hostname, value in candidates.items():
+                interval = _interval(value)
+                if interval is not None:
+                    result[hostname] = interval
+
+        # Return
+        return result
+
     def hostnames(self):
         """Get hostnames.
 
@@ -72,6 +164,214 @@ class ConfigPoller(ConfigAPIClient):
         result = self._config_poller.get("polling_interval", 86400)
         return result
 
+    def polling_concurrency(self):
+        """Get polling_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices polled at the same time by
+                the asyncio polling engine
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_concurrency", 100))
+        )
+        return result
+
+    def polling_context_parallelism(self):
+        """Get polling_context_parallelism.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of per-VLAN SNMP contexts walked
+                concurrently on a device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_context_parallelism", 8))
+        )
+        return result
+
+    def polling_context_timeout(self):
+        """Get polling_context_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds allowed to walk a single
+                per-VLAN SNMP context
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_context_timeout", 300))
+        )
+        return result
+
+    def polling_device_timeout(self):
+        """Get polling_device_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds allowed to poll a device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_device_timeout", 900))
+        )
+        return result
+
+    def polling_engine(self):
+        """Get polling_engine.
+
+        Args:
+            None
+
+        Returns:
+            result: Polling engine. Either "multiprocessing" or "asyncio"
+
+        """
+        # Initialize key variables
+        engines = ["multiprocessing", "asyncio"]
+
+        # Get result
+        result = str(
+            self._config_poller.get("polling_engine", engines[0])
+        ).lower()
+        if result not in engines:
+            log_message = (
+                'Invalid polling_engine "{}" in the configuration file(s). '
+                'Using "{}".'.format(result, engines[0])
+            )
+            log.log2warning(2008, log_message)
+            result = engines[0]
+        return result
+
+    def polling_incremental(self):
+        """Get polling_incremental.
+
+        Args:
+            None
+
+        Returns:
+            result: True if layer 1 data is only polled from devices whose
+                interfaces have changed
+
+        """
+        # Get result
+        result = general.make_bool(
+            self._config_poller.get("polling_incremental", False)
+        )
+        return result
+
+    def polling_incremental_refresh(self):
+        """Get polling_incremental_refresh.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds layer 1 data is reused by
+                incremental polls
+
+        """
+        # Get result
+        result = max(
+            0,
+            int(self._config_poller.get("polling_incremental_refresh", 86400)),
+        )
+        return result
+
+    def polling_query_parallelism(self):
+        """Get polling_query_parallelism.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of MIB queries run concurrently against
+                a single device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_query_parallelism", 1))
+        )
+        return result
+
+    def server_batch_interval(self):
+        """Get server_batch_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds device data waits to be posted
+                in a batch
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("server_batch_interval", 10))
+        )
+        return result
+
+    def server_batch_size(self):
+        """Get server_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of devices posted to the server in each request
+
+        """
+        # Get result
+        result = max(1, int(self._config_poller.get("server_batch_size", 1)))
+        return result
+
+    def server_compression(self):
+        """Get server_compression.
+
+        Args:
+            None
+
+        Returns:
+            result: True if device data is gzip compressed when posted to
+                the server
+
+        """
+        # Get result
+        result = general.make_bool(
+            self._config_poller.get("server_compression", True)
+        )
+        return result
+
+    def spool_max_files(self):
+        """Get spool_max_files.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices whose data is spooled when it
+                can't be posted to the server. Zero disables spooling.
+
+        """
+        # Get result
+        result = max(0, int(self._config_poller.get("spool_max_files", 10000)))
+        return result
+
     def snmp_auth(self):
         """Get list of dicts of SNMP information in configuration file.
 
@@ -168,8 +468,34 @@ class ConfigPoller(ConfigAPIClient):
                         if isinstance(_zone.get("hostnames"), list)
                         else None
                     ),
+                    polling_interval=_interval(_zone.get("polling_interval")),
                 )
             )
 
         # Return
         return result
+
+
+def _interval(value):
+    """Convert a polling interval configuration value.
+
+    Args:
+        value: Configured value
+
+    Returns:
+        result: Interval in seconds, None if invalid
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Get result
+    try:
+        result = int(value)
+    except:
+        return result
+    if result < 1:
+        result = None
+
+    # Return
+    return result
@@ -5,14 +5,24 @@ Updates the database with device SNMP data.
 """
 
 # Standard libraries
-from multiprocessing import Pool
+from multiprocessing import get_context
+from multiprocessing import TimeoutError
+from multiprocessing import forkserver as _forkserver
+from multiprocessing.connection import wait
 from collections import namedtuple
 from pprint import pprint
+import asyncio
+import threading
+import math
+import time
+import sys
 import os
 
 # Import app libraries
 from switchmap import API_POLLER_POST_URI
 from switchmap.poller.snmp import poller
+from switchmap.poller import schedule
+from switchmap.poller import spool
 from switchmap.poller.update import device as udevice
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.core import log
@@ -22,6 +32,31 @@ from switchmap import AGENT_POLLER
 
 _META = namedtuple("_META", "zone hostname config")
 
+# Context used to create the sub processes that poll devices
+_CONTEXT = get_context()
+
+
+def forkserver():
+    """Create the sub processes that poll devices from a server process.
+
+    The server process must be started before the poller starts any
+    threads, so that the sub processes don't inherit locks held by them.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    global _CONTEXT
+
+    # Start the server with the polling libraries already imported
+    _CONTEXT = get_context("forkserver")
+    _CONTEXT.set_forkserver_preload([__name__])
+    _forkserver.ensure_running()
+
 
 def devices(multiprocessing=False):
     """Poll all devices for data using subprocesses and create YAML files.
@@ -39,9 +74,6 @@ def devices(multiprocessing=False):
     # Get configuration
     config = ConfigPoller()
 
-    # Get the number of threads to use in the pool
-    pool_size = config.agent_subprocesses()
-
     # Create a list of polling objects
     zones = sorted(config.zones())
 
@@ -52,16 +84,546 @@ def devices(multiprocessing=False):
             for _ in zone.hostnames
         )
 
+    # Process the data
+    _devices(arguments, config, multiprocessing=multiprocessing)
+
+
+def _devices(arguments, config, multiprocessing=False):
+    """Poll devices using the configured polling engine.
+
+    Args:
+        arguments: List of _META objects
+        config: ConfigPoller object
+        multiprocessing: Run multiprocessing when True
+
+    Returns:
+        timed_out: List of hostnames whose polls exceeded the deadline
+
+    """
+    # Initialize key variables
+    timed_out = []
+
+    # Get the number of threads to use in the pool
+    pool_size = config.agent_subprocesses()
+
     # Process the data
     if bool(multiprocessing) is False:
         for argument in arguments:
             device(argument)
 
+    elif config.polling_engine() == "asyncio":
+        # Keep many devices in flight from a handful of processes
+        timed_out = _devices_asyncio(
+            arguments,
+            pool_size,
+            config.polling_concurrency(),
+            config.polling_device_timeout(),
+        )
+
+    else:
+        # Poll each device in a sub process, killing those that hang
+        timed_out = _devices_multiprocessing(
+            arguments, pool_size, config.polling_device_timeout()
+        )
+
+    # Summarize
+    if bool(timed_out) is True:
+        log_message = "Devices that timed out during the poll: {}".format(
+            ", ".join(str(_) for _ in timed_out)
+        )
+        log.log2warning(2022, log_message)
+
+    # Return
+    return timed_out
+
+
+def _devices_multiprocessing(arguments, processes, timeout):
+    """Poll devices in sub processes with a per device deadline.
+
+    At most "processes" devices are polled at the same time. Sub processes
+    exceeding the deadline are killed and replaced so that the remaining
+    devices can be polled.
+
+    Args:
+        arguments: List of _META objects
+        processes: Maximum number of sub processes to run at the same time
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        timed_out: List of hostnames whose polls exceeded the deadline
+
+    """
+    # Initialize key variables
+    pending = list(arguments)
+    running = {}
+    timed_out = []
+    processes = max(1, processes)
+
+    while bool(pending) or bool(running):
+        # Start polling devices while there are free sub processes
+        while bool(pending) and len(running) < processes:
+            argument = pending.pop(0)
+            running[_start(argument)] = (argument, time.time())
+
+        # Wait for a sub process to complete
+        wait([_.sentinel for _ in running], timeout=1)
+
+        # Reap completed sub processes and kill those that are too slow
+        for argument, expired in _reap(running, timeout):
+            if expired is True:
+                timed_out.append(argument.hostname)
+
+    # Return
+    return timed_out
+
+
+def _start(argument):
+    """Poll a device in a new sub process.
+
+    Args:
+        argument: _META object
+
+    Returns:
+        process: multiprocessing Process object
+
+    """
+    # Start
+    process = _CONTEXT.Process(target=device, args=(argument,))
+    process.start()
+    return process
+
+
+def _reap(running, timeout):
+    """Reap completed sub processes and kill those exceeding the deadline.
+
+    Args:
+        running: Dict of (_META, start timestamp) tuples keyed by the
+            multiprocessing Process polling the device. Reaped sub
+            processes are removed
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        result: List of (_META, expired) tuples of the reaped sub
+            processes. expired is True if the sub process was killed
+
+    """
+    # Initialize key variables
+    result = []
+    now = time.time()
+
+    # Reap
+    for process, (argument, started) in list(running.items()):
+        expired = False
+        if process.is_alive() is True:
+            if now - started <= timeout:
+                continue
+            _kill(process)
+            expired = True
+            log_message = (
+                'Poll of device {} in zone "{}" exceeded the {}s '
+                "deadline. Sub process killed".format(
+                    argument.hostname, argument.zone, timeout
+                )
+            )
+            log.log2warning(2021, log_message)
+        process.join()
+        del running[process]
+        result.append((argument, expired))
+
+    # Return
+    return result
+
+
+def _kill(process):
+    """Kill a sub process.
+
+    Args:
+        process: multiprocessing Process object
+
+    Returns:
+        None
+
+    """
+    # Ask nicely first
+    process.terminate()
+    process.join(5)
+
+    # Force the sub process to stop
+    if process.is_alive() is True:
+        process.kill()
+        process.join()
+
+
+def scheduled(config):
+    """Determine whether devices are polled at their own intervals.
+
+    Args:
+        config: ConfigPoller object
+
+    Returns:
+        result: True if a zone or host has its own polling interval
+
+    """
+    # Return
+    result = bool(config.host_polling_intervals()) or any(
+        _.polling_interval is not None for _ in config.zones()
+    )
+    return result
+
+
+def scheduler(config, result=None):
+    """Create a schedule for polling devices at their own intervals.
+
+    Args:
+        config: ConfigPoller object
+        result: schedule.Schedule object to update with the devices of the
+            configuration. Devices no longer in the configuration are
+            removed. A new schedule is created if None
+
+    Returns:
+        result: schedule.Schedule object
+
+    """
+    # Initialize key variables
+    default = config.polling_interval()
+    hosts = config.host_polling_intervals()
+    zones = sorted(config.zones())
+    keys = set()
+
+    # Schedule each device
+    if result is None:
+        result = schedule.Schedule()
+    for zone in zones:
+        for hostname in zone.hostnames or []:
+            interval = hosts.get(hostname, zone.polling_interval or default)
+            keys.add((zone.name, hostname))
+            result.add(
+                (zone.name, hostname),
+                _META(zone=zone.name, hostname=hostname, config=config),
+                interval,
+            )
+
+    # Stop polling devices removed from the configuration
+    for key in result.keys():
+        if key not in keys:
+            result.remove(key)
+
+    # Return
+    return result
+
+
+class Dispatcher:
+    """Poll the devices that are due in a schedule without waiting for them.
+
+    Each device is polled in its own sub process, which is killed if it
+    exceeds the deadline. Devices stay busy in the schedule until their
+    sub process ends, so devices whose previous poll is still queued or
+    running are skipped when they are next due.
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.schedule = schedule.Schedule()
+        self._pending = []
+        self._running = {}
+
+    def poll(self, config):
+        """Start polling the devices that are due.
+
+        Call reap() first to free the sub processes of completed polls. At
+        most agent_subprocesses devices are polled at the same time, or
+        polling_concurrency devices with the asyncio polling engine. One
+        device is polled at a time if multiprocessing is disabled.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            result: Number of devices whose polls were started
+
+        """
+        # Initialize key variables
+        result = 0
+        if config.multiprocessing() is False:
+            limit = 1
+        elif config.polling_engine() == "asyncio":
+            limit = config.polling_concurrency()
+        else:
+            limit = config.agent_subprocesses()
+
+        # Queue the devices that are due, dropping those no longer scheduled
+        self._pending.extend(self.schedule.due())
+        keys = set(self.schedule.keys())
+        self._pending = [_ for _ in self._pending if _[0] in keys]
+
+        # Start polling devices while there are free sub processes
+        while bool(self._pending) and len(self._running) < max(1, limit):
+            _, argument = self._pending.pop(0)
+            self._running[_start(argument)] = (argument, time.time())
+            result += 1
+
+        # Return
+        return result
+
+    def reap(self, timeout):
+        """Mark the devices whose polls have ended as done.
+
+        Args:
+            timeout: Maximum number of seconds allowed to poll a device
+
+        Returns:
+            timed_out: List of hostnames whose polls exceeded the deadline
+
+        """
+        # Initialize key variables
+        timed_out = []
+
+        # Reap. The schedule's key of a device is its zone and hostname
+        for argument, expired in _reap(self._running, timeout):
+            self.schedule.done((argument.zone, argument.hostname))
+            if expired is True:
+                timed_out.append(argument.hostname)
+
+        # Return
+        return timed_out
+
+    def busy(self):
+        """Get the number of devices queued or being polled.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of devices
+
+        """
+        # Return
+        result = len(self._pending) + len(self._running)
+        return result
+
+
+def _devices_asyncio(arguments, processes, concurrency, timeout):
+    """Poll devices using the asyncio polling engine.
+
+    The devices are split evenly across the processes. Each process runs an
+    event loop that polls its share of the devices concurrently. Polls that
+    exceed the deadline can't be stopped, so the event loops always run in
+    sub processes that are terminated once all the devices are done. Sub
+    processes still running after the deadline of all their devices are
+    killed.
+
+    Args:
+        arguments: List of _META objects
+        processes: Number of processes to use
+        concurrency: Maximum number of devices polled at the same time
+            across all processes
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        timed_out: List of hostnames whose polls exceeded the deadline
+
+    """
+    # Initialize key variables
+    timed_out = []
+
+    # Do nothing if there is nothing to poll
+    if bool(arguments) is False:
+        return timed_out
+
+    # Split the global concurrency limit across the processes
+    processes = max(1, min(processes, len(arguments)))
+    limit = max(1, concurrency // processes)
+    chunks = [arguments[offset::processes] for offset in range(processes)]
+
+    # Allow each sub process to poll its devices one group at a time
+    deadline = time.time() + timeout * (
+        math.ceil(max(len(_) for _ in chunks) / limit) + 1
+    )
+
+    # Process the data. Leaving the pool terminates its sub processes
+    with _CONTEXT.Pool(processes=processes) as pool:
+        results = [
+            (chunk, pool.apply_async(_poll_asyncio, (chunk, limit, timeout)))
+            for chunk in chunks
+        ]
+        for chunk, result in results:
+            try:
+                timed_out.extend(result.get(max(0, deadline - time.time())))
+            except TimeoutError:
+                hostnames = [_.hostname for _ in chunk]
+                timed_out.extend(hostnames)
+                log_message = (
+                    "Polling process for devices {} exceeded its deadline. "
+                    "Sub process killed".format(
+                        ", ".join(str(_) for _ in hostnames)
+                    )
+                )
+                log.log2warning(2077, log_message)
+
+    # Return
+    return timed_out
+
+
+def _poll_asyncio(arguments, concurrency, timeout):
+    """Run an event loop to poll a list of devices.
+
+    Args:
+        arguments: List of _META objects
+        concurrency: Maximum number of devices polled at the same time
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        timed_out: List of hostnames whose polls exceeded the deadline
+
+    """
+    # Poll
+    timed_out = asyncio.run(_async_devices(arguments, concurrency, timeout))
+    return timed_out
+
+
+async def _async_devices(arguments, concurrency, timeout):
+    """Poll a list of devices concurrently.
+
+    Args:
+        arguments: List of _META objects
+        concurrency: Maximum number of devices polled at the same time
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        timed_out: List of hostnames whose polls exceeded the deadline
+
+    """
+    # Initialize key variables
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Poll
+    results = await asyncio.gather(
+        *[_async_device(argument, semaphore, timeout) for argument in arguments]
+    )
+
+    # Return
+    timed_out = [
+        argument.hostname
+        for argument, result in zip(arguments, results)
+        if result is False
+    ]
+    return timed_out
+
+
+async def _async_device(poll, semaphore, timeout):
+    """Poll a single device within the concurrency limit and deadline.
+
+    Each device is polled in its own thread, started once the device is
+    within the concurrency limit, so the deadline only covers the poll.
+    Threads can't be stopped, so those that exceed the deadline are
+    abandoned without holding up other devices or the process' exit.
+
+    Args:
+        poll: _META object
+        semaphore: asyncio.Semaphore limiting concurrency
+        timeout: Maximum number of seconds allowed to poll a device
+
+    Returns:
+        result: False if the poll exceeded the deadline
+
+    """
+    # Initialize key variables
+    result = True
+
+    async with semaphore:
+        try:
+            await asyncio.wait_for(_thread(device, poll), timeout)
+        except asyncio.TimeoutError:
+            result = False
+            log_message = (
+                'Polling of device {} in zone "{}" exceeded the {}s deadline. '
+                "Skipping.".format(poll.hostname, poll.zone, timeout)
+            )
+            log.log2warning(2009, log_message)
+        except Exception:
+            log_message = 'Polling of device {} in zone "{}" failed.'.format(
+                poll.hostname, poll.zone
+            )
+            log.log2warning(2010, log_message)
+            log.log2exception(2066, sys.exc_info())
+
+    # Return
+    return result
+
+
+def _thread(function, argument):
+    """Run a blocking function in a new daemon thread.
+
+    Args:
+        function: Function to run
+        argument: Argument of the function
+
+    Returns:
+        future: asyncio.Future with the function's result
+
+    """
+    # Initialize key variables
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _run():
+        """Run the function and pass its result to the event loop.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Run
+        try:
+            result = function(argument)
+        except Exception as error:
+            callback = (_set_future, future, None, error)
+        else:
+            callback = (_set_future, future, result, None)
+
+        # The loop has stopped if the deadline was exceeded
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass
+
+    # Run
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
+def _set_future(future, result, error):
+    """Set the outcome of a future that may have been cancelled.
+
+    Args:
+        future: asyncio.Future object
+        result: Result to set
+        error: Exception to set instead of the result if not None
+
+    Returns:
+        None
+
+    """
+    # Cancelled futures can't be updated
+    if future.done() is True:
+        return
+    if error is not None:
+        future.set_exception(error)
     else:
-        # Create a multiprocessing pool of sub process resources
-        with Pool(processes=pool_size) as pool:
-            # Create sub processes from the pool
-            pool.map(device, arguments)
+        future.set_result(result)
 
 
 def device(poll, post=True):
@@ -105,9 +667,28 @@ shutdown request was probably requested""".format(
                     data = _device.process()
                     data["misc"]["zone"] = zone
 
-                    if bool(post) is True:
+                    if bool(post) is True and spool.batching(config):
+                        # The poller daemon posts the data in batches
+                        spool.Spool(config).add(data)
+                    elif bool(post) is True:
                         # Update the database tables with polled data
-                        rest.post(API_POLLER_POST_URI, data, config)
+                        response = rest.post(
+                            API_POLLER_POST_URI,
+                            data,
+                            config,
+                            compress=config.server_compression(),
+                            params={
+                                "host": data["misc"]["host"],
+                                "zone": zone,
+                            },
+                        )
+
+                        # Spool the data if the server can't accept it.
+                        # Older spooled data is superseded otherwise
+                        if spool.retry(response) is True:
+                            spool.Spool(config).add(data)
+                        else:
+                            spool.Spool(config).discard(data)
                     else:
                         pprint(data)
                 else:
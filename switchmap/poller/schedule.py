@@ -0,0 +1,197 @@
+"""Switchmap-NG device polling schedule."""
+
+import threading
+import time
+import zlib
+
+# Import app libraries
+from switchmap.core import log
+
+
+class Schedule:
+    """Track when each device is next due to be polled.
+
+    Each device has its own polling interval. Start times are spread
+    across the interval using a stable hash of the device key so that
+    devices sharing an interval aren't all polled at the same time.
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, item, interval, now=None):
+        """Add a device to the schedule.
+
+        Devices that are already scheduled at the same interval keep their
+        next due time, only their item is replaced.
+
+        Args:
+            key: Unique key for the device
+            item: Object returned by due() when the device is due
+            interval: Polling interval in seconds
+            now: Current timestamp
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        interval = max(1, int(interval))
+
+        # Place the start time in the device's slot of the interval
+        offset = zlib.crc32(str(key).encode()) % interval
+        due = now - (now % interval) + offset
+        if due < now:
+            due += interval
+
+        # Add the job
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job["interval"] == interval:
+                job["item"] = item
+                return
+            self._jobs[key] = {
+                "item": item,
+                "interval": interval,
+                "due": due,
+                "busy": False,
+            }
+
+    def due(self, now=None):
+        """Get the devices that are due to be polled.
+
+        Devices are marked as busy until done() is called. Devices whose
+        previous poll is still in flight are skipped until their next slot.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            result: List of (key, item) tuples
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        result = []
+
+        with self._lock:
+            for key, job in sorted(
+                self._jobs.items(), key=lambda _: _[1]["due"]
+            ):
+                if job["due"] > now:
+                    continue
+
+                # Advance to the next slot, skipping any missed ones
+                while job["due"] <= now:
+                    job["due"] += job["interval"]
+
+                # Skip devices that are still being polled
+                if job["busy"] is True:
+                    log_message = (
+                        "Previous poll of {} still in progress. Skipping "
+                        "until the next polling interval".format(key)
+                    )
+                    log.log2info(2019, log_message)
+                    continue
+
+                job["busy"] = True
+                result.append((key, job["item"]))
+
+        # Return
+        return result
+
+    def remove(self, key):
+        """Remove a device from the schedule.
+
+        Args:
+            key: Unique key for the device
+
+        Returns:
+            None
+
+        """
+        # Update
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def keys(self):
+        """Get the keys of the scheduled devices.
+
+        Args:
+            None
+
+        Returns:
+            result: List of keys
+
+        """
+        # Return
+        with self._lock:
+            result = list(self._jobs)
+        return result
+
+    def done(self, key):
+        """Mark the poll of a device as complete.
+
+        Args:
+            key: Unique key for the device
+
+        Returns:
+            None
+
+        """
+        # Update
+        with self._lock:
+            if key in self._jobs:
+                self._jobs[key]["busy"] = False
+
+    def busy(self):
+        """Get the number of devices being polled.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of devices
+
+        """
+        # Return
+        with self._lock:
+            result = len([_ for _ in self._jobs.values() if _["busy"]])
+        return result
+
+    def wait(self, now=None):
+        """Get the number of seconds until the next device is due.
+
+        Args:
+            now: Current timestamp
+
+        Returns:
+            result: Number of seconds, None if nothing is scheduled
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        result = None
+
+        # Get result
+        with self._lock:
+            if bool(self._jobs) is True:
+                result = max(
+                    0, min(_["due"] for _ in self._jobs.values()) - now
+                )
+
+        # Return
+        return result
@@ -0,0 +1,193 @@
+"""Persistent cache of the MIBs supported by a device."""
+
+import os
+import time
+
+# PIP imports
+import yaml
+
+# Import project libraries
+from switchmap.core import files
+from switchmap.core import log
+
+# Maximum difference in seconds between boot times calculated from
+# sysUpTime before a device is considered to have rebooted
+_BOOT_TOLERANCE = 600
+
+
+class Capabilities:
+    """Cache the results of MIB support probes for a device.
+
+    The cache remains valid while the device keeps the same sysObjectID,
+    doesn't reboot, and the cache is younger than the configured TTL.
+
+    """
+
+    def __init__(self, hostname, config):
+        """Initialize the class.
+
+        Args:
+            hostname: Hostname of the device
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._ttl = config.capability_cache_ttl()
+        self._filename = files.capability_file(hostname, config)
+        self._oids = {}
+        self._metadata = {}
+        self._valid = False
+        self._dirty = False
+
+    def enabled(self):
+        """Determine whether the cache is enabled.
+
+        Args:
+            None
+
+        Returns:
+            result: True if enabled
+
+        """
+        # Return
+        result = bool(self._ttl)
+        return result
+
+    def validate(self, sysobjectid, sysuptime):
+        """Load the cache and discard it if it's stale.
+
+        Args:
+            sysobjectid: Current sysObjectID of the device
+            sysuptime: Current sysUpTime of the device in hundredths of a
+                second
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = int(time.time())
+        boottime = None if sysuptime is None else now - int(sysuptime) // 100
+
+        # Read the cache
+        data = {}
+        if os.path.isfile(self._filename) is True:
+            data = files.read_yaml_file(self._filename, die=False)
+
+        # Evaluate the cache
+        self._valid = _fresh(data, sysobjectid, boottime, now, self._ttl)
+        if self._valid is True:
+            self._oids = data.get("oids", {})
+            self._metadata = {
+                key: data.get(key)
+                for key in ["sysobjectid", "boottime", "timestamp"]
+            }
+        else:
+            self._oids = {}
+            self._metadata = {
+                "sysobjectid": sysobjectid,
+                "boottime": boottime,
+                "timestamp": now,
+            }
+            self._dirty = True
+            log_message = (
+                "MIB capability cache for host {} is stale or absent. "
+                "Reprobing".format(self._hostname)
+            )
+            log.log2debug(2011, log_message)
+
+    def get(self, oid):
+        """Get the cached support status of an OID.
+
+        Args:
+            oid: OID to check
+
+        Returns:
+            result: True / False if cached, None otherwise
+
+        """
+        # Return
+        result = self._oids.get(oid)
+        return result
+
+    def set(self, oid, supported):
+        """Record the support status of an OID.
+
+        Args:
+            oid: OID checked
+            supported: True if supported
+
+        Returns:
+            None
+
+        """
+        # Update
+        self._oids[oid] = bool(supported)
+        self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if it has changed.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Do nothing if unchanged
+        if self._dirty is False or self.enabled() is False:
+            return
+
+        # Write atomically so that concurrent readers never see a partial file
+        data = dict(self._metadata)
+        data["oids"] = self._oids
+        tmp_filename = "{}.tmp".format(self._filename)
+        try:
+            with open(tmp_filename, "w") as f_handle:
+                yaml.safe_dump(data, f_handle, default_flow_style=False)
+            os.replace(tmp_filename, self._filename)
+            self._dirty = False
+        except:
+            log_message = "Cannot write MIB capability cache file {}".format(
+                self._filename
+            )
+            log.log2warning(2012, log_message)
+
+
+def _fresh(data, sysobjectid, boottime, now, ttl):
+    """Determine whether cached capability data can be used.
+
+    Args:
+        data: Dict of cached data
+        sysobjectid: Current sysObjectID of the device
+        boottime: Current boot time of the device calculated from sysUpTime
+        now: Current timestamp
+        ttl: Cache time to live in seconds
+
+    Returns:
+        result: True if the cache can be used
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Evaluate
+    if bool(data) and bool(sysobjectid) and boottime is not None:
+        if (
+            data.get("sysobjectid") == sysobjectid
+            and isinstance(data.get("boottime"), int)
+            and isinstance(data.get("timestamp"), int)
+            and isinstance(data.get("oids"), dict)
+        ):
+            result = bool(
+                abs(data["boottime"] - boottime) <= _BOOT_TOLERANCE
+                and now - data["timestamp"] < ttl
+            )
+
+    # Return
+    return result
@@ -0,0 +1,318 @@
+"""Store of the SNMP credentials that work, or failed, for each device."""
+
+import os
+import time
+import sqlite3
+from contextlib import closing
+
+# Import project libraries
+from switchmap.core import files
+from switchmap.core import log
+
+# Seconds before a failed SNMP group is retried. The delay doubles after
+# each consecutive failure up to the maximum
+_BACKOFF = 300
+_BACKOFF_MAXIMUM = 21600
+
+_SCHEMA = [
+    """\
+CREATE TABLE IF NOT EXISTS credentials (
+    hostname TEXT PRIMARY KEY,
+    snmp_group TEXT NOT NULL,
+    last_success INTEGER NOT NULL
+)""",
+    """\
+CREATE TABLE IF NOT EXISTS failures (
+    hostname TEXT NOT NULL,
+    snmp_group TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    retry INTEGER NOT NULL,
+    PRIMARY KEY (hostname, snmp_group)
+)""",
+]
+
+
+class Store:
+    """Single SQLite store of SNMP credentials shared by all pollers.
+
+    The store records the SNMP group that last worked for each device with
+    the time it last worked, and the groups that failed for each device.
+    Failed groups aren't probed again until their backoff expires.
+
+    """
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._filename = files.credentials_file(config)
+
+    def group(self, hostname):
+        """Get the SNMP group that last worked for a device.
+
+        Args:
+            hostname: Hostname of the device
+
+        Returns:
+            result: SNMP group name, None if unknown
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Get result
+        rows = self._query(
+            "SELECT snmp_group FROM credentials WHERE hostname = ?",
+            (hostname,),
+        )
+        if bool(rows) is True:
+            result = rows[0][0]
+        else:
+            result = self._migrate(hostname)
+
+        # Return
+        return result
+
+    def last_success(self, hostname):
+        """Get the time the SNMP group of a device last worked.
+
+        Args:
+            hostname: Hostname of the device
+
+        Returns:
+            result: Timestamp, None if unknown
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Get result
+        rows = self._query(
+            "SELECT last_success FROM credentials WHERE hostname = ?",
+            (hostname,),
+        )
+        if bool(rows) is True:
+            result = rows[0][0]
+
+        # Return
+        return result
+
+    def succeeded(self, hostname, group, now=None):
+        """Record the SNMP group that worked for a device.
+
+        Args:
+            hostname: Hostname of the device
+            group: SNMP group name
+            now: Current timestamp
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = int(time.time() if now is None else now)
+
+        # Update
+        self._update(
+            [
+                (
+                    """\
+INSERT INTO credentials (hostname, snmp_group, last_success)
+VALUES (?, ?, ?)
+ON CONFLICT (hostname) DO UPDATE SET
+snmp_group = excluded.snmp_group, last_success = excluded.last_success""",
+                    (hostname, str(group), now),
+                ),
+                (
+                    "DELETE FROM failures WHERE hostname = ? "
+                    "AND snmp_group = ?",
+                    (hostname, str(group)),
+                ),
+            ]
+        )
+
+    def failed(self, hostname, group, now=None):
+        """Record an SNMP group that failed for a device.
+
+        Args:
+            hostname: Hostname of the device
+            group: SNMP group name
+            now: Current timestamp
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        now = int(time.time() if now is None else now)
+        count = 1
+
+        # Get the number of consecutive failures
+        rows = self._query(
+            "SELECT count FROM failures WHERE hostname = ? "
+            "AND snmp_group = ?",
+            (hostname, str(group)),
+        )
+        if bool(rows) is True:
+            count = rows[0][0] + 1
+        backoff = min(_BACKOFF * 2 ** (count - 1), _BACKOFF_MAXIMUM)
+
+        # Update
+        self._update(
+            [
+                (
+                    """\
+INSERT INTO failures (hostname, snmp_group, count, retry)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (hostname, snmp_group) DO UPDATE SET
+count = excluded.count, retry = excluded.retry""",
+                    (hostname, str(group), count, now + backoff),
+                )
+            ]
+        )
+
+    def retry(self, hostname, group, now=None):
+        """Determine whether an SNMP group can be probed for a device.
+
+        Args:
+            hostname: Hostname of the device
+            group: SNMP group name
+            now: Current timestamp
+
+        Returns:
+            result: True if the group's backoff has expired
+
+        """
+        # Initialize key variables
+        now = time.time() if now is None else now
+        result = True
+
+        # Get result
+        rows = self._query(
+            "SELECT retry FROM failures WHERE hostname = ? "
+            "AND snmp_group = ?",
+            (hostname, str(group)),
+        )
+        if bool(rows) is True:
+            result = bool(now >= rows[0][0])
+
+        # Return
+        return result
+
+    def _migrate(self, hostname):
+        """Import the group of a device from its legacy cache file.
+
+        Args:
+            hostname: Hostname of the device
+
+        Returns:
+            group: SNMP group name, None if there is no legacy file
+
+        """
+        # Initialize key variables
+        group = None
+        filename = files.snmp_file(hostname, self._config)
+
+        # Read the legacy file
+        if os.path.isfile(filename) is False:
+            return group
+        with open(filename) as f_handle:
+            group = f_handle.readline()
+
+        # Import
+        if bool(group) is True:
+            self.succeeded(hostname, group)
+        else:
+            group = None
+        os.remove(filename)
+
+        # Return
+        return group
+
+    def _query(self, sql, parameters):
+        """Read from the store.
+
+        Args:
+            sql: SQL statement
+            parameters: Tuple of parameters
+
+        Returns:
+            rows: List of rows
+
+        """
+        # Initialize key variables
+        rows = []
+
+        # Read
+        try:
+            with closing(_connect(self._filename)) as connection:
+                rows = connection.execute(sql, parameters).fetchall()
+        except sqlite3.Error as exception_error:
+            log_message = "Cannot read SNMP credential store {}: {}".format(
+                self._filename, exception_error
+            )
+            log.log2warning(2025, log_message)
+
+        # Return
+        return rows
+
+    def _update(self, statements):
+        """Update the store in a single transaction.
+
+        Args:
+            statements: List of (SQL statement, parameters) tuples
+
+        Returns:
+            None
+
+        """
+        # Update
+        try:
+            with closing(_connect(self._filename)) as connection:
+                with connection:
+                    for sql, parameters in statements:
+                        connection.execute(sql, parameters)
+        except sqlite3.Error as exception_error:
+            log_message = "Cannot update SNMP credential store {}: {}".format(
+                self._filename, exception_error
+            )
+            log.log2warning(2023, log_message)
+
+
+def _connect(filename):
+    """Connect to the store.
+
+    Each operation on the store uses its own connection, which the caller
+    must close. SQLite connections can't be shared between threads or
+    inherited by forked sub processes.
+
+    Args:
+        filename: Name of the store's database file
+
+    Returns:
+        connection: sqlite3 Connection object
+
+    """
+    # Wait for other pollers to complete their updates
+    connection = sqlite3.connect(filename, timeout=30)
+
+    # Create the store if necessary
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            for sql in _SCHEMA:
+                connection.execute(sql)
+    except:
+        connection.close()
+        raise
+
+    # Return
+    return connection
@@ -66,10 +66,8 @@ class BridgeQuery(Query):
         # Get one OID entry in MIB (dot1dBasePortIfIndex)
         test_oid = ".1.3.6.1.2.1.17.4.3.1.2"
 
-        # Determine whether LLDP is keyed on ifIndex or BasePortIndex
-        # If the ifindex method is being used, all the lldpLocPortIds
-        # will match the ifindex values
-        self._ifindex = mib_if.IfQuery(snmp_object).ifindex()
+        # IF-MIB ifIndex values. Only retrieved when needed
+        self._ifindex = None
 
         super().__init__(snmp_object, test_oid, tags=["layer1"])
 
@@ -263,10 +261,9 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        walks = self._snmp_object.context_walk(oid, context_names)
         for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+            results = walks.get(context_name, {})
             for key, value in results.items():
                 new_key = key[len(oid) :]
                 data_dict[new_key] = value
@@ -332,10 +329,9 @@ class BridgeQuery(Query):
 
         # Process values
         oid = ".1.3.6.1.2.1.17.4.3.1.1"
+        walks = self._snmp_object.context_walk(oid, context_names)
         for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+            results = walks.get(context_name, {})
             for key, mac_value in results.items():
                 # Assign the mac address to the dictionary
                 new_key = key[len(oid) :]
@@ -368,6 +364,10 @@ class BridgeQuery(Query):
             offset = int(ifindex) - bridge_index
             break
 
+        # Get the ifIndex values only if the MIB is supported
+        if self._ifindex is None:
+            self._ifindex = mib_if.IfQuery(self._snmp_object).ifindex()
+
         # Populate the dictionary keyed by dot1dBasePortIfIndex
         for ifindex, _ in sorted(self._ifindex.items()):
             bridge_index = ifindex - offset
@@ -3,6 +3,9 @@
 # Switchmap imports
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLLING_OPTIONS, SNMP, POLL
+from . import capabilities
+from . import repetitions
+from . import snapshot
 from . import snmp_info
 from . import snmp_manager
 from switchmap.core import log
@@ -53,7 +56,17 @@ class Poll:
                 POLL(
                     hostname=hostname,
                     authorization=authorization,
-                )
+                ),
+                capabilities=capabilities.Capabilities(
+                    hostname, self._server_config
+                ),
+                context_parallelism=(
+                    self._server_config.polling_context_parallelism()
+                ),
+                context_timeout=self._server_config.polling_context_timeout(),
+                repetitions=repetitions.Repetitions(
+                    hostname, self._server_config
+                ),
             )
         else:
             log_message = (
@@ -86,9 +99,19 @@ Querying topology data from host {}.""".format(
         )
         log.log2info(1078, log_message)
 
-        # Return the data polled from the device
-        status = snmp_info.Query(self._snmp_object)
-        _data = status.everything()
+        # Return the data polled from the device. Pooled SNMP sessions are
+        # torn down once the poll completes
+        with self._snmp_object:
+            status = snmp_info.Query(
+                self._snmp_object,
+                parallelism=self._server_config.polling_query_parallelism(),
+                snapshot=(
+                    snapshot.Snapshot(self._hostname, self._server_config)
+                    if self._server_config.polling_incremental() is True
+                    else None
+                ),
+            )
+            _data = status.everything()
         return _data
 
 
@@ -0,0 +1,257 @@
+"""Per device tuning of the max_repetitions of SNMP bulkwalks."""
+
+import os
+import math
+import threading
+
+# PIP imports
+import yaml
+
+# Import project libraries
+from switchmap.core import files
+from switchmap.core import log
+
+# Limits of the tuned max_repetitions value
+_MINIMUM = 5
+_MAXIMUM = 1000
+
+# Maximum seconds per response PDU before max_repetitions stops growing.
+# This is half the default easysnmp session timeout
+_LATENCY_BUDGET = 0.5
+
+# Multiplier applied to max_repetitions when growing
+_GROWTH = 1.5
+
+# Estimated BER encoding overhead in bytes per varbind
+_VARBIND_OVERHEAD = 12
+
+
+class Repetitions:
+    """Track the max_repetitions used for bulkwalks of a device.
+
+    In adaptive mode the value grows while responses are fast and remain
+    within the PDU size budget, and is halved after timeouts or tooBig
+    errors. Only tooBig errors stop the value from growing back. The
+    learned value is persisted between polls.
+
+    """
+
+    def __init__(self, hostname, config):
+        """Initialize the class.
+
+        Args:
+            hostname: Hostname of the device
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._adaptive = config.bulkwalk_adaptive()
+        self._pdu_size = config.bulkwalk_max_pdu_size()
+        self._value = config.bulkwalk_max_repetitions()
+        self._ceiling = _MAXIMUM
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._filename = None
+
+        # Read the learned value
+        if self._adaptive is True:
+            self._filename = files.repetitions_file(hostname, config)
+            self._load()
+
+    def adaptive(self):
+        """Determine whether max_repetitions is tuned for the device.
+
+        Args:
+            None
+
+        Returns:
+            result: True if adaptive
+
+        """
+        # Return
+        result = self._adaptive
+        return result
+
+    def value(self):
+        """Get the max_repetitions to use for the next bulkwalk.
+
+        Args:
+            None
+
+        Returns:
+            result: max_repetitions
+
+        """
+        # Return
+        with self._lock:
+            result = self._value
+        return result
+
+    def success(self, max_repetitions, results, elapsed):
+        """Grow max_repetitions after a successful bulkwalk if possible.
+
+        Args:
+            max_repetitions: max_repetitions used for the bulkwalk
+            results: List of easysnmp SNMPVariable results
+            elapsed: Duration of the bulkwalk in seconds
+
+        Returns:
+            None
+
+        """
+        # Nothing to learn from walks that fit in a single response
+        rows = len(results)
+        if self._adaptive is False or rows < max_repetitions:
+            return
+
+        # Calculate the response latency and estimated varbind size
+        pdus = math.ceil(rows / max_repetitions)
+        latency = elapsed / pdus
+        size = sum(_varbind_size(_) for _ in results) / rows
+
+        # Grow within the latency, size and learned limits
+        with self._lock:
+            if max_repetitions != self._value or latency >= _LATENCY_BUDGET:
+                return
+            candidate = min(
+                int(self._value * _GROWTH),
+                int(self._pdu_size // size),
+                self._ceiling - 1,
+            )
+            if candidate > self._value:
+                self._value = candidate
+                self._dirty = True
+
+    def smaller(self, max_repetitions):
+        """Get the max_repetitions to retry a bulkwalk that timed out.
+
+        Args:
+            max_repetitions: max_repetitions used for the failed bulkwalk
+
+        Returns:
+            result: Smaller max_repetitions, None if it can't be reduced
+
+        """
+        # Return
+        if self._adaptive is False or max_repetitions <= _MINIMUM:
+            return None
+        result = max(_MINIMUM, max_repetitions // 2)
+        return result
+
+    def backoff(self, max_repetitions, timeout=False):
+        """Shrink max_repetitions after a timeout or tooBig error.
+
+        Args:
+            max_repetitions: max_repetitions used for the failed bulkwalk
+            timeout: True if the bulkwalk timed out. Slow responses may be
+                temporary, so the value can grow back to the failed value
+
+        Returns:
+            result: True if the bulkwalk should be retried with the new value
+
+        """
+        # Initialize key variables
+        result = False
+        if self._adaptive is False:
+            return result
+
+        with self._lock:
+            # Another thread may have already backed off
+            if max_repetitions > self._value:
+                return True
+
+            # Halve the value. Never grow back to values that are too big
+            if self._value > _MINIMUM:
+                if timeout is False:
+                    self._ceiling = min(self._ceiling, max_repetitions)
+                self._value = max(_MINIMUM, self._value // 2)
+                self._dirty = True
+                result = True
+                log_message = (
+                    "Bulkwalk of host {} failed with max_repetitions {}. "
+                    "Retrying with {}".format(
+                        self._hostname, max_repetitions, self._value
+                    )
+                )
+                log.log2debug(2015, log_message)
+
+        # Return
+        return result
+
+    def save(self):
+        """Write the learned value to disk if it has changed.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Do nothing if unchanged
+        if self._dirty is False or self._adaptive is False:
+            return
+
+        # Write atomically so that concurrent readers never see a partial file
+        data = {"max_repetitions": self._value, "ceiling": self._ceiling}
+        tmp_filename = "{}.tmp".format(self._filename)
+        try:
+            with open(tmp_filename, "w") as f_handle:
+                yaml.safe_dump(data, f_handle, default_flow_style=False)
+            os.replace(tmp_filename, self._filename)
+            self._dirty = False
+        except:
+            log_message = "Cannot write bulkwalk tuning file {}".format(
+                self._filename
+            )
+            log.log2warning(2016, log_message)
+
+    def _load(self):
+        """Read the learned value from disk.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Read the file
+        data = {}
+        if os.path.isfile(self._filename) is True:
+            data = files.read_yaml_file(self._filename, die=False)
+        if isinstance(data, dict) is False:
+            return
+
+        # Use valid values only
+        ceiling = data.get("ceiling")
+        if isinstance(ceiling, int) and _MINIMUM < ceiling <= _MAXIMUM:
+            self._ceiling = ceiling
+        value = data.get("max_repetitions")
+        if isinstance(value, int) and _MINIMUM <= value < self._ceiling:
+            self._value = value
+        self._value = min(self._value, self._ceiling - 1)
+
+
+def _varbind_size(result):
+    """Estimate the encoded size of a varbind.
+
+    Args:
+        result: easysnmp SNMPVariable
+
+    Returns:
+        size: Estimated size in bytes
+
+    """
+    # Return
+    size = (
+        len(str(result.oid))
+        + len(str(result.oid_index))
+        + len(str(result.value))
+        + _VARBIND_OVERHEAD
+    )
+    return size
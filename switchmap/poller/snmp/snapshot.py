@@ -0,0 +1,156 @@
+"""Snapshot of the interface data of a device used for incremental polls."""
+
+import os
+import time
+
+# PIP imports
+import yaml
+
+# Import project libraries
+from switchmap.core import files
+from switchmap.core import general
+from switchmap.core import log
+
+# Version of the snapshot data. Snapshots of other versions are ignored
+_VERSION = 2
+
+
+class Snapshot:
+    """Store the layer 1 interface data of the last poll of a device.
+
+    The forwarding database and interface neighbors are not stored as they
+    change independently of the interfaces. The layer 1 interface data is
+    reused while the device keeps the same sysObjectID,
+    doesn't reboot, the ifLastChange values of all its interfaces are
+    unchanged and the snapshot is younger than the configured refresh
+    interval.
+
+    """
+
+    def __init__(self, hostname, config):
+        """Initialize the class.
+
+        Args:
+            hostname: Hostname of the device
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._refresh = config.polling_incremental_refresh()
+        self._filename = files.snapshot_file(hostname, config)
+        self._state = {}
+
+    def layer1(self, sysobjectid, sysuptime, iflastchange):
+        """Get the layer 1 data of the last poll if nothing has changed.
+
+        Args:
+            sysobjectid: Current sysObjectID of the device
+            sysuptime: Current sysUpTime of the device in hundredths of a
+                second
+            iflastchange: Dict of current ifLastChange values keyed by
+                ifIndex
+
+        Returns:
+            result: Layer 1 data if it can be reused, otherwise None
+
+        """
+        # Initialize key variables
+        result = None
+        now = int(time.time())
+        self._state = {
+            "version": _VERSION,
+            "sysobjectid": sysobjectid,
+            "sysuptime": sysuptime,
+            "iflastchange": dict(iflastchange),
+            "timestamp": now,
+        }
+
+        # Read the snapshot
+        data = {}
+        if os.path.isfile(self._filename) is True:
+            data = files.read_yaml_file(self._filename, die=False)
+
+        # Evaluate the snapshot
+        if _unchanged(data, self._state, now, self._refresh) is True:
+            result = data["layer1"]
+            log_message = (
+                "Interfaces of host {} unchanged since the last poll. "
+                "Reusing layer 1 data".format(self._hostname)
+            )
+            log.log2debug(2017, log_message)
+
+        # Return
+        return result
+
+    def save(self, layer1):
+        """Write the layer 1 data of a full poll to disk.
+
+        Args:
+            layer1: Layer 1 data
+
+        Returns:
+            None
+
+        """
+        # Do nothing if the state of the device is unknown
+        if bool(self._state) is False or bool(layer1) is False:
+            return
+
+        # Write atomically so that concurrent readers never see a partial file
+        data = dict(self._state)
+        data["layer1"] = general.consistent_keys(layer1)
+        tmp_filename = "{}.tmp".format(self._filename)
+        try:
+            with open(tmp_filename, "w") as f_handle:
+                yaml.safe_dump(data, f_handle, default_flow_style=False)
+            os.replace(tmp_filename, self._filename)
+        except:
+            log_message = "Cannot write interface snapshot file {}".format(
+                self._filename
+            )
+            log.log2warning(2018, log_message)
+
+
+def _unchanged(data, state, now, refresh):
+    """Determine whether the snapshot data can be reused.
+
+    Args:
+        data: Dict of snapshot data
+        state: Dict of the current state of the device
+        now: Current timestamp
+        refresh: Maximum age of the snapshot in seconds
+
+    Returns:
+        result: True if the snapshot can be used
+
+    """
+    # Initialize key variables
+    result = False
+    sysuptime = state["sysuptime"]
+
+    # Evaluate. A lower sysUpTime means the device rebooted
+    if (
+        bool(data)
+        and bool(state["sysobjectid"])
+        and bool(state["iflastchange"])
+    ):
+        if (
+            isinstance(data.get("layer1"), dict)
+            and isinstance(data.get("sysuptime"), int)
+            and isinstance(data.get("timestamp"), int)
+            and isinstance(sysuptime, int)
+        ):
+            result = bool(
+                data.get("version") == state["version"]
+                and data.get("sysobjectid") == state["sysobjectid"]
+                and data["sysuptime"] <= sysuptime
+                and data.get("iflastchange") == state["iflastchange"]
+                and now - data["timestamp"] < refresh
+            )
+
+    # Return
+    return result
@@ -2,9 +2,17 @@
 
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from . import iana_enterprise
 from . import get_queries
+from . import BridgeQuery, QbridgeQuery, LldpQuery, CiscoCdpQuery
+from .mib.generic import mib_if
+
+# Layer 1 MIB queries of the forwarding database and interface neighbors.
+# These change without changing ifLastChange, so they are polled even when
+# the rest of the layer 1 data of the last poll is reused
+VOLATILE = (BridgeQuery, QbridgeQuery, LldpQuery, CiscoCdpQuery)
 
 
 class Query:
@@ -18,11 +26,16 @@ class Query:
 
     """
 
-    def __init__(self, snmp_object):
+    def __init__(self, snmp_object, parallelism=1, snapshot=None):
         """Instantiate the class.
 
         Args:
             snmp_object: SNMP Interact class object from snmp_manager.py
+            parallelism: Maximum number of MIB queries to run concurrently
+                against the device
+            snapshot: snapshot.Snapshot object used to reuse the layer 1
+                interface data of unchanged devices. Layer 1 is always
+                polled if None.
 
         Returns:
             None
@@ -30,6 +43,8 @@ class Query:
         """
         # Define query object
         self.snmp_object = snmp_object
+        self._parallelism = max(1, int(parallelism))
+        self._snapshot = snapshot
 
     def everything(self):
         """Get all information from device.
@@ -43,13 +58,27 @@ class Query:
         """
         # Initialize key variables
         data = {}
+        layers = ["layer1", "layer2", "layer3", "system"]
 
         # Append data
         data["misc"] = self.misc()
-        data["layer1"] = self.layer1()
-        data["layer2"] = self.layer2()
-        data["layer3"] = self.layer3()
-        data["system"] = self.system()
+
+        # Poll everything if interface data isn't reused
+        if self._snapshot is None:
+            data.update(self._execute(layers))
+            return data
+
+        # Only poll the layer 1 interface data if the interfaces have
+        # changed since the last poll
+        layer1 = self._unchanged_layer1()
+        if layer1 is None:
+            layer1 = self._execute(["layer1"], volatile=False)["layer1"]
+            self._snapshot.save(layer1)
+
+        # The forwarding database, neighbors, layer 2 and layer 3 tables
+        # are always polled
+        data.update(self._execute(layers, volatile=True))
+        data["layer1"] = _merge_layer1(layer1, data["layer1"])
 
         # Return
         return data
@@ -87,24 +116,8 @@ class Query:
             data: Aggregated data
 
         """
-        # Initialize data
-        data = defaultdict(lambda: defaultdict(dict))
-        processed = False
-
         # Get system information from SNMPv2-MIB, ENTITY-MIB, IF-MIB
-        # Instantiate a query object for each system query
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("system")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_system(item, data)
-
-        # Return
-        if processed is True:
-            return data
-        else:
-            return None
+        return self._execute(["system"])["system"]
 
     def layer1(self):
         """Get all layer1 information from device.
@@ -116,24 +129,8 @@ class Query:
             data: Aggregated data
 
         """
-        # Initialize key values
-        data = defaultdict(lambda: defaultdict(dict))
-        processed = False
-
-        # Get information layer1 queries
-
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer1")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer1(item, data)
-
         # Return
-        if processed is True:
-            return data
-        else:
-            return None
+        return self._execute(["layer1"])["layer1"]
 
     def layer2(self):
         """Get all layer2 information from device.
@@ -145,22 +142,8 @@ class Query:
             data: Aggregated data
 
         """
-        # Initialize key variables
-        data = defaultdict(lambda: defaultdict(dict))
-        processed = False
-
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer2")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer2(item, data)
-
         # Return
-        if processed is True:
-            return data
-        else:
-            return None
+        return self._execute(["layer2"])["layer2"]
 
     def layer3(self):
         """Get all layer3 information from device.
@@ -171,23 +154,143 @@ class Query:
         Returns:
             data: Aggregated data
 
+        """
+        # Return
+        return self._execute(["layer3"])["layer3"]
+
+    def _unchanged_layer1(self):
+        """Get the layer 1 data of the last poll if interfaces are unchanged.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer 1 data, or None if layer 1 needs to be polled
+
         """
         # Initialize key variables
-        data = defaultdict(lambda: defaultdict(dict))
-        processed = False
+        result = None
 
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer3")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer3(item, data)
+        # Compare sysUpTime and ifLastChange with the last poll
+        if self._snapshot is not None:
+            result = self._snapshot.layer1(
+                self.snmp_object.sysobjectid(),
+                self.snmp_object.sysuptime(),
+                mib_if.IfQuery(self.snmp_object).iflastchange(),
+            )
 
         # Return
-        if processed is True:
-            return data
+        return result
+
+    def _execute(self, layers, volatile=None):
+        """Run the MIB queries for the layers and aggregate the results.
+
+        Each (layer, MIB query class) pair of the execution plan is
+        independent of the others, so they are run concurrently up to the
+        parallelism limit. Results are merged in plan order so that the
+        output doesn't depend on the order in which the queries complete.
+
+        Args:
+            layers: List of layers to query
+            volatile: Only run the VOLATILE layer 1 queries if True, only
+                run the other layer 1 queries if False. Run all of them if
+                None
+
+        Returns:
+            result: Dict of aggregated data keyed by layer. The value is
+                None if no MIB supporting the layer was found.
+
+        """
+        # Initialize key variables
+        result = {}
+        plan = [
+            (layer, _)
+            for layer in layers
+            for _ in get_queries(layer)
+            if layer != "layer1"
+            or volatile is None
+            or (_ in VOLATILE) is volatile
+        ]
+        workers = min(self._parallelism, len(plan))
+
+        # Run the queries
+        if workers <= 1:
+            partials = [_execute(self.snmp_object, *_) for _ in plan]
         else:
-            return None
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                partials = list(
+                    executor.map(
+                        lambda step: _execute(self.snmp_object, *step), plan
+                    )
+                )
+
+        # Merge the results
+        for layer in layers:
+            data = defaultdict(lambda: defaultdict(dict))
+            processed = False
+            for (step_layer, _), partial in zip(plan, partials):
+                if step_layer != layer or partial is None:
+                    continue
+                processed = True
+                if layer == "system":
+                    data = _merge_system(partial, data)
+                else:
+                    data = _add_data(partial, data)
+            result[layer] = data if processed is True else None
+
+        # Return
+        return result
+
+
+def _execute(snmp_object, layer, query):
+    """Run a single MIB query for a layer.
+
+    Args:
+        snmp_object: SNMP Interact class object from snmp_manager.py
+        layer: Layer to query
+        query: MIB query class
+
+    Returns:
+        result: Data for the layer, or None if the MIB isn't supported
+
+    """
+    # Initialize key variables
+    result = None
+    adders = {
+        "layer1": _add_layer1,
+        "layer2": _add_layer2,
+        "layer3": _add_layer3,
+        "system": _add_system,
+    }
+
+    # Query the device
+    item = query(snmp_object)
+    if item.supported():
+        result = adders[layer](item, defaultdict(lambda: defaultdict(dict)))
+
+    # Return
+    return result
+
+
+def _merge_layer1(interfaces, volatile):
+    """Merge the layer 1 interface data with the volatile layer 1 data.
+
+    Args:
+        interfaces: Layer 1 data of the interfaces, None if unsupported
+        volatile: Layer 1 data of the VOLATILE queries, None if unsupported
+
+    Returns:
+        result: Aggregated data, None if both are unsupported
+
+    """
+    # Return
+    if interfaces is None or volatile is None:
+        result = volatile if interfaces is None else interfaces
+        return result
+    result = defaultdict(lambda: defaultdict(dict))
+    result = _add_data(interfaces, result)
+    result = _add_data(volatile, result)
+    return result
 
 
 def _add_data(source, target):
@@ -280,12 +383,28 @@ def _add_system(query, data):
     """
     # Process query
     result = query.system()
+    data = _merge_system(result, data)
 
+    # Return
+    return data
+
+
+def _merge_system(source, target):
+    """Add system data from source to target dict. Both have three keys.
+
+    Args:
+        source: Source dict
+        target: Target dict
+
+    Returns:
+        target: Aggregated data
+
+    """
     # Add tag
-    for primary in result.keys():
-        for secondary in result[primary].keys():
-            for tertiary, value in result[primary][secondary].items():
-                data[primary][secondary][tertiary] = value
+    for primary in source.keys():
+        for secondary in source[primary].keys():
+            for tertiary, value in source[primary][secondary].items():
+                target[primary][secondary][tertiary] = value
 
     # Return
-    return data
+    return target
@@ -1,7 +1,14 @@
 """SNMP manager class."""
 
-import os
 import sys
+import time
+import threading
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+    FIRST_COMPLETED,
+)
 
 import easysnmp
 from easysnmp import exceptions
@@ -10,8 +17,8 @@ from easysnmp import exceptions
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.poller import POLL
 from switchmap.core import log
-from switchmap.core import files
 from . import iana_enterprise
+from . import credentials
 
 
 class Validate:
@@ -40,38 +47,21 @@ class Validate:
                 credentials, or None if no valid credentials found
         """
         # Initialize key variables
-        cache_exists = False
+        authentication = None
+        store = credentials.Store(ConfigPoller())
 
-        # Create cache directory / file if not yet created
-        filename = files.snmp_file(self._options.hostname, ConfigPoller())
-        if os.path.exists(filename) is True:
-            cache_exists = True
-
-        # Create file if necessary
-        if cache_exists is False:
-            # Get credentials
-            authentication = self.validation()
-
-            # Save credentials if successful
-            if bool(authentication):
-                _update_cache(filename, authentication.group)
-
-        else:
-            # Read credentials from cache
-            if os.path.isfile(filename):
-                with open(filename) as f_handle:
-                    group = f_handle.readline()
-
-            # Get credentials
+        # Try the credentials that last worked
+        group = store.group(self._options.hostname)
+        if group is not None:
             authentication = self.validation(group)
 
-            # Try the rest if these credentials fail
-            if bool(authentication) is False:
-                authentication = self.validation()
+        # Try the rest if these credentials fail
+        if bool(authentication) is False:
+            authentication = self.validation()
 
-            # Update cache if found
-            if bool(authentication):
-                _update_cache(filename, authentication.group)
+        # Update cache if found
+        if bool(authentication):
+            store.succeeded(self._options.hostname, authentication.group)
 
         # Return
         return authentication
@@ -90,31 +80,79 @@ class Validate:
         # Initialize key variables
         result = None
 
-        # Probe device with all SNMP options
-        for authorization in self._options.authorizations:
-            # Only process enabled SNMP values
-            if bool(authorization.enabled) is False:
-                continue
-
-            # Setup contact with the remote device
-            device = Interact(
-                POLL(
-                    hostname=self._options.hostname,
-                    authorization=authorization,
-                )
-            )
+        # Only process enabled SNMP values
+        candidates = [
+            _ for _ in self._options.authorizations if bool(_.enabled) is True
+        ]
 
-            # Try successive groups
-            if group is None:
-                # Verify connectivity
-                if device.contactable() is True:
-                    result = authorization
-                    break
-            else:
+        # Try the requested group
+        if group is not None:
+            for authorization in candidates:
                 if authorization.group == group:
                     # Verify connectivity
-                    if device.contactable() is True:
+                    if self._contactable(authorization) is True:
                         result = authorization
+            return result
+
+        # Skip groups that recently failed
+        store = credentials.Store(ConfigPoller())
+        candidates = [
+            _
+            for _ in candidates
+            if store.retry(self._options.hostname, _.group) is True
+        ]
+        if bool(candidates) is False:
+            log_message = (
+                "All SNMP groups recently failed for host {}. "
+                "Retrying later".format(self._options.hostname)
+            )
+            log.log2debug(2024, log_message)
+            return result
+
+        # Probe the device with all groups at the same time and use the
+        # first one that works
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = {executor.submit(self._contactable, _): _ for _ in candidates}
+        try:
+            for future in as_completed(futures):
+                if future.result() is True:
+                    result = futures[future]
+                    break
+        finally:
+            # Don't wait for the remaining probes
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Update the negative cache with the probes that completed
+        for future, authorization in futures.items():
+            if future.done() is False or future.cancelled() is True:
+                continue
+            if future.exception() is not None:
+                continue
+            if future.result() is False:
+                store.failed(self._options.hostname, authorization.group)
+
+        # Return
+        return result
+
+    def _contactable(self, authorization):
+        """Determine whether the device can be contacted with credentials.
+
+        Args:
+            authorization: SNMP object
+
+        Returns:
+            result: True if contactable
+
+        """
+        # Setup contact with the remote device
+        with Interact(
+            POLL(
+                hostname=self._options.hostname,
+                authorization=authorization,
+            )
+        ) as device:
+            # Verify connectivity
+            result = device.contactable()
 
         # Return
         return result
@@ -123,17 +161,55 @@ class Validate:
 class Interact:
     """Class Gets SNMP data."""
 
-    def __init__(self, _poll):
+    def __init__(
+        self,
+        _poll,
+        capabilities=None,
+        context_parallelism=1,
+        context_timeout=300,
+        repetitions=None,
+    ):
         """Initialize the Interact class.
 
         Args:
             _poll: POLL object containing SNMP configuration and target info
+            capabilities: capabilities.Capabilities object used to cache
+                MIB support probes across polling cycles. Probes aren't
+                cached if None.
+            context_parallelism: Maximum number of SNMP contexts walked
+                concurrently by context_walk()
+            context_timeout: Maximum number of seconds allowed to walk a
+                single SNMP context in context_walk()
+            repetitions: repetitions.Repetitions object used to tune the
+                max_repetitions of bulkwalks. A fixed value of 25 is used
+                if None.
 
         Returns:
             None
         """
         # Initialize key variables
         self._poll = _poll
+        self._context_parallelism = max(1, int(context_parallelism))
+        self._context_timeout = context_timeout
+        self._capabilities = capabilities
+        self._capabilities_validated = False
+        self._repetitions = repetitions
+
+        # Pool of SNMP sessions keyed by (authorization, context_name,
+        # thread). Sessions are reused for the lifetime of the device poll.
+        # easysnmp sessions must not be shared between threads.
+        self._sessions = {}
+        self._sessions_created = 0
+        self._sessions_reused = 0
+        self._lock = threading.RLock()
+
+        # Results of SNMP walks keyed by (OID, context_name, normalized).
+        # Each OID subtree is only fetched once per device poll. Concurrent
+        # walks of the same key wait for the walk already in progress.
+        self._walks = {}
+        self._walk_locks = {}
+        self._walk_hits = 0
+        self._walk_misses = 0
 
         # Fail if there is no authentication
         if bool(self._poll.authorization) is False:
@@ -142,6 +218,100 @@ class Interact:
             )
             log.log2die(1045, log_message)
 
+    def __enter__(self):
+        """Enter the runtime context of the device poll.
+
+        Args:
+            None
+
+        Returns:
+            self: The Interact object
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context of the device poll.
+
+        Args:
+            exc_type: Exception type
+            exc_value: Exception value
+            traceback: Exception traceback
+
+        Returns:
+            None
+
+        """
+        self.close()
+
+    def close(self):
+        """Tear down all pooled SNMP sessions for the device.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Log session pool statistics
+        if bool(self._sessions_created) is True:
+            log_message = (
+                "SNMP session pool for host {} closed. Sessions created: {}, "
+                "sessions reused: {}".format(
+                    self._poll.hostname,
+                    self._sessions_created,
+                    self._sessions_reused,
+                )
+            )
+            log.log2debug(2007, log_message)
+        if bool(self._walk_misses) is True:
+            log_message = (
+                "SNMP walk cache for host {}. Hits: {}, misses: {}".format(
+                    self._poll.hostname, self._walk_hits, self._walk_misses
+                )
+            )
+            log.log2debug(2013, log_message)
+
+        # Persist the MIB support probes and bulkwalk tuning
+        if self._capabilities_validated is True:
+            self._capabilities.save()
+        if self._repetitions is not None:
+            self._repetitions.save()
+
+        # Release the sessions and cached walks
+        self._sessions.clear()
+        self._walks.clear()
+        self._walk_locks.clear()
+
+    def session_stats(self):
+        """Get the session pool statistics.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (sessions created, sessions reused)
+
+        """
+        # Return
+        result = (self._sessions_created, self._sessions_reused)
+        return result
+
+    def walk_stats(self):
+        """Get the walk cache statistics.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (cache hits, cache misses)
+
+        """
+        # Return
+        result = (self._walk_hits, self._walk_misses)
+        return result
+
     def enterprise_number(self):
         """Get SNMP enterprise number for the device.
 
@@ -233,9 +403,95 @@ class Interact:
         # Return
         return object_id
 
+    def sysuptime(self):
+        """Get the sysUpTime of the device.
+
+        Args:
+            None
+
+        Returns:
+            int: sysUpTime in hundredths of a second, or None if not available
+        """
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.1.3.0"
+        uptime = None
+
+        # Get sysUpTime
+        results = self.get(oid, check_reachability=True)
+        if bool(results) is True:
+            uptime = results[oid]
+
+        # Return
+        return uptime
+
     def oid_exists(self, oid_to_get, context_name=""):
         """Determine if an OID exists on the device.
 
+        Results for the default context are cached across polling cycles
+        when a capabilities cache is available.
+
+        Args:
+            oid_to_get: String containing OID to check
+            context_name: String containing SNMPv3 context name.
+                Default is empty string.
+
+        Returns:
+            bool: True if OID exists, False otherwise
+        """
+        # Use cached capabilities where possible
+        capabilities = None
+        if bool(context_name) is False:
+            capabilities = self._capability_cache()
+        if capabilities is not None:
+            validity = capabilities.get(oid_to_get)
+            if validity is not None:
+                return validity
+
+        # Probe the device
+        validity = self._oid_exists(oid_to_get, context_name=context_name)
+
+        # Cache the result. Only cache failures if the device is still
+        # responding, as timeouts could otherwise be mistaken for a lack
+        # of MIB support
+        if capabilities is not None:
+            if validity is True or self.contactable() is True:
+                with self._lock:
+                    capabilities.set(oid_to_get, validity)
+
+        # Return
+        return validity
+
+    def _capability_cache(self):
+        """Get the validated capabilities cache for the device.
+
+        Args:
+            None
+
+        Returns:
+            result: capabilities.Capabilities object, or None if disabled
+
+        """
+        # Caching disabled
+        if self._capabilities is None:
+            return None
+        if self._capabilities.enabled() is False:
+            return None
+
+        # Validate the cache against the device's current state once per poll
+        with self._lock:
+            if self._capabilities_validated is False:
+                self._capabilities.validate(
+                    self.sysobjectid(check_reachability=True),
+                    self.sysuptime(),
+                )
+                self._capabilities_validated = True
+
+        # Return
+        return self._capabilities
+
+    def _oid_exists(self, oid_to_get, context_name=""):
+        """Determine if an OID exists on the device by probing it.
+
         Args:
             oid_to_get: String containing OID to check
             context_name: String containing SNMPv3 context name.
@@ -331,6 +587,89 @@ class Interact:
         # Return
         return validity
 
+    def context_walk(self, oid_to_get, context_names, normalized=False):
+        """Perform safe SNMPwalks of an OID in several contexts concurrently.
+
+        Walks that exceed the context timeout are abandoned so that a
+        single slow context doesn't stall the others.
+
+        Args:
+            oid_to_get: OID to get
+            context_names: List of contextNames to walk
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string.
+
+        Returns:
+            results: Dict of swalk results keyed by context name. Contexts
+                that timed out are omitted.
+        """
+        # Initialize key variables
+        results = {}
+        started = {}
+
+        # No need for threads if there is only one context
+        if len(context_names) <= 1:
+            for context_name in context_names:
+                results[context_name] = self.swalk(
+                    oid_to_get, normalized=normalized, context_name=context_name
+                )
+            return results
+
+        def _walk(context_name):
+            """Walk a single context.
+
+            Args:
+                context_name: Context name
+
+            Returns:
+                result: swalk results
+
+            """
+            started[context_name] = time.time()
+            return self.swalk(
+                oid_to_get, normalized=normalized, context_name=context_name
+            )
+
+        # Walk the contexts
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._context_parallelism, len(context_names))
+        )
+        futures = {executor.submit(_walk, _): _ for _ in context_names}
+        pending = set(futures)
+        try:
+            while bool(pending) is True:
+                done, pending = wait(
+                    pending, timeout=1, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    results[futures[future]] = future.result()
+
+                # Abandon contexts that are taking too long
+                now = time.time()
+                for future in list(pending):
+                    context_name = futures[future]
+                    if context_name not in started:
+                        continue
+                    if now - started[context_name] > self._context_timeout:
+                        pending.discard(future)
+                        log_message = (
+                            'SNMP walk of OID {} on host {} for context "{}" '
+                            "exceeded {}s. Skipping.".format(
+                                oid_to_get,
+                                self._poll.hostname,
+                                context_name,
+                                self._context_timeout,
+                            )
+                        )
+                        log.log2warning(2014, log_message)
+        finally:
+            # Don't wait for abandoned walks
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Return
+        return results
+
     def swalk(self, oid_to_get, normalized=False, context_name=""):
         """Perform a safe SNMPwalk that handles errors gracefully.
 
@@ -396,15 +735,34 @@ class Interact:
             result: Dictionary of tuples (OID, value)
 
         """
-        (_, _, result) = self.query(
-            oid_to_get,
-            get=False,
-            check_reachability=check_reachability,
-            check_existence=check_existence,
-            normalized=normalized,
-            context_name=context_name,
-            safe=safe,
-        )
+        # Only one thread walks each OID at a time. Others wait for it
+        key = (oid_to_get, context_name, bool(normalized))
+        with self._lock:
+            walk_lock = self._walk_locks.setdefault(key, threading.Lock())
+
+        with walk_lock:
+            # Use the results of a previous walk of the OID where possible
+            with self._lock:
+                if key in self._walks:
+                    self._walk_hits += 1
+                    return dict(self._walks[key])
+                self._walk_misses += 1
+
+            # Walk
+            (_contactable, _, result) = self.query(
+                oid_to_get,
+                get=False,
+                check_reachability=check_reachability,
+                check_existence=check_existence,
+                normalized=normalized,
+                context_name=context_name,
+                safe=safe,
+            )
+
+            # Only keep results if the device responded
+            if _contactable is True:
+                with self._lock:
+                    self._walks[key] = dict(result)
         return result
 
     def get(
@@ -490,8 +848,8 @@ class Interact:
             log_message = "OID {} has an invalid format".format(oid_to_get)
             log.log2die(1057, log_message)
 
-        # Create SNMP session
-        session = _Session(self._poll, context_name=context_name).session
+        # Get SNMP session
+        session = self._session(context_name=context_name)
 
         # Fill the results object by getting OID data
         try:
@@ -502,9 +860,7 @@ class Interact:
             else:
                 if self._poll.authorization.version != 1:
                     # Bulkwalk for SNMPv2 and SNMPv3
-                    results = session.bulkwalk(
-                        oid_to_get, non_repeaters=0, max_repetitions=25
-                    )
+                    results = self._bulkwalk(session, oid_to_get)
                 else:
                     # Bulkwalk not supported in SNMPv1
                     results = session.walk(oid_to_get)
@@ -575,6 +931,92 @@ class Interact:
         return_value = (_contactable, exists, values)
         return return_value
 
+    def _bulkwalk(self, session, oid_to_get):
+        """Do an SNMP bulkwalk, tuning max_repetitions if required.
+
+        Args:
+            session: SNMP session
+            oid_to_get: OID to walk
+
+        Returns:
+            results: List of easysnmp SNMPVariable results
+
+        """
+        # Use the default if there is no tuning
+        if self._repetitions is None:
+            results = session.bulkwalk(
+                oid_to_get, non_repeaters=0, max_repetitions=25
+            )
+            return results
+
+        # Initialize key variables
+        max_repetitions = self._repetitions.value()
+        timed_out = None
+
+        # Retry with fewer repetitions after timeouts and tooBig errors
+        while True:
+            started = time.time()
+            try:
+                results = session.bulkwalk(
+                    oid_to_get,
+                    non_repeaters=0,
+                    max_repetitions=max_repetitions,
+                )
+            except (exceptions.EasySNMPError, SystemError) as exception_error:
+                if _oversized(exception_error) is False:
+                    raise
+
+                # Retry a timeout once. The host is unreachable if the
+                # retry also times out, so nothing is learned
+                if isinstance(exception_error, exceptions.EasySNMPTimeoutError):
+                    retry = self._repetitions.smaller(max_repetitions)
+                    if timed_out is not None or retry is None:
+                        raise
+                    timed_out = max_repetitions
+                    max_repetitions = retry
+                    continue
+
+                # tooBig errors
+                if self._repetitions.backoff(max_repetitions) is False:
+                    raise
+                max_repetitions = self._repetitions.value()
+                continue
+
+            # Learn from the successful walk
+            if timed_out is not None:
+                self._repetitions.backoff(timed_out, timeout=True)
+            self._repetitions.success(
+                max_repetitions, results, time.time() - started
+            )
+            return results
+
+    def _session(self, context_name=""):
+        """Get a pooled SNMP session, creating it if necessary.
+
+        Args:
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            session: SNMP session
+
+        """
+        # Reuse the session if it already exists
+        key = (self._poll.authorization, context_name, threading.get_ident())
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions_reused += 1
+                return session
+
+        # Create SNMP session
+        session = _Session(self._poll, context_name=context_name).session
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions_created += 1
+        return session
+
 
 class _Session:
     """Class to create an SNMP session with a device."""
@@ -829,6 +1271,26 @@ def _process_error(
     log.log2die(1023, log_message)
 
 
+def _oversized(exception_error):
+    """Determine whether a bulkwalk error may be due to a large response.
+
+    Args:
+        exception_error: Exception error object
+
+    Returns:
+        result: True if the error is a timeout or a tooBig error
+
+    """
+    # Timeouts
+    if isinstance(exception_error, exceptions.EasySNMPTimeoutError) is True:
+        return True
+
+    # tooBig errors are only reported in the error text
+    text = str(exception_error).lower().replace(" ", "")
+    result = "toobig" in text
+    return result
+
+
 def _format_results(results, mock_filter, normalized=False):
     """Normalize and format SNMP walk results.
 
@@ -962,18 +1424,3 @@ def _oid_valid_format(oid):
 
     # Otherwise valid
     return True
-
-
-def _update_cache(filename, group):
-    """Update SNMP credentials cache file.
-
-    Args:
-        filename: String containing path to cache file
-        group: String containing SNMP group name to cache
-
-    Returns:
-        None
-    """
-    # Do update
-    with open(filename, "w+") as env:
-        env.write(group)
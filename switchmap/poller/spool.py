@@ -0,0 +1,446 @@
+"""Store-and-forward spool of device data the server couldn't accept."""
+
+import glob
+import hashlib
+import os
+import threading
+import time
+
+# Import app libraries
+from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
+from switchmap.core import files
+from switchmap.core import log
+from switchmap.core import rest
+
+# Maximum number of spooled files posted by each drain of the spool
+_BATCH = 100
+
+# Seconds between drains of the spool. The delay doubles after each failed
+# drain up to the maximum
+_INTERVAL = 30
+_BACKOFF_MAXIMUM = 900
+
+
+class Spool:
+    """Bounded on-disk queue of device data waiting to be posted.
+
+    Only the most recent data of each device is kept, as the server only
+    ingests the most recent data of each device. The oldest files are
+    deleted when the spool is full. When batching is enabled all polled
+    data is spooled and posted many devices at a time.
+
+    """
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._limit = config.spool_max_files()
+        self._batching = batching(config)
+        self._batch_size = config.server_batch_size()
+        self._batch_interval = config.server_batch_interval()
+
+    def add(self, data):
+        """Add the data of a device to the spool.
+
+        Args:
+            data: Device data that was posted
+
+        Returns:
+            None
+
+        """
+        # Do nothing if spooling is disabled
+        if bool(self._limit) is False:
+            return
+
+        # Add the data. The poll timestamp is part of the data
+        filepath = _filepath(data, self._config)
+        try:
+            files.write_cache_file(filepath, data)
+        except:
+            log_message = "Cannot write spool file {}".format(filepath)
+            log.log2warning(2032, log_message)
+            return
+
+        # Log
+        log_message = "Spooled data of host {} for posting".format(
+            data["misc"]["host"]
+        )
+        log.log2info(2033, log_message)
+
+        # Delete the oldest files if the spool is full
+        for filepath in self.filepaths()[: -self._limit]:
+            log_message = "Spool full. Discarding spool file {}".format(
+                filepath
+            )
+            log.log2warning(2034, log_message)
+            _remove(filepath)
+
+    def discard(self, data):
+        """Delete the spooled data of a device.
+
+        Args:
+            data: Device data that was posted
+
+        Returns:
+            None
+
+        """
+        # Delete the file as it has been superseded
+        _remove(_filepath(data, self._config))
+
+    def filepaths(self):
+        """Get the files in the spool.
+
+        Args:
+            None
+
+        Returns:
+            result: List of files, oldest first
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Get the files and their modification times
+        for filepath in glob.glob(files.spool_file("*", self._config)):
+            try:
+                result.append((os.path.getmtime(filepath), filepath))
+            except OSError:
+                # The file has been posted or discarded by another process
+                continue
+
+        # Return
+        result = [_[1] for _ in sorted(result)]
+        return result
+
+    def ready(self):
+        """Determine whether spooled data is ready to be posted.
+
+        Args:
+            None
+
+        Returns:
+            result: True if there is spooled data to post. When batching,
+                the batch must be full or the oldest data must have waited
+                for the batch interval.
+
+        """
+        # Initialize key variables
+        filepaths = self.filepaths()
+
+        # Get result
+        if bool(filepaths) is False:
+            return False
+        if self._batching is False or len(filepaths) >= self._batch_size:
+            return True
+        try:
+            age = time.time() - os.path.getmtime(filepaths[0])
+        except OSError:
+            return True
+        result = bool(age >= self._batch_interval)
+        return result
+
+    def drain(self, batch=_BATCH):
+        """Post the oldest spooled data to the server.
+
+        Args:
+            batch: Maximum number of files to post one at a time
+
+        Returns:
+            result: False if the server couldn't accept the data
+
+        """
+        # Post a single batch if the server supports it
+        if self._batching is True:
+            result = self._drain_batch()
+            if result is not None:
+                return result
+
+        # Initialize key variables
+        result = True
+
+        # Post the files
+        for filepath in self.filepaths()[:batch]:
+            stat = _stat(filepath)
+            data = files.read_cache_file(filepath, die=False)
+            if bool(data) is True:
+                response = rest.post(
+                    API_POLLER_POST_URI,
+                    data,
+                    self._config,
+                    compress=self._config.server_compression(),
+                    params={
+                        "host": data["misc"]["host"],
+                        "zone": data["misc"]["zone"],
+                    },
+                )
+
+                # Try again later
+                if retry(response) is True:
+                    result = False
+                    break
+
+                # The server rejected the data
+                if response.success is False:
+                    log_message = (
+                        "Server rejected spooled data in file {}. "
+                        "Discarding it".format(filepath)
+                    )
+                    log.log2warning(2035, log_message)
+
+            # Delete the file unless it was replaced while being posted
+            _remove(filepath, stat=stat)
+
+        # Return
+        return result
+
+    def _drain_batch(self):
+        """Post the oldest spooled data to the server in a single request.
+
+        Args:
+            None
+
+        Returns:
+            result: False if the server couldn't accept the data, None if
+                the files must be posted one at a time
+
+        """
+        # Post the files
+        filepaths = self.filepaths()[: self._batch_size]
+        if bool(filepaths) is False:
+            return True
+        stats = {_: _stat(_) for _ in filepaths}
+        response = rest.post_batch(
+            API_POLLER_BATCH_URI,
+            _documents(filepaths),
+            self._config,
+            compress=self._config.server_compression(),
+        )
+
+        # Try again later
+        if retry(response) is True:
+            return False
+
+        # Servers without a batch endpoint
+        if response.success is False:
+            if response.response.status_code in [404, 405]:
+                self._batching = False
+                log_message = (
+                    "Server doesn't accept batches of device data. Posting "
+                    "devices one at a time"
+                )
+                log.log2warning(2036, log_message)
+                return None
+
+            # The server rejected the data. Only discard the files it
+            # rejects when they are posted one at a time
+            log_message = (
+                "Server rejected a batch of {} spooled files. Posting "
+                "them one at a time".format(len(filepaths))
+            )
+            log.log2warning(2037, log_message)
+            return None
+
+        # Delete the files unless they were replaced while being posted
+        for filepath in filepaths:
+            _remove(filepath, stat=stats[filepath])
+        return True
+
+
+class Sender(threading.Thread):
+    """Thread that drains the spool while the poller is running."""
+
+    def __init__(self, config):
+        """Initialize the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        threading.Thread.__init__(self, daemon=True)
+        self._spool = Spool(config)
+        self._delay = _INTERVAL
+        self._idle = 1 if batching(config) is True else _INTERVAL
+
+    def run(self):
+        """Drain the spool until the poller stops.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Drain
+        while True:
+            time.sleep(self.cycle())
+
+    def cycle(self):
+        """Drain a batch of files from the spool.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to wait before the next drain
+
+        """
+        # Wait for spooled data
+        if self._spool.ready() is False:
+            return self._idle
+
+        # Back off while the server can't accept the data
+        if self._spool.drain() is False:
+            self._delay = min(self._delay * 2, _BACKOFF_MAXIMUM)
+            return self._delay
+        self._delay = _INTERVAL
+
+        # Continue immediately if files remain
+        result = 0 if bool(self._spool.filepaths()) is True else self._idle
+        return result
+
+
+def batching(config):
+    """Determine whether polled data is posted to the server in batches.
+
+    Args:
+        config: ConfigPoller object
+
+    Returns:
+        result: True if batching is enabled
+
+    """
+    # Batches are assembled in the spool
+    result = bool(
+        config.server_batch_size() > 1 and config.spool_max_files() > 0
+    )
+    return result
+
+
+def retry(response):
+    """Determine whether a failed post must be retried later.
+
+    Args:
+        response: Object returned by rest.post()
+
+    Returns:
+        result: True if the server couldn't be contacted or had an error
+
+    """
+    # Server couldn't be contacted
+    if hasattr(response, "success") is False:
+        return True
+    if response.success is True:
+        return False
+
+    # Server errors
+    result = bool(
+        hasattr(response.response, "status_code") is False
+        or response.response.status_code >= 500
+    )
+    return result
+
+
+def _documents(filepaths):
+    """Read spooled device data a file at a time.
+
+    Args:
+        filepaths: List of spool files
+
+    Returns:
+        result: Yield dicts of device data
+    """
+    # Read
+    for filepath in filepaths:
+        result = files.read_cache_file(filepath, die=False)
+        if bool(result) is True:
+            yield result
+
+
+def _filepath(data, config):
+    """Get the spool file of a device.
+
+    Args:
+        data: Device data
+        config: ConfigPoller object
+
+    Returns:
+        result: Name of spool file
+
+    """
+    # Use the same naming convention as the server's cache files
+    result = files.spool_file(
+        "{}-{}".format(
+            data["misc"]["host"],
+            hashlib.md5(data["misc"]["zone"].encode("utf-8")).hexdigest()[:5],
+        ),
+        config,
+    )
+    return result
+
+
+def _stat(filepath):
+    """Identify the version of a spool file.
+
+    Spool files are replaced rather than rewritten, so a new version of
+    the file has a new inode and modification time.
+
+    Args:
+        filepath: Name of spool file
+
+    Returns:
+        result: (inode, modification time) tuple, None if the file doesn't
+            exist
+
+    """
+    # Return
+    try:
+        status = os.stat(filepath)
+    except OSError:
+        return None
+    result = (status.st_ino, status.st_mtime_ns)
+    return result
+
+
+def _remove(filepath, stat=None):
+    """Delete a spool file.
+
+    Args:
+        filepath: Name of spool file
+        stat: Only delete the file if it's still the version identified by
+            _stat(). The file is deleted regardless if None
+
+    Returns:
+        None
+
+    """
+    # Keep newer data spooled by a poll while the file was being posted
+    if stat is not None and _stat(filepath) != stat:
+        log_message = (
+            "Spool file {} was replaced while being posted. Keeping "
+            "it".format(filepath)
+        )
+        log.log2debug(2079, log_message)
+        return
+
+    # Delete. The file may have been deleted by another process
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
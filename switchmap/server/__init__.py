@@ -11,8 +11,8 @@ Returns:
 from collections import namedtuple
 
 # Important tuples
-ZoneData = namedtuple("ZoneData", "idx_zone data")
 ZoneObjects = namedtuple("ZoneObjects", "ips macs pairmacips")
-ZoneDevice = namedtuple("ZoneDevice", "idx_zone, data, filepath, config")
-EventObjects = namedtuple("EventObjects", "zones event")
+ZoneDevice = namedtuple("ZoneDevice", "idx_zone, filepath, config")
+ZoneRows = namedtuple("ZoneRows", "name filepath rows")
+EventObjects = namedtuple("EventObjects", "zones event pairmacips")
 PairMacIp = namedtuple("PairMacIp", "mac ip ip_version idx_zone")
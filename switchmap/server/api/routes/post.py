@@ -2,15 +2,18 @@
 
 # Standard imports
 import os
+import gzip
+import json
 import hashlib
 
 # PIP3 imports
 from flask import Blueprint, request, jsonify
-import yaml
 
 # Repository imports
 from switchmap.core import log
+from switchmap.core import files
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap import API_POLLER_SEARCH_URI
 from switchmap.server.configuration import ConfigServer
 from switchmap.server.db.misc import search
@@ -33,48 +36,93 @@ def post_device_data():
     """
     # Initialize key variables
     config = ConfigServer()
-
-    # Get data
-    data = request.json
-    try:
-        hostname = data["misc"]["host"]
-    except:
-        hostname = None
-    try:
-        zone = data["misc"]["zone"]
-    except:
-        zone = None
-
+    data = None
+    encoding = request.headers.get("Content-Encoding", "identity").lower()
+    compressed = bool(encoding == "gzip")
+
+    # Only gzip compressed posts are supported
+    if encoding not in ["gzip", "identity"]:
+        return "Unsupported Content-Encoding {}".format(encoding), 415
+
+    # Pollers identify the device in the query string so that the data can
+    # be streamed straight to the cache file. Otherwise decode the data.
+    hostname = request.args.get("host")
+    zone = request.args.get("zone")
+    if bool(hostname) is False or zone is None:
+        try:
+            if compressed is True:
+                data = json.load(
+                    gzip.GzipFile(fileobj=request.stream, mode="rb")
+                )
+            else:
+                data = request.json
+        except:
+            return "Invalid data", 400
+        try:
+            hostname = data["misc"]["host"]
+        except:
+            hostname = None
+        try:
+            zone = data["misc"]["zone"]
+        except:
+            zone = None
+
+    # Write the data
     if bool(hostname):
-        # Only write data if file doesn't exist. This reduces the risk of
-        # duplicate data if data from a previously existing file is still
-        # being ingested.
-        filepath = "{}{}{}-{}.yaml".format(
-            config.cache_directory(),
-            os.sep,
+        success = _cache(
+            config,
             hostname,
-            hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+            zone,
+            data=data,
+            stream=request.stream if data is None else None,
+            compressed=compressed,
         )
-        if os.path.exists(filepath) is False:
-            # Write data to file
-            # data_as_string = json.dumps(data)
-            with open(filepath, "w") as f_handle:
-                yaml.dump(data, f_handle)
+        if success is False:
+            return "Cannot write cache file", 500
 
-            # Log
-            log_message = "Successfully created data cache file {}.".format(
-                filepath
-            )
-            log.log2info(1043, log_message)
+    # Return
+    return "OK"
 
-        else:
-            # Log
-            log_message = (
-                "Cache file {} already exists. Will not update.".format(
-                    filepath
-                )
-            )
-            log.log2info(1042, log_message)
+
+@API_POST.route(API_POLLER_BATCH_URI, methods=["POST"])
+def post_device_batch():
+    """Accept posts of the data of many network devices from pollers.
+
+    The body is either newline delimited JSON with one device per line, or
+    a JSON array of devices. Newline delimited JSON is read a device at a
+    time.
+
+    Args:
+        None
+
+    Returns:
+        _response: OK message when successful
+
+    """
+    # Initialize key variables
+    config = ConfigServer()
+    encoding = request.headers.get("Content-Encoding", "identity").lower()
+    stream = request.stream
+
+    # Only gzip compressed posts are supported
+    if encoding not in ["gzip", "identity"]:
+        return "Unsupported Content-Encoding {}".format(encoding), 415
+    if encoding == "gzip":
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+
+    # Write the data of each device
+    try:
+        for data in _documents(stream):
+            try:
+                hostname = data["misc"]["host"]
+                zone = data["misc"]["zone"]
+            except:
+                continue
+            if bool(hostname) is True:
+                if _cache(config, hostname, zone, data=data) is False:
+                    return "Cannot write cache file", 500
+    except:
+        return "Invalid data", 400
 
     # Return
     return "OK"
@@ -109,3 +157,89 @@ def post_searchterm():
         return jsonify(result)
     else:
         return jsonify(result)
+
+
+def _documents(stream):
+    """Read JSON documents from a newline delimited JSON or JSON array body.
+
+    Args:
+        stream: File object to read from
+
+    Returns:
+        result: Yield dicts of device data
+    """
+    # Read JSON arrays all at once
+    line = stream.readline()
+    if line.lstrip().startswith(b"[") is True:
+        for result in json.loads(line + stream.read()):
+            yield result
+        return
+
+    # Read newline delimited JSON a line at a time
+    while bool(line) is True:
+        if bool(line.strip()) is True:
+            yield json.loads(line)
+        line = stream.readline()
+
+
+def _cache(config, hostname, zone, data=None, stream=None, compressed=False):
+    """Write the data of a device to the cache directory.
+
+    Args:
+        config: ConfigServer object
+        hostname: Hostname of the device
+        zone: Zone of the device
+        data: Dict of device data
+        stream: File object to read JSON device data from if data is None
+        compressed: True if the data read from the stream is gzip compressed
+
+    Returns:
+        success: False if the data couldn't be written
+
+    """
+    # Initialize key variables
+    success = True
+
+    # Only write data if file doesn't exist. This reduces the risk of
+    # duplicate data if data from a previously existing file is still
+    # being ingested.
+    prefix = "{}{}{}-{}".format(
+        config.cache_directory(),
+        os.sep,
+        hostname,
+        hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+    )
+    filepath = "{}.{}".format(prefix, config.cache_format())
+    exists = [
+        _
+        for _ in files.CACHE_FORMATS
+        if os.path.exists("{}.{}".format(prefix, _)) is True
+    ]
+    if bool(exists) is False:
+        # Write data to file
+        if data is None:
+            success = files.write_cache_stream(
+                filepath,
+                stream,
+                compressed=compressed,
+                misc={"host": hostname, "zone": zone},
+            )
+        else:
+            files.write_cache_file(filepath, data)
+
+        # Log
+        if success is True:
+            log_message = "Successfully created data cache file {}.".format(
+                filepath
+            )
+            log.log2info(1043, log_message)
+
+    else:
+        # Log
+        log_message = "Cache file {} already exists. Will not update.".format(
+            filepath
+        )
+        log.log2info(1042, log_message)
+
+    # Return
+    return success
@@ -86,6 +86,30 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def cache_format(self):
+        """Get the format of the cache files written for the ingester.
+
+        Args:
+            None
+
+        Returns:
+            result: cache_format value
+
+        """
+        # Get result
+        result = str(self._config_server.get("cache_format", "json")).lower()
+
+        # Check if value is valid
+        if result not in files.CACHE_FORMATS:
+            log_message = (
+                'cache_format: "{}" in the configuration file(s) must be one '
+                "of {}".format(result, ", ".join(files.CACHE_FORMATS))
+            )
+            log.log2die_safe(2029, log_message)
+
+        # Return
+        return result
+
     def db_host(self):
         """Return db_host value.
 
@@ -190,6 +214,24 @@ class ConfigServer(ConfigAPI):
         # Return
         return result
 
+    def ingest_delta(self):
+        """Return ingest_delta value.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the ingester updates a single live topology
+                instead of creating a new copy of it each ingest
+
+        """
+        # Get parameter
+        result = self._config_server.get("ingest_delta", False)
+        result = general.make_bool(result)
+
+        # Return
+        return result
+
     def ingest_directory(self):
         """Determine the ingest_directory.
 
@@ -1,14 +1,19 @@
 """Class to process connection."""
 
 import sys
+import time
 
 from sqlalchemy.sql import Select, Update, Delete
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.mysql import insert
 
 # Import project libraries
 from switchmap.core import log
 from switchmap.server.db import ENGINE
 
+# Maximum number of rows in each multi-row INSERT statement
+_INSERT_CHUNK = 1000
+
 
 def db_select_row(error_code, statement):
     """Support 'Select' actions for __ENTIRE__ row.
@@ -285,3 +290,69 @@ def db_add_all(error_code, instances, die=True):
 
     # Return
     return result
+
+
+def db_insert(
+    error_code, model, rows, ignore=False, update=None, chunk=_INSERT_CHUNK
+):
+    """Insert rows with multi-row INSERT statements.
+
+    Rows are inserted without creating ORM objects, in a single
+    transaction, a chunk at a time. Primary keys are assigned in the order
+    of the rows.
+
+    Args:
+        error_code: Error code to use in messages
+        model: ORM model of the table
+        rows: List of dicts of column values, all with the same keys
+        ignore: Skip rows that duplicate a unique key if True
+        update: List of columns to update when a row duplicates a unique
+            key. Ignored if ignore is True
+        chunk: Maximum number of rows per statement
+
+    Returns:
+        result: True if successful
+
+    """
+    # Initialize key variables
+    result = False
+    start = time.time()
+
+    # Nothing to do
+    if bool(rows) is False:
+        return True
+
+    # Process transaction
+    with ENGINE.begin() as connection:
+        try:
+            for index in range(0, len(rows), chunk):
+                statement = insert(model.__table__).values(
+                    rows[index : index + chunk]
+                )
+                if bool(ignore) is True:
+                    statement = statement.prefix_with("IGNORE")
+                elif bool(update) is True:
+                    statement = statement.on_duplicate_key_update(
+                        {_: statement.inserted[_] for _ in update}
+                    )
+                connection.execute(statement)
+        except:
+            # Log error
+            log.log2info(error_code, 'DB "insert" error.')
+            log.log2exception(error_code, sys.exc_info())
+            raise
+        else:
+            result = True
+
+    # Log
+    duration = time.time() - start
+    log_message = "Inserted {} rows into table {} in {:.3f}s, {} rows/s".format(
+        len(rows),
+        model.__tablename__,
+        duration,
+        int(len(rows) / duration) if bool(duration) is True else len(rows),
+    )
+    log.log2debug(error_code, log_message)
+
+    # Return
+    return result
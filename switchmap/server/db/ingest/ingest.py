@@ -2,7 +2,13 @@
 
 import os.path
 import os
+import sys
+import atexit
+import time
 import tempfile
+import queue
+import threading
+from itertools import starmap
 from operator import attrgetter
 
 # Import project libraries
@@ -23,10 +29,24 @@ from switchmap.server.db.table import ipport as _ipport
 from switchmap.server.db.table import mac as _mac
 from switchmap.server.db.table import macip as _macip
 from switchmap.server.db.table import macport as _macport
-from switchmap.server import ZoneData, ZoneDevice, EventObjects
+from switchmap.server import ZoneDevice, ZoneObjects, ZoneRows, EventObjects
 from switchmap.server.db.ingest.update import device as update_device
 from switchmap.server.db.ingest.update import zone as update_zone
 
+# Number of files whose zone data is written to the database at a time
+_ZONE_BATCH = 100
+
+# Maximum number of parsed files waiting to be written to the database
+_QUEUE_SIZE = 2 * _ZONE_BATCH
+
+# Marks the end of the parsed files in the writer's queue. Skipped files
+# are queued as None
+_DONE = object()
+
+# Worker processes reused by all ingests
+_POOL = None
+_POOL_SIZE = None
+
 
 class Ingest:
     """Read cache files in the DB."""
@@ -73,7 +93,6 @@ class Ingest:
             else self._test_cache_directory
         )
         poller_lock_file = files.lock_file(AGENT_POLLER, self._config)
-        arguments = []
 
         # Process files
         with tempfile.TemporaryDirectory(
@@ -85,32 +104,32 @@ class Ingest:
             # and ingester are running on the same machine
             if os.path.isfile(poller_lock_file) is False:
                 # Copy files from cache to ingest
-                files.move_yaml_files(cache_directory, tmpdir)
+                files.move_cache_files(cache_directory, tmpdir)
 
-                # Parallel process the files
-                setup_success = setup(tmpdir, self._config)
+                # Process the device independent zone data in the
+                # database first. There is no event if no file is readable
+                result = self.zone(_filepaths(tmpdir))
 
-                if bool(setup_success) is True:
-                    # Populate the arguments
+                if bool(result) is True:
+                    # Populate the arguments. Workers read the files
+                    # themselves
                     arguments = [
-                        [item.idx_zone, item.data, item.filepath, item.config]
-                        for item in setup_success.zones
+                        [item.idx_zone, item.filepath, item.config]
+                        for item in result.zones
                     ]
-
-                    # Process the device independent zone data in the
-                    # database first
-                    if bool(arguments) is True:
-                        pairmacips = self.zone(arguments)
+                    pairmacips = result.pairmacips
 
                     # Process the device dependent in the database second
                     if bool(pairmacips):
                         self.device(arguments)
 
                     # Update the IpPort table
-                    insert_ipports(pairmacips)
+                    insert_ipports(
+                        pairmacips, delta=self._config.ingest_delta()
+                    )
 
                     # Cleanup
-                    self.cleanup(setup_success.event)
+                    self.cleanup(result.event)
             else:
                 log_message = (
                     "Poller lock file {} exists. Skipping processing of cache "
@@ -119,67 +138,113 @@ class Ingest:
                 )
                 log.log2info(1077, log_message)
 
-    def zone(self, arguments):
+    def zone(self, filepaths):
         """Ingest the files' zone data.
 
+        Files are parsed while the data of previously parsed files is
+        written to the database by a separate thread. The event and zones
+        are created as the files are parsed.
+
         Args:
-            arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+            filepaths: List of cache filepaths
 
         Returns:
-            success: True if successful
+            result: EventObjects object, None if no file was readable
 
         """
         # Initialize key variables
-        success = False
-        rows = []
+        ts_start = time.time()
+        result = None
+        event = None
+        idx_zones = {}
+        zones = []
+        arguments = [[filepath, self._config] for filepath in filepaths]
 
         # Return if necessary
         if bool(arguments) is False:
-            return success
+            return result
 
         # Get the number of threads to use in the pool
         pool_size = self._config.agent_subprocesses()
 
+        # Start the writer. Testing writes all the data at once so that
+        # primary keys are predictable
+        writer = _ZoneWriter(
+            delta=self._config.ingest_delta(),
+            batch=len(arguments) if bool(self._test) is True else _ZONE_BATCH,
+        )
+        writer.start()
+
         # Process the data files
-        if bool(self._test) is False:
-            if bool(self._multiprocessing) is False:
+        try:
+            if bool(self._test) is False and self._multiprocessing is True:
                 ############################
-                # Process files serially
+                # Process files in parallel
                 ############################
-                for argument in arguments:
-                    rows.append(process_zone(*argument))
+
+                # Hand over the results as each file is parsed
+                parsed = pool(pool_size).imap_unordered(
+                    _process_zone, arguments
+                )
 
             else:
                 ############################
-                # Process files in parallel
+                # Process files serially
                 ############################
+                parsed = starmap(process_zone, arguments)
+
+            for item in parsed:
+                # Skip unreadable files
+                if bool(item) is False:
+                    continue
+
+                # Create the event and zone of the file if necessary
+                if event is None:
+                    event = _create_event(self._config)
+                if item.name not in idx_zones:
+                    idx_zones[item.name] = _get_zone(event, item.name).idx_zone
+                idx_zone = idx_zones[item.name]
+
+                # Write the data
+                zones.append(
+                    ZoneDevice(
+                        idx_zone=idx_zone,
+                        filepath=item.filepath,
+                        config=self._config,
+                    )
+                )
+                writer.queue.put(_zone_objects(item.rows, idx_zone))
 
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    rows = pool.starmap(process_zone, arguments)
-
-        else:
-            ############################
-            # Process files sequentially
-            ############################
-            for argument in arguments:
-                rows.append(process_zone(*argument))
+        finally:
+            # Wait for the data to be written
+            writer.queue.put(_DONE)
+            writer.join()
 
-        # Insert ARP table
-        pairmacips = insert_arptable(rows)
+        # Log
+        log_message = (
+            "Parsed and wrote the zone data of {} files. {}s duration".format(
+                len(arguments), round(time.time() - ts_start, 1)
+            )
+        )
+        log.log2debug(2063, log_message)
 
         # Return
-        success = True
-        return pairmacips
+        if bool(writer.error) is True:
+            raise writer.error
+        if event is not None:
+            result = EventObjects(
+                event=event,
+                zones=zones,
+                pairmacips=list(set(writer.pairmacips)),
+            )
+        return result
 
     def device(self, arguments):
         """Ingest the files' device data.
 
         Args:
             arguments: List of arguments for the processing the zone
-                [[item.idx_zone, item.data, item.filepath, item.config]]
+                [[item.idx_zone, item.filepath, item.config]]
 
         Returns:
             success: True if successful
@@ -208,11 +273,7 @@ class Ingest:
                 ############################
                 # Process files in parallel
                 ############################
-
-                # Create a pool of sub process resources
-                with get_context("spawn").Pool(processes=pool_size) as pool:
-                    # Create sub processes from the pool
-                    pool.starmap(process_device, arguments)
+                pool(pool_size).starmap(process_device, arguments)
 
         else:
             ############################
@@ -261,7 +322,7 @@ class Ingest:
                     "Purging database based on configuration parameters."
                 )
                 log.log2debug(1058, log_message)
-                _event.purge()
+                _event.purge_background()
 
         else:
             # Delete all DB records related to the event.
@@ -269,17 +330,173 @@ class Ingest:
             _event.delete(event.idx_event)
 
 
-def process_zone(idx_zone, data, filepath, config):
+class _ZoneWriter(threading.Thread):
+    """Thread that writes parsed zone data to the database."""
+
+    def __init__(self, delta=False, batch=_ZONE_BATCH):
+        """Initialize the class.
+
+        Args:
+            delta: Delete superseded MAC to IP address mappings if True
+            batch: Number of files whose data is written at a time
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        threading.Thread.__init__(self, daemon=True)
+        self.queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        self.pairmacips = []
+        self.error = None
+        self._delta = delta
+        self._batch = batch
+        self._lookup = Lookup()
+
+    def run(self):
+        """Write ZoneObjects from the queue until _DONE is received.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        rows = []
+
+        # Write
+        while True:
+            row = self.queue.get()
+            if row is _DONE:
+                self._write(rows)
+                self._prune()
+                break
+            if bool(row) is True:
+                rows.append(row)
+            if len(rows) >= self._batch:
+                self._write(rows)
+                rows = []
+
+    def _write(self, rows):
+        """Write a batch of ZoneObjects to the database.
+
+        Args:
+            rows: List of ZoneObjects
+
+        Returns:
+            None
+
+        """
+        # Keep draining the queue after errors so that the parsing of
+        # files isn't blocked. The error is raised when parsing is done
+        if bool(rows) is False or bool(self.error) is True:
+            return
+        try:
+            self.pairmacips.extend(insert_arptable(rows, lookup=self._lookup))
+        except Exception as error:
+            log.log2exception(2064, sys.exc_info())
+            self.error = error
+
+    def _prune(self):
+        """Delete superseded MAC to IP address mappings of delta ingests.
+
+        The mappings are only deleted once all batches are written, as an
+        IP address may be mapped to different MAC addresses by the files of
+        different batches.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Delete
+        if bool(self._delta) is False or bool(self.error) is True:
+            return
+        try:
+            delete_macips(self.pairmacips, lookup=self._lookup)
+        except Exception as error:
+            log.log2exception(2080, sys.exc_info())
+            self.error = error
+
+
+def _process_zone(argument):
+    """Ingest a single file for device updates in a pool.
+
+    Args:
+        argument: List of arguments for process_zone()
+
+    Returns:
+        result: ZoneRows object
+
+    """
+    # Return
+    return process_zone(*argument)
+
+
+def pool(processes):
+    """Get the pool of worker processes shared by all ingests.
+
+    Workers are spawned once, so each only imports the server libraries and
+    creates its database connection pool once.
+
+    Args:
+        processes: Number of worker processes
+
+    Returns:
+        result: multiprocessing Pool object
+
+    """
+    # Initialize key variables
+    global _POOL
+    global _POOL_SIZE
+
+    # Replace the pool if the number of workers has changed
+    if bool(_POOL) is True and _POOL_SIZE != processes:
+        _POOL.terminate()
+        _POOL = None
+
+    # Create the pool
+    if bool(_POOL) is False:
+        _POOL = get_context("spawn").Pool(processes=processes)
+        _POOL_SIZE = processes
+
+    # Return
+    result = _POOL
+    return result
+
+
+@atexit.register
+def _terminate():
+    """Stop the worker processes when the ingester exits.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Stop
+    if bool(_POOL) is True:
+        _POOL.terminate()
+
+
+def process_zone(filepath, config):
     """Ingest a single file for device updates.
 
+    The zone index isn't known until the zone of the file is read, so the
+    index of the returned ZoneObjects is None.
+
     Args:
-        idx_zone: Zone index to be used for the data
-        data: Cache file containing data
         filepath: Cache file filepath that contains the data
         config: Daemon configuration
 
     Returns:
-        rows: ZoneObjects object
+        result: ZoneRows object, None if the file is skipped or unreadable
 
     """
     # Do nothing if the skip file exists
@@ -293,17 +510,27 @@ shutdown request was probably requested""".format(
         log.log2debug(1075, log_message)
         return
 
+    # Get the zone of the device
+    data = files.read_cache_file(filepath, die=False)
+    try:
+        name = data["misc"]["zone"]
+    except:
+        log_message = "Cannot get the zone of cache file {}".format(filepath)
+        log.log2warning(2065, log_message)
+        return
+
     # Process the ingested data
-    rows = update_zone.process(data, idx_zone)
-    return rows
+    result = ZoneRows(
+        name=name, filepath=filepath, rows=update_zone.process(data, None)
+    )
+    return result
 
 
-def process_device(idx_zone, data, filepath, config):
+def process_device(idx_zone, filepath, config):
     """Ingest a single file for device updates.
 
     Args:
         idx_zone: Zone index to be used for the data
-        data: Cache file containing data
         filepath: Cache file filepath that contains the data
         config: Daemon configuration
 
@@ -323,46 +550,51 @@ shutdown request was probably requested""".format(
         return
 
     # Process the ingested data
-    update_device.process(data, idx_zone)
+    data = files.read_cache_file(filepath)
+    update_device.process(data, idx_zone, delta=config.ingest_delta())
 
 
-def setup(src, config):
-    """Ingest the files in parallel.
+def _create_event(config):
+    """Create the event of an ingest.
 
     Args:
-        src: Directory where device YAML files are located
         config: Configuration object
 
     Returns:
-        result: EventObjects object
+        result: REvent object
 
     """
-    # Initialize key variables
-    result = None
-    _zones = []
-
-    # Create a list of files to process
-    filepaths = _filepaths(src)
-
-    # Parallel processing
-    if bool(filepaths) is True:
-        # Create an event
-        event = _event.create()
-
-        # Get the _zone data from each file
-        for filepath in filepaths:
-            _zone = _get_zone(event, filepath)
-            _zones.append(
-                ZoneDevice(
-                    idx_zone=_zone.idx_zone,
-                    data=_zone.data,
-                    filepath=filepath,
-                    config=config,
-                )
-            )
-        result = EventObjects(event=event, zones=_zones)
+    # Create an event, or update the live one
+    if config.ingest_delta() is True:
+        result = _live_event()
+    else:
+        result = _event.create()
+    return result
 
-    # Return
+
+def _live_event():
+    """Get the event of the live topology updated by delta ingests.
+
+    Args:
+        None
+
+    Returns:
+        result: REvent object
+
+    """
+    # Use the event the API is displaying
+    root = _root.idx_exists(1)
+    if bool(root) is True and root.idx_event != 1:
+        result = _event.idx_exists(root.idx_event)
+        if bool(result) is True:
+            return result
+
+    # Create the first event. Event 1 is a placeholder that's never updated
+    result = _event.create()
+    log_message = "Created event {} for the live topology".format(
+        result.idx_event
+    )
+    log.log2info(2055, log_message)
     return result
 
 
@@ -373,41 +605,57 @@ def _filepaths(src):
         src: Source directory
 
     Returns:
-        filepaths: List of all yaml files in the directory
+        filepaths: List of all cache files in the directory
 
     """
     # Initialize key variables
     filepaths = []
 
     # Log progress
-    log_message = "Reading ingest YAML files."
+    log_message = "Reading ingest cache files."
     log.log2info(1234, log_message)
 
     # Process files
     src_files = os.listdir(src)
     for filename in src_files:
         filepath = os.path.join(src, filename)
-        if os.path.isfile(filepath) and filepath.lower().endswith(".yaml"):
+        if os.path.isfile(filepath) and bool(files.cache_format(filepath)):
             filepaths.append(filepath)
     return filepaths
 
 
-def _get_zone(event, filepath):
-    """Create an RZone object from YAML file data.
+def _zone_objects(rows, idx_zone):
+    """Assign the zone index to the rows of a file.
 
     Args:
-        event: RZone object
-        filepath: YAML filepath
+        rows: ZoneObjects object
+        idx_zone: Zone index to be used for the data
 
     Returns:
-        result: ZoneData object
+        result: ZoneObjects object
 
     """
-    # Read the yaml file
-    data = files.read_yaml_file(filepath)
+    # Return
+    result = ZoneObjects(
+        ips=[_._replace(idx_zone=idx_zone) for _ in rows.ips],
+        macs=[_._replace(idx_zone=idx_zone) for _ in rows.macs],
+        pairmacips=[_._replace(idx_zone=idx_zone) for _ in rows.pairmacips],
+    )
+    return result
+
+
+def _get_zone(event, name):
+    """Get the zone of an event, creating it if necessary.
+
+    Args:
+        event: REvent object
+        name: Name of the zone
+
+    Returns:
+        result: RZone object
 
+    """
     # Get the zone information
-    name = data["misc"]["zone"]
     exists = _zone.exists(event.idx_event, name)
 
     if bool(exists) is False:
@@ -430,11 +678,98 @@ def _get_zone(event, filepath):
         exists = _zone.exists(event.idx_event, name)
 
     # Return
-    result = ZoneData(idx_zone=exists.idx_zone, data=data)
+    result = exists
     return result
 
 
-def insert_arptable(data, test=False):
+class Lookup:
+    """MAC and IP addresses of zones, and their mappings, in the database.
+
+    The data of each zone is loaded once. It is then kept up to date in
+    memory as rows are inserted, so that successive batches of the same
+    ingest don't reload it.
+
+    """
+
+    def __init__(self):
+        """Initialize the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.idx_macs = {}
+        self.ips = {}
+        self.pairs = set()
+        self._idx_zones = set()
+
+    def load(self, idx_zones):
+        """Load the data of zones that haven't been loaded yet.
+
+        Args:
+            idx_zones: List of zone indexes
+
+        Returns:
+            None
+
+        """
+        # Load
+        idx_zones = list(set(idx_zones) - self._idx_zones)
+        if bool(idx_zones) is True:
+            self.idx_macs.update(_mac.idx_macs(idx_zones))
+            self.ips.update(
+                {(_.idx_zone, _.address): _ for _ in _ip.ips(idx_zones)}
+            )
+            self.pairs.update(_macip.pairs(idx_zones))
+            self._idx_zones.update(idx_zones)
+
+    def idx_ip(self, key):
+        """Get the primary key of an IP address.
+
+        Args:
+            key: (idx_zone, IP address) tuple
+
+        Returns:
+            result: Ip.idx_ip value, None if not found
+
+        """
+        # Return
+        row = self.ips.get(key)
+        result = None if row is None else row.idx_ip
+        return result
+
+    def inserted(self, macs, ips):
+        """Add the primary keys of newly inserted addresses.
+
+        Args:
+            macs: List of (idx_zone, MAC address) tuples
+            ips: List of (idx_zone, IP address) tuples
+
+        Returns:
+            None
+
+        """
+        # Get the inserted rows
+        if bool(macs) is True:
+            self.idx_macs.update(
+                _mac.idx_macs([_[0] for _ in macs], macs=[_[1] for _ in macs])
+            )
+        if bool(ips) is True:
+            self.ips.update(
+                {
+                    (_.idx_zone, _.address): _
+                    for _ in _ip.ips(
+                        [_[0] for _ in ips], addresses=[_[1] for _ in ips]
+                    )
+                }
+            )
+
+
+def insert_arptable(data, test=False, delta=False, lookup=None):
     """Insert values from ARP tables.
 
     Args:
@@ -442,6 +777,9 @@ def insert_arptable(data, test=False):
             OR a single ZoneObjects from testing
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        delta: Delete superseded MAC to IP address mappings if True
+        lookup: Lookup object shared by the batches of an ingest. The
+            data of the zones is loaded from the database if None
 
     Returns:
         pairmacips: List of PairMacIp objects
@@ -463,6 +801,44 @@ def insert_arptable(data, test=False):
     ips = list(set(ips))
     pairmacips = list(set(pairmacips))
 
+    # Get the existing data of the zones
+    if lookup is None:
+        lookup = Lookup()
+    lookup.load([_.idx_zone for _ in macs + ips + pairmacips])
+
+    # Skip MAC addresses that are already in the database
+    macs = [
+        _
+        for _ in macs
+        if (_.idx_zone, general.mac(_.mac).mac) not in lookup.idx_macs
+    ]
+    new_macs = list(
+        set(
+            [
+                (_.idx_zone, general.mac(_.mac).mac)
+                for _ in macs
+                if bool(general.mac(_.mac).valid) is True
+            ]
+        )
+    )
+
+    # Skip IP addresses that are already in the database. Update their
+    # hostnames if they have changed
+    inserts = []
+    new_ips = []
+    for row in ips:
+        address = general.ipaddress(row.address)
+        key = (row.idx_zone, address.address if bool(address) else row.address)
+        current = lookup.ips.get(key)
+        if bool(current) is False:
+            inserts.append(row)
+            if bool(address) is True:
+                new_ips.append(key)
+        elif bool(row.hostname) is True and row.hostname != current.hostname:
+            _ip.update_row(current.idx_ip, row)
+            lookup.ips[key] = current._replace(hostname=row.hostname)
+    ips = inserts
+
     # Insert MAC addresses for all zones
     log_message = (
         "Updating MAC addresses in the DB for all "
@@ -486,23 +862,32 @@ def insert_arptable(data, test=False):
     else:
         for row in sorted(ips, key=attrgetter("address")):
             _ip.insert_row(row)
+    lookup.inserted(new_macs, list(set(new_ips)))
 
     # Insert ARP entries for all zones
     log_message = "Updating MAC to IP address mapping in the database."
     log.log2debug(1089, log_message)
-    insert_macips(pairmacips, test=test)
+    insert_macips(pairmacips, test=test, delta=delta, lookup=lookup)
 
     # Return
     return pairmacips
 
 
-def insert_macips(items, test=False):
+def insert_macips(items, test=False, delta=False, lookup=None):
     """Update the mac DB table.
 
+    The MAC and IP addresses, and the existing MAC to IP address mappings
+    of the items' zones are loaded with a query per table. The missing
+    mappings are then found in memory.
+
     Args:
         items: List of PairMacIp objects
         test: Sequentially insert values into the database if True.
             Bulk inserts don't insert data with predictable primary keys.
+        delta: Delete the existing mappings of the items' IP addresses to
+            other MAC addresses if True
+        lookup: Lookup object shared by the batches of an ingest. The
+            data of the zones is loaded from the database if None
 
     Returns:
         None
@@ -510,29 +895,35 @@ def insert_macips(items, test=False):
     """
     # Initialize key variables
     rows = []
+    start = time.time()
 
     # Insert shit
     if isinstance(items, list) is False:
         items = [items]
 
+    # Get the existing data of the zones
+    if lookup is None:
+        lookup = Lookup()
+    lookup.load([_.idx_zone for _ in items])
+    pairs = lookup.pairs
+    loaded = time.time()
+
     # Process data
     for item in items:
-        # Update the database
-        mac_exists = _mac.exists(item.idx_zone, item.mac)
-        ip_exists = _ip.exists(item.idx_zone, item.ip)
+        mactest = general.mac(item.mac)
+        iptest = general.ipaddress(item.ip)
+        if bool(mactest.valid) is False or bool(iptest) is False:
+            continue
+        idx_mac = lookup.idx_macs.get((item.idx_zone, mactest.mac))
+        idx_ip = lookup.idx_ip((item.idx_zone, iptest.address))
 
         # Insert
-        if bool(mac_exists) and bool(ip_exists):
-            macip_exists = _macip.exists(mac_exists.idx_mac, ip_exists.idx_ip)
-            if bool(macip_exists) is False:
+        if bool(idx_mac) and bool(idx_ip):
+            if (idx_mac, idx_ip) not in pairs:
                 # Create a DB record
-                rows.append(
-                    IMacIp(
-                        idx_ip=ip_exists.idx_ip,
-                        idx_mac=mac_exists.idx_mac,
-                        enabled=1,
-                    )
-                )
+                pairs.add((idx_mac, idx_ip))
+                rows.append(IMacIp(idx_ip=idx_ip, idx_mac=idx_mac, enabled=1))
+    compared = time.time()
 
     # Insert the values
     if bool(test) is False:
@@ -541,68 +932,171 @@ def insert_macips(items, test=False):
         for row in sorted(rows, key=attrgetter("idx_mac", "idx_ip")):
             _macip.insert_row(row)
 
+    # Delete the mappings of the IP addresses to MAC addresses that no
+    # longer have them
+    if bool(delta) is True:
+        delete_macips(items, lookup=lookup)
 
-def insert_ipports(items, test=False):
-    """Update the mac DB table.
+    # Log
+    log_message = (
+        "Inserted {} of {} MAC to IP address mappings. Load: {:.3f}s, "
+        "compare: {:.3f}s, insert: {:.3f}s".format(
+            len(rows),
+            len(items),
+            loaded - start,
+            compared - loaded,
+            time.time() - compared,
+        )
+    )
+    log.log2info(2041, log_message)
+
+
+def delete_macips(items, lookup=None):
+    """Delete superseded MAC to IP address mappings.
+
+    The existing mappings of the items' IP addresses to MAC addresses that
+    aren't in the items are deleted. All the items of the ingest must be
+    supplied at once, otherwise mappings of other items are deleted.
 
     Args:
-        items: PairMacIp objects list
-        test: Sequentially insert values into the database if True.
-            Bulk inserts don't insert data with predictable primary keys.
+        items: List of PairMacIp objects
+        lookup: Lookup object shared by the batches of an ingest. The
+            data of the zones is loaded from the database if None
 
     Returns:
         None
 
     """
     # Initialize key variables
-    rows = []
+    found = set()
 
-    # Process data
-    for item in items:
-        # Create expanded lower case versions of the IP address
-        myp = general.ipaddress(item.ip)
-        if bool(myp) is False:
-            continue
+    # Get the existing data of the zones
+    if lookup is None:
+        lookup = Lookup()
+    lookup.load([_.idx_zone for _ in items])
+    pairs = lookup.pairs
 
-        # Create lowercase version of mac address
+    # Get the mappings of the items
+    for item in items:
         mactest = general.mac(item.mac)
-        if bool(mactest.valid) is False:
+        iptest = general.ipaddress(item.ip)
+        if bool(mactest.valid) is False or bool(iptest) is False:
             continue
-        else:
-            next_mac = mactest.mac
+        idx_mac = lookup.idx_macs.get((item.idx_zone, mactest.mac))
+        idx_ip = lookup.idx_ip((item.idx_zone, iptest.address))
+        if bool(idx_mac) and bool(idx_ip):
+            found.add((idx_mac, idx_ip))
+
+    # Delete
+    addresses = set([_[1] for _ in found])
+    stale = [_ for _ in pairs if _[1] in addresses and _ not in found]
+    _macip.delete_pairs(stale)
+    pairs.difference_update(stale)
+    log_message = "Deleted {} superseded MAC to IP address mappings".format(
+        len(stale)
+    )
+    log.log2info(2056, log_message)
 
-        # Verify prerequisites
-        mac_exists = _mac.exists(item.idx_zone, next_mac)
-        ip_exists = _ip.exists(item.idx_zone, myp.address)
 
-        # Skip if the IP doesn't exist, or else the following logic will crash
-        if bool(ip_exists) is False:
-            continue
+def insert_ipports(items, test=False, delta=False):
+    """Update the mac DB table.
 
-        # Iterate over existing MAC entries
-        if bool(mac_exists) is True:
-            # Get the ports on which the MAC address resides
-            macports = _macport.find_idx_mac(mac_exists.idx_mac)
+    The MAC and IP addresses, the ports of the MAC addresses and the
+    existing IP address to port mappings of the items' zones are loaded
+    with a query per table. The missing mappings are then found in memory.
 
-            # Iterate over the MAC assignments to interfaces
-            for macport in macports:
-                ipport_exists = _ipport.exists(
-                    macport.idx_l1interface, ip_exists.idx_ip
-                )
+    Args:
+        items: PairMacIp objects list
+        test: Sequentially insert values into the database if True.
+            Bulk inserts don't insert data with predictable primary keys.
+        delta: Derive the mappings from all the MAC to IP address mappings
+            of the items' zones, and delete those that no longer apply,
+            if True
+
+    Returns:
+        None
 
+    """
+    # Initialize key variables
+    rows = []
+    deletes = set()
+    start = time.time()
+
+    # Get the existing data of the zones
+    idx_zones = list(set([_.idx_zone for _ in items]))
+    idx_macs = _mac.idx_macs(idx_zones)
+    idx_ips = _ip.idx_ips(idx_zones)
+    ports = _macport.ports(idx_zones)
+    pairs = _ipport.pairs(idx_zones)
+    loaded = time.time()
+
+    # Process data
+    if bool(delta) is True:
+        # The live topology's MAC to IP address mappings include those of
+        # devices that weren't ingested this time
+        wanted = set(
+            [
+                (idx_l1interface, idx_ip)
+                for idx_mac, idx_ip in _macip.pairs(idx_zones)
+                for idx_l1interface in ports.get(idx_mac, [])
+            ]
+        )
+        deletes = pairs - wanted
+        rows = [
+            IIpPort(idx_l1interface=_[0], idx_ip=_[1], enabled=1)
+            for _ in wanted - pairs
+        ]
+    else:
+        for item in items:
+            # Create expanded lower case versions of the IP address
+            myp = general.ipaddress(item.ip)
+            if bool(myp) is False:
+                continue
+
+            # Create lowercase version of mac address
+            mactest = general.mac(item.mac)
+            if bool(mactest.valid) is False:
+                continue
+
+            # Skip if the IP doesn't exist
+            idx_ip = idx_ips.get((item.idx_zone, myp.address))
+            if bool(idx_ip) is False:
+                continue
+
+            # Iterate over the MAC assignments to interfaces
+            idx_mac = idx_macs.get((item.idx_zone, mactest.mac))
+            for idx_l1interface in ports.get(idx_mac, []):
                 # Assign the IP to this port
-                if bool(ipport_exists) is False:
+                if (idx_l1interface, idx_ip) not in pairs:
+                    pairs.add((idx_l1interface, idx_ip))
                     rows.append(
                         IIpPort(
-                            idx_l1interface=macport.idx_l1interface,
-                            idx_ip=ip_exists.idx_ip,
+                            idx_l1interface=idx_l1interface,
+                            idx_ip=idx_ip,
                             enabled=1,
                         )
                     )
+    compared = time.time()
 
-    # Do the inserts
+    # Do the inserts and deletes
     if bool(test) is False:
         _ipport.insert_row(rows)
     else:
         for row in sorted(rows, key=attrgetter("idx_ip", "idx_l1interface")):
             _ipport.insert_row(row)
+    _ipport.delete_pairs(list(deletes))
+
+    # Log
+    log_message = (
+        "Inserted {} and deleted {} IP address to port mappings for {} MAC "
+        "to IP address mappings. Load: {:.3f}s, compare: {:.3f}s, "
+        "insert: {:.3f}s".format(
+            len(rows),
+            len(deletes),
+            len(items),
+            loaded - start,
+            compared - loaded,
+            time.time() - compared,
+        )
+    )
+    log.log2info(2044, log_message)
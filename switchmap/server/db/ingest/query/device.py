@@ -150,3 +150,32 @@ def vlanports(idx_device):
     for row in rows:
         result.append(_rows.vlanport(row))
     return result
+
+
+def macports(idx_device):
+    """Get all the MacPorts for a device.
+
+    Args:
+        idx_device: Idx_device of the device being processed
+
+    Returns:
+        result: List of RMacPort tuple
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get row from dataase
+    statement = select(_MacPort).where(
+        and_(
+            _L1Interface.idx_device == idx_device,
+            _L1Interface.idx_l1interface == _MacPort.idx_l1interface,
+        )
+    )
+    rows = db.db_select_row(2051, statement)
+
+    # Return
+    for row in rows:
+        result.append(_rows.macport(row))
+    return result
@@ -7,6 +7,7 @@ from operator import attrgetter
 
 # Application imports
 from switchmap.core import log
+from switchmap.core import general
 from switchmap.server.db.ingest.query import device as _misc_device
 from switchmap.server.db.misc import interface as _historical
 from switchmap.server.db.table import device as _device
@@ -15,7 +16,9 @@ from switchmap.server.db.table import vlan as _vlan
 from switchmap.server.db.table import macport as _macport
 from switchmap.server.db.table import vlanport as _vlanport
 from switchmap.server.db.table import mac as _mac
+from switchmap.server.db.table import changelog as _changelog
 from switchmap.server.db.table import (
+    IChangeLog,
     IVlan,
     IDevice,
     IMacPort,
@@ -23,14 +26,18 @@ from switchmap.server.db.table import (
     IL1Interface,
 )
 
+# Maximum number of MAC addresses looked up per query
+_MAC_CHUNK = 1000
 
-def process(data, idx_zone, dns=True):
+
+def process(data, idx_zone, dns=True, delta=False):
     """Process data received from a device.
 
     Args:
         data: Device data (dict)
         idx_zone: Zone index to which the data belongs
         dns: Do DNS lookups if True
+        delta: Record changes to the device's existing data if True
 
     Returns:
         None
@@ -38,7 +45,7 @@ def process(data, idx_zone, dns=True):
     """
     # Process the device
     meta = device(idx_zone, data)
-    _topology = Topology(meta, data, dns=dns)
+    _topology = Topology(meta, data, dns=dns, delta=delta)
     _topology.process()
 
 
@@ -109,6 +116,55 @@ def _lookup(idx_device):
     return result
 
 
+def _idx_macs(idx_zone, macs):
+    """Get the primary keys of MAC addresses in a zone.
+
+    Args:
+        idx_zone: Zone index
+        macs: List of MAC addresses
+
+    Returns:
+        result: Dict of Mac.idx_mac values keyed by MAC address
+
+    """
+    # Initialize key variables
+    result = {}
+    macs = sorted(set(macs))
+
+    # Query the database a chunk at a time
+    for index in range(0, len(macs), _MAC_CHUNK):
+        for row in _mac.findmac(idx_zone, macs[index : index + _MAC_CHUNK]):
+            result[row.mac] = row.idx_mac
+
+    # Return
+    return result
+
+
+def _changed(current, row):
+    """Get the columns of a database row that differ from new values.
+
+    Args:
+        current: R* tuple of the row in the database
+        row: I* tuple of the new values
+
+    Returns:
+        result: List of the names of the changed columns
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Compare. BIT columns are read as bytes and empty strings as None
+    for field in row._fields:
+        value = getattr(current, field)
+        if isinstance(value, bytes) is True:
+            value = int.from_bytes(value, "big")
+        new = getattr(row, field)
+        if value != (None if new == "" else new):
+            result.append(field)
+    return result
+
+
 class Status:
     """Tracks the status of various Topology methods."""
 
@@ -171,13 +227,14 @@ class Status:
 class Topology:
     """Update Device data in the database."""
 
-    def __init__(self, exists, data, dns=True):
+    def __init__(self, exists, data, dns=True, delta=False):
         """Initialize class.
 
         Args:
             exists: RDevice object
             data: Dict of device data
             dns: Do DNS lookups if True
+            delta: Record changes to the device's existing data if True
 
         Returns:
             None
@@ -187,6 +244,7 @@ class Topology:
         self._data = deepcopy(data)
         self._device = exists
         self._dns = dns
+        self._delta = bool(delta)
         self._valid = False not in [
             bool(_device.idx_exists(exists.idx_device)),
             bool(data),
@@ -233,8 +291,20 @@ class Topology:
         # Initialize more key variables
         data = self._data
         interfaces = data.get("layer1")
-        historical = {_.ifname: _ for _ in _historical.interfaces(self._device)}
+        existing = {
+            _.ifindex: _
+            for _ in _l1interface.ifindexes(self._device.idx_device)
+        }
+        historical = {
+            _.ifname: _
+            for _ in (
+                existing.values()
+                if self._delta is True
+                else _historical.interfaces(self._device)
+            )
+        }
         rows = []
+        changes = []
 
         # Log
         self.log("L1Interface")
@@ -261,34 +331,47 @@ class Topology:
                     previous.ts_idle if bool(previous) else int(time.time())
                 )
 
-            # Add new row to the database table
-            rows.append(
-                IL1Interface(
-                    idx_device=self._device.idx_device,
-                    ifindex=ifindex,
-                    duplex=interface.get("l1_duplex"),
-                    ethernet=int(bool(interface.get("l1_ethernet"))),
-                    nativevlan=interface.get("l1_nativevlan"),
-                    trunk=int(bool(interface.get("l1_trunk"))),
-                    ifspeed=_ifspeed(interface),
-                    iftype=interface.get("ifType"),
-                    ifalias=interface.get("ifAlias"),
-                    ifname=ifname,
-                    ifdescr=interface.get("ifDescr"),
-                    ifadminstatus=interface.get("ifAdminStatus"),
-                    ifoperstatus=interface.get("ifOperStatus"),
-                    cdpcachedeviceid=interface.get("cdpCacheDeviceId"),
-                    cdpcachedeviceport=interface.get("cdpCacheDevicePort"),
-                    cdpcacheplatform=interface.get("cdpCachePlatform"),
-                    lldpremportdesc=interface.get("lldpRemPortDesc"),
-                    lldpremsyscapenabled=interface.get("lldpRemSysCapEnabled"),
-                    lldpremsysdesc=interface.get("lldpRemSysDesc"),
-                    lldpremsysname=interface.get("lldpRemSysName"),
-                    ts_idle=ts_idle,
-                    enabled=1,
-                )
+            # Create the row
+            row = IL1Interface(
+                idx_device=self._device.idx_device,
+                ifindex=ifindex,
+                duplex=interface.get("l1_duplex"),
+                ethernet=int(bool(interface.get("l1_ethernet"))),
+                nativevlan=interface.get("l1_nativevlan"),
+                trunk=int(bool(interface.get("l1_trunk"))),
+                ifspeed=_ifspeed(interface),
+                iftype=interface.get("ifType"),
+                ifalias=interface.get("ifAlias"),
+                ifname=ifname,
+                ifdescr=interface.get("ifDescr"),
+                ifadminstatus=interface.get("ifAdminStatus"),
+                ifoperstatus=interface.get("ifOperStatus"),
+                cdpcachedeviceid=interface.get("cdpCacheDeviceId"),
+                cdpcachedeviceport=interface.get("cdpCacheDevicePort"),
+                cdpcacheplatform=interface.get("cdpCachePlatform"),
+                lldpremportdesc=interface.get("lldpRemPortDesc"),
+                lldpremsyscapenabled=interface.get("lldpRemSysCapEnabled"),
+                lldpremsysdesc=interface.get("lldpRemSysDesc"),
+                lldpremsysname=interface.get("lldpRemSysName"),
+                ts_idle=ts_idle,
+                enabled=1,
             )
 
+            # Add new rows to the database table. Update existing
+            # interfaces that have changed
+            current = existing.get(ifindex)
+            if bool(current) is False:
+                rows.append(row)
+                continue
+            changed = _changed(current, row)
+            if bool(changed) is True:
+                _l1interface.update_row(current.idx_l1interface, row)
+                changes.append(
+                    "ifindex {} {}: {}".format(
+                        ifindex, ifname, ", ".join(changed)
+                    )
+                )
+
         # Insert rows
         if bool(rows):
             if bool(test) is False:
@@ -297,6 +380,23 @@ class Topology:
                 for row in sorted(rows, key=attrgetter("ifindex")):
                     _l1interface.insert_row(row)
 
+        # Delete interfaces the device no longer has
+        deletes = [_ for _ in existing.values() if _.ifindex not in interfaces]
+        _l1interface.delete_row([_.idx_l1interface for _ in deletes])
+
+        # Record changes
+        self.changelog(
+            "L1Interface",
+            "insert",
+            ["ifindex {} {}".format(_.ifindex, _.ifname) for _ in rows],
+        )
+        self.changelog("L1Interface", "update", changes)
+        self.changelog(
+            "L1Interface",
+            "delete",
+            ["ifindex {} {}".format(_.ifindex, _.ifname) for _ in deletes],
+        )
+
         # Log
         self.log("L1Interface", updated=True)
 
@@ -321,6 +421,7 @@ class Topology:
 
         # Initialize key variables
         interfaces = self._data.get("layer1")
+        existing = {_.vlan: _ for _ in _vlan.vlans(self._device.idx_device)}
         rows = []
         inserts = []
 
@@ -343,8 +444,8 @@ class Topology:
                         )
                     )
 
-        # Remove duplicates
-        inserts = list(set(rows))
+        # Remove duplicates and existing VLANs
+        inserts = [_ for _ in set(rows) if _.vlan not in existing]
 
         # Insert if required
         if bool(inserts) is True:
@@ -356,6 +457,19 @@ class Topology:
                 ):
                     _vlan.insert_row(insert)
 
+        # Delete VLANs the device no longer has
+        vlans = set([_.vlan for _ in rows])
+        deletes = [_ for _ in existing.values() if _.vlan not in vlans]
+        _vlan.delete_row([_.idx_vlan for _ in deletes])
+
+        # Record changes
+        self.changelog(
+            "Vlan", "insert", ["vlan {}".format(_.vlan) for _ in inserts]
+        )
+        self.changelog(
+            "Vlan", "delete", ["vlan {}".format(_.vlan) for _ in deletes]
+        )
+
         # Log
         self.log("Vlan", updated=True)
 
@@ -383,6 +497,7 @@ class Topology:
         interfaces = self._data.get("layer1")
         lookup = _lookup(self._device.idx_device)
         inserts = []
+        found = set()
 
         # Log
         self.log("VlanPort")
@@ -419,12 +534,12 @@ class Topology:
                             )
 
                             # Verify that a VLAN / Port mapping exists
-                            vlanport_exists = db_vlanports.get(
-                                VlanInterface(
-                                    idx_l1interface=if_exists.idx_l1interface,
-                                    idx_vlan=vlan_exists.idx_vlan,
-                                )
+                            key = VlanInterface(
+                                idx_l1interface=if_exists.idx_l1interface,
+                                idx_vlan=vlan_exists.idx_vlan,
                             )
+                            found.add(key)
+                            vlanport_exists = db_vlanports.get(key)
 
                             # Update the VLAN / Port mapping
                             if bool(vlanport_exists) is False:
@@ -440,6 +555,25 @@ class Topology:
                 ):
                     _vlanport.insert_row(insert)
 
+        # Delete VLAN / Port mappings the device no longer has
+        deletes = [_ for key, _ in db_vlanports.items() if key not in found]
+        _vlanport.delete_row([_.idx_vlanport for _ in deletes])
+
+        # Record changes
+        ifindexes = {_.idx_l1interface: _.ifindex for _ in lookup.ifindexes}
+        vlans = {_.idx_vlan: _.vlan for _ in lookup.vlans}
+        for action, items in [("insert", inserts), ("delete", deletes)]:
+            self.changelog(
+                "VlanPort",
+                action,
+                [
+                    "ifindex {} vlan {}".format(
+                        ifindexes.get(_.idx_l1interface), vlans.get(_.idx_vlan)
+                    )
+                    for _ in items
+                ],
+            )
+
         # Log
         self.log("VlanPort", updated=True)
 
@@ -470,8 +604,27 @@ class Topology:
         # Log
         self.log("MacPort")
 
-        # Get all the existing ifindexes
+        # Get all the existing ifindexes and MacPorts
         db_ifindexes = {_.ifindex: _ for _ in lookup.ifindexes}
+        db_macports = {
+            (_.idx_l1interface, _.idx_mac): _
+            for _ in _misc_device.macports(self._device.idx_device)
+        }
+
+        # Get the primary keys of all the device's MAC addresses at once
+        log_message = (
+            "Updating MAC addresses in the DB for device {} "
+            "based on SNMP MIB-BRIDGE entries".format(self._device.hostname)
+        )
+        log.log2debug(1094, log_message)
+        idx_macs = _idx_macs(
+            self._device.idx_zone,
+            [
+                _
+                for interface in interfaces.values()
+                for _ in interface.get("l1_macs") or []
+            ],
+        )
 
         # Process each interface
         for ifindex, interface in sorted(interfaces.items()):
@@ -480,30 +633,29 @@ class Topology:
             # Process each Mac
             _macs = interface.get("l1_macs")
             if bool(_macs) is True:
-                # Update MAC addresses for all zones
-                log_message = (
-                    "Updating MAC addresses in the DB for device {}"
-                    "based on SNMP MIB-BRIDGE entries".format(
-                        self._device.hostname
-                    )
-                )
-                log.log2debug(1094, log_message)
-
                 # Iterate over the MACs found
                 for item in sorted(_macs):
                     # Ensure the MAC exists in the database
-                    mac_exists = _mac.exists(self._device.idx_zone, item)
+                    idx_mac = idx_macs.get(general.mac(item).mac)
 
                     # If True update the port to MAC address mapping
-                    if bool(mac_exists) is True:
+                    if bool(idx_mac) is True:
                         inserts.append(
                             IMacPort(
                                 idx_l1interface=if_exists.idx_l1interface,
-                                idx_mac=mac_exists.idx_mac,
+                                idx_mac=idx_mac,
                                 enabled=1,
                             )
                         )
 
+        # Only insert new port to MAC address mappings
+        found = set([(_.idx_l1interface, _.idx_mac) for _ in inserts])
+        inserts = [
+            _
+            for _ in set(inserts)
+            if (_.idx_l1interface, _.idx_mac) not in db_macports
+        ]
+
         # Insert rows
         if bool(inserts) is True:
             if bool(test) is False:
@@ -514,12 +666,63 @@ class Topology:
                 ):
                     _macport.insert_row(insert)
 
+        # Delete port to MAC address mappings the device no longer has
+        deletes = [_ for key, _ in db_macports.items() if key not in found]
+        _macport.delete_row([_.idx_macport for _ in deletes])
+
+        # Record changes
+        if self._delta is True:
+            ifindexes = {_.idx_l1interface: _.ifindex for _ in lookup.ifindexes}
+            macs = {value: key for key, value in idx_macs.items()}
+            for action, items in [("insert", inserts), ("delete", deletes)]:
+                changes = []
+                for item in items:
+                    mac = macs.get(item.idx_mac)
+                    if bool(mac) is False:
+                        exists = _mac.idx_exists(item.idx_mac)
+                        mac = exists.mac if bool(exists) else item.idx_mac
+                    changes.append(
+                        "ifindex {} mac {}".format(
+                            ifindexes.get(item.idx_l1interface), mac
+                        )
+                    )
+                self.changelog("MacPort", action, changes)
+
         # Log
         self.log("MacPort", updated=True)
 
         # Everything is completed
         self._status.macport = True
 
+    def changelog(self, table, action, items):
+        """Record changes to the device's data in the ChangeLog table.
+
+        Changes are only recorded by delta ingests.
+
+        Args:
+            table: Name of table that was changed
+            action: Type of change
+            items: List of descriptions of the changed rows
+
+        Returns:
+            None
+
+        """
+        # Record
+        if self._delta is True and bool(items) is True:
+            _changelog.insert_row(
+                [
+                    IChangeLog(
+                        idx_device=self._device.idx_device,
+                        tablename=table,
+                        action=action,
+                        item=item,
+                        enabled=1,
+                    )
+                    for item in items
+                ]
+            )
+
     def log(self, table, updated=False):
         """Create standardized log messaging.
 
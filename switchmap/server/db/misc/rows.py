@@ -13,6 +13,7 @@ from switchmap.server.db.table import RIpPort
 from switchmap.server.db.table import RZone
 from switchmap.server.db.table import REvent
 from switchmap.server.db.table import RRoot
+from switchmap.server.db.table import RChangeLog
 
 
 def device(row):
@@ -303,6 +304,32 @@ def vlanport(row):
     return result
 
 
+def changelog(row):
+    """Convert table row to tuple.
+
+    Args:
+        row: ChangeLog row
+
+    Returns:
+        result: RChangeLog tuple
+
+    """
+    # Initialize key variables
+    result = RChangeLog(
+        idx_changelog=row.idx_changelog,
+        idx_device=row.idx_device,
+        tablename=(
+            None if bool(row.tablename) is False else row.tablename.decode()
+        ),
+        action=(None if bool(row.action) is False else row.action.decode()),
+        item=(None if bool(row.item) is False else row.item.decode()),
+        enabled=int(bool(row.enabled) is True),
+        ts_created=row.ts_created,
+        ts_modified=row.ts_modified,
+    )
+    return result
+
+
 def zone(row):
     """Convert table row to tuple.
 
@@ -632,6 +632,37 @@ class MacIp(BASE):
     )
 
 
+class ChangeLog(BASE):
+    """Database table definition."""
+
+    __tablename__ = "smap_changelog"
+    __table_args__ = {"mysql_engine": "InnoDB"}
+
+    idx_changelog = Column(
+        BIGINT(20, unsigned=True), primary_key=True, unique=True
+    )
+    idx_device = Column(
+        ForeignKey(Device.idx_device, ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+        default=1,
+        server_default=text("1"),
+    )
+    tablename = Column(VARBINARY(256), nullable=True, default=Null)
+    action = Column(VARBINARY(256), nullable=True, default=Null)
+    item = Column(VARBINARY(256), nullable=True, default=Null)
+    enabled = Column(BIT(1), default=1)
+    ts_modified = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.now,
+    )
+    ts_created = Column(
+        DateTime, nullable=False, default=datetime.datetime.utcnow
+    )
+
+
 def create_all_tables():
     """Ensure all tables are created.
 
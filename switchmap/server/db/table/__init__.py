@@ -107,6 +107,15 @@ ts_modified ts_created""",
 )
 IVlanPort = namedtuple("IVlanPort", "idx_l1interface idx_vlan enabled")
 
+RChangeLog = namedtuple(
+    "RChangeLog",
+    """idx_changelog idx_device tablename action item enabled \
+ts_modified ts_created""",
+)
+IChangeLog = namedtuple(
+    "IChangeLog", "idx_device tablename action item enabled"
+)
+
 RIpPort = namedtuple(
     "RIpPort",
     """idx_ipport idx_l1interface idx_ip enabled \
@@ -0,0 +1,80 @@
+"""Module for querying the ChangeLog table."""
+
+from sqlalchemy import select, null
+
+# Import project libraries
+from switchmap.server.db import db
+from switchmap.server.db.models import ChangeLog
+from switchmap.server.db.misc import rows as _rows
+
+
+def changes(idx_device):
+    """Get all the ChangeLog table records for a device.
+
+    Args:
+        idx_device: Device.idx_device
+
+    Returns:
+        result: List of RChangeLog tuples, oldest first
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get row from dataase
+    statement = (
+        select(ChangeLog)
+        .where(ChangeLog.idx_device == idx_device)
+        .order_by(ChangeLog.idx_changelog)
+    )
+    rows = db.db_select_row(2045, statement)
+
+    # Return
+    for row in rows:
+        result.append(_rows.changelog(row))
+    return result
+
+
+def insert_row(rows):
+    """Create a ChangeLog table entry.
+
+    Args:
+        rows: IChangeLog objects
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    inserts = []
+
+    # Create list
+    if isinstance(rows, list) is False:
+        rows = [rows]
+
+    # Create objects
+    for row in rows:
+        inserts.append(
+            dict(
+                idx_device=row.idx_device,
+                tablename=(
+                    null()
+                    if bool(row.tablename) is False
+                    else row.tablename.encode()
+                ),
+                action=(
+                    null() if bool(row.action) is False else row.action.encode()
+                ),
+                item=(
+                    null()
+                    if bool(row.item) is False
+                    else row.item[:256].encode()
+                ),
+                enabled=int(bool(row.enabled) is True),
+            )
+        )
+
+    # Insert
+    if bool(inserts):
+        db.db_insert(2046, ChangeLog, inserts)
@@ -110,7 +110,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            _Device(
+            dict(
                 idx_zone=row.idx_zone,
                 sys_name=(
                     null() if row.sys_name is None else row.sys_name.encode()
@@ -139,7 +139,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1156, inserts)
+        db.db_insert(1156, _Device, inserts)
 
 
 def update_row(idx, row):
@@ -3,6 +3,8 @@
 # Standard imports
 from datetime import datetime, timezone
 from operator import attrgetter
+import threading
+import time
 
 # PIP imports
 from sqlalchemy import select, update, delete as _delete
@@ -13,10 +15,28 @@ from switchmap.server.db.models import Event
 from switchmap.server.db.misc import rows as _rows
 
 from switchmap.server.db.models import Root
+from switchmap.server.db.models import Zone
+from switchmap.server.db.models import Device
+from switchmap.server.db.models import L1Interface
+from switchmap.server.db.models import Vlan
+from switchmap.server.db.models import VlanPort
+from switchmap.server.db.models import Mac
+from switchmap.server.db.models import MacPort
+from switchmap.server.db.models import Ip
+from switchmap.server.db.models import IpPort
+from switchmap.server.db.models import MacIp
+from switchmap.server.db.models import ChangeLog
 from switchmap.server.db.table import IEvent
 from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import root
 from switchmap.core import general
+from switchmap.core import log
+
+# Maximum number of rows deleted by each statement when purging events
+_PURGE_BATCH = 1000
+
+# Thread purging events in the background
+_PURGER = None
 
 
 def idx_exists(idx):
@@ -171,6 +191,9 @@ def delete(idx):
     # Don't delete the very first record.
     # This must always exist for polling to work correctly
     if idx != 1:
+        # Delete the data of the event in small batches
+        _delete_children(idx)
+
         # Delete data
         statement = _delete(Event).where(Event.idx_event == idx)
         db.db_delete(1055, statement)
@@ -227,6 +250,8 @@ def purge():
     """
     # Get all the event data
     _events = events()
+    if bool(_events) is False:
+        return
 
     # Get the first, last event
     indexes = [
@@ -234,9 +259,171 @@ def purge():
     ]
     last = indexes[-1]
     penultimate = indexes[-2] if len(indexes) > 1 else 1
+    keep = [1, last, penultimate]
+
+    # Never purge the event the API is displaying
+    _root = root.idx_exists(1)
+    if bool(_root) is True:
+        keep.append(_root.idx_event)
 
     for item in _events:
-        if item.idx_event in [1, last, penultimate]:
+        if item.idx_event in keep:
             continue
         else:
             delete(item.idx_event)
+
+
+def purge_background():
+    """Purge events in a background thread.
+
+    Args:
+        None
+
+    Returns:
+        result: True if a purge was started
+
+    """
+    # Initialize key variables
+    global _PURGER
+
+    # Only one purge runs at a time
+    if bool(_PURGER) is True and _PURGER.is_alive() is True:
+        log_message = "Previous purge of events is still running."
+        log.log2info(2057, log_message)
+        return False
+
+    # Purge
+    _PURGER = threading.Thread(target=purge, daemon=True)
+    _PURGER.start()
+    return True
+
+
+def _delete_children(idx, batch=_PURGE_BATCH):
+    """Delete the rows of an event from its child tables.
+
+    Rows are deleted a batch at a time, with each batch committed
+    separately, so that tables are never locked for long. Children are
+    deleted before their parents so that cascading deletes have nothing to
+    do. The event row is deleted last, so interrupted deletions are
+    completed by the next purge.
+
+    Args:
+        idx: idx_event
+        batch: Maximum number of rows deleted by each statement
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    ts_start = time.time()
+    total = 0
+
+    # Get the parents of the rows to delete
+    idx_zones = _children(Zone.idx_zone, Zone.idx_event, [idx], batch)
+    idx_devices = _children(
+        Device.idx_device, Device.idx_zone, idx_zones, batch
+    )
+    idx_l1interfaces = _children(
+        L1Interface.idx_l1interface, L1Interface.idx_device, idx_devices, batch
+    )
+    idx_macs = _children(Mac.idx_mac, Mac.idx_zone, idx_zones, batch)
+
+    # Delete children before their parents
+    for key, column, idxs in [
+        (VlanPort.idx_vlanport, VlanPort.idx_l1interface, idx_l1interfaces),
+        (MacPort.idx_macport, MacPort.idx_l1interface, idx_l1interfaces),
+        (IpPort.idx_ipport, IpPort.idx_l1interface, idx_l1interfaces),
+        (L1Interface.idx_l1interface, L1Interface.idx_device, idx_devices),
+        (Vlan.idx_vlan, Vlan.idx_device, idx_devices),
+        (ChangeLog.idx_changelog, ChangeLog.idx_device, idx_devices),
+        (Device.idx_device, Device.idx_zone, idx_zones),
+        (MacIp.idx_macip, MacIp.idx_mac, idx_macs),
+        (Mac.idx_mac, Mac.idx_zone, idx_zones),
+        (Ip.idx_ip, Ip.idx_zone, idx_zones),
+        (Zone.idx_zone, Zone.idx_event, [idx]),
+    ]:
+        count = _delete_rows(key, column, idxs, batch)
+        total += count
+
+        # Log progress
+        if bool(count) is True:
+            log_message = (
+                "Purged {} rows of event {} from table {}. {}s duration"
+                "".format(
+                    count,
+                    idx,
+                    key.class_.__tablename__,
+                    round(time.time() - ts_start, 1),
+                )
+            )
+            log.log2debug(2058, log_message)
+
+    # Log
+    log_message = "Purged {} rows of event {}. {}s duration".format(
+        total, idx, round(time.time() - ts_start, 1)
+    )
+    log.log2info(2059, log_message)
+
+
+def _children(key, column, idxs, batch=_PURGE_BATCH):
+    """Get the primary keys of rows with parents in a list.
+
+    Args:
+        key: Primary key column of the child table
+        column: Foreign key column of the child table
+        idxs: List of primary keys of the parent table
+        batch: Maximum number of parents queried at a time
+
+    Returns:
+        result: List of primary keys
+
+    """
+    # Initialize key variables
+    result = []
+
+    # Get rows from database
+    for index in range(0, len(idxs), batch):
+        statement = select(key).where(column.in_(idxs[index : index + batch]))
+        rows = db.db_select(2060, statement)
+        result.extend([getattr(_, key.key) for _ in rows])
+
+    # Return
+    return result
+
+
+def _delete_rows(key, column, idxs, batch=_PURGE_BATCH):
+    """Delete rows with parents in a list, a batch at a time.
+
+    Args:
+        key: Primary key column of the child table
+        column: Foreign key column of the child table
+        idxs: List of primary keys of the parent table
+        batch: Maximum number of rows deleted by each statement
+
+    Returns:
+        result: Number of rows deleted
+
+    """
+    # Initialize key variables
+    result = 0
+
+    # Delete
+    for index in range(0, len(idxs), batch):
+        parents = idxs[index : index + batch]
+        while True:
+            # Get the next batch of rows
+            statement = select(key).where(column.in_(parents)).limit(batch)
+            rows = db.db_select(2061, statement)
+            primaries = [getattr(_, key.key) for _ in rows]
+            if bool(primaries) is False:
+                break
+
+            # Delete them
+            statement = _delete(key.class_).where(key.in_(primaries))
+            result += db.db_delete(2062, statement)
+            if len(primaries) < batch:
+                break
+
+    # Return
+    return result
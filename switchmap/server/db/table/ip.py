@@ -136,6 +136,64 @@ def findip(idx_zone, ips):
     return result
 
 
+def idx_ips(idx_zones):
+    """Get the primary keys of all IP addresses in zones.
+
+    Args:
+        idx_zones: List of zone indexes
+
+    Returns:
+        result: Dict of Ip.idx_ip values keyed by (idx_zone, IP address)
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = select(Ip.idx_zone, Ip.address, Ip.idx_ip).where(
+            Ip.idx_zone.in_(list(set(idx_zones)))
+        )
+        rows = db.db_select(2039, statement)
+
+    # Return
+    for row in rows:
+        if bool(row.address) is True:
+            result[(row.idx_zone, row.address.decode())] = row.idx_ip
+    return result
+
+
+def ips(idx_zones, addresses=None):
+    """Get all the IP addresses in zones.
+
+    Args:
+        idx_zones: List of zone indexes
+        addresses: Only get these IP addresses if not None
+
+    Returns:
+        result: List of RIp tuples
+
+    """
+    # Initialize key variables
+    result = []
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = select(Ip).where(Ip.idx_zone.in_(list(set(idx_zones))))
+        if addresses is not None:
+            statement = statement.where(
+                Ip.address.in_(list(set([_.encode() for _ in addresses])))
+            )
+        rows = db.db_select_row(2052, statement)
+
+    # Return
+    for row in rows:
+        result.append(_rows.ip(row))
+    return result
+
+
 def insert_row(rows):
     """Create a Ip table entry.
 
@@ -163,7 +221,7 @@ def insert_row(rows):
 
         # Do the insertion
         inserts.append(
-            Ip(
+            dict(
                 idx_zone=row.idx_zone,
                 hostname=(
                     null()
@@ -178,7 +236,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1065, inserts)
+        db.db_insert(1065, Ip, inserts)
 
 
 def update_row(idx, row):
@@ -1,12 +1,16 @@
 """Module for querying the IpPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, tuple_, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import IpPort
+from switchmap.server.db.models import Ip
 from switchmap.server.db.misc import rows as _rows
 
+# Maximum number of mappings deleted per statement
+_DELETE_CHUNK = 1000
+
 
 def idx_exists(idx):
     """Determine whether primary key exists.
@@ -88,6 +92,35 @@ def find_idx_ip(idx_ip):
     return result
 
 
+def pairs(idx_zones):
+    """Get all the IP address to port mappings in zones.
+
+    Args:
+        idx_zones: List of zone indexes
+
+    Returns:
+        result: Set of (idx_l1interface, idx_ip) tuples
+
+    """
+    # Initialize key variables
+    result = set()
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = (
+            select(IpPort.idx_l1interface, IpPort.idx_ip)
+            .join(Ip, Ip.idx_ip == IpPort.idx_ip)
+            .where(Ip.idx_zone.in_(list(set(idx_zones))))
+        )
+        rows = db.db_select(2043, statement)
+
+    # Return
+    for row in rows:
+        result.add((row.idx_l1interface, row.idx_ip))
+    return result
+
+
 def insert_row(rows):
     """Create a IpPort table entry.
 
@@ -111,7 +144,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            IpPort(
+            dict(
                 idx_l1interface=row.idx_l1interface,
                 idx_ip=row.idx_ip,
                 enabled=int(bool(row.enabled) is True),
@@ -120,7 +153,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1063, inserts)
+        db.db_insert(1063, IpPort, inserts)
 
 
 def update_row(idx, row):
@@ -147,3 +180,24 @@ def update_row(idx, row):
         )
     )
     db.db_update(1070, statement)
+
+
+def delete_pairs(items):
+    """Delete IP address to port mappings.
+
+    Args:
+        items: List of (idx_l1interface, idx_ip) tuples
+
+    Returns:
+        None
+
+    """
+    # Delete a chunk at a time to keep statements small
+    items = list(items)
+    for index in range(0, len(items), _DELETE_CHUNK):
+        statement = _delete(IpPort).where(
+            tuple_(IpPort.idx_l1interface, IpPort.idx_ip).in_(
+                items[index : index + _DELETE_CHUNK]
+            )
+        )
+        db.db_delete(2054, statement)
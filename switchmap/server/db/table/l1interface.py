@@ -1,6 +1,6 @@
 """Module for querying the L1Interface table."""
 
-from sqlalchemy import select, update, and_, null, func
+from sqlalchemy import select, update, and_, null, func, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
@@ -152,7 +152,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            L1Interface(
+            dict(
                 idx_device=row.idx_device,
                 ifindex=row.ifindex,
                 duplex=null() if row.duplex is None else row.duplex,
@@ -218,7 +218,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1154, inserts)
+        db.db_insert(1154, L1Interface, inserts)
 
 
 def update_row(idx, row):
@@ -304,3 +304,25 @@ def update_row(idx, row):
         )
     )
     db.db_update(1112, statement)
+
+
+def delete_row(idxs):
+    """Delete L1Interface table entries.
+
+    Args:
+        idxs: List of idx_l1interface values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs) is True:
+        statement = _delete(L1Interface).where(
+            L1Interface.idx_l1interface.in_(idxs)
+        )
+        db.db_delete(2047, statement)
@@ -111,6 +111,39 @@ def findmac(idx_zone, macs):
     return result
 
 
+def idx_macs(idx_zones, macs=None):
+    """Get the primary keys of all MAC addresses in zones.
+
+    Args:
+        idx_zones: List of zone indexes
+        macs: Only get these MAC addresses if not None
+
+    Returns:
+        result: Dict of Mac.idx_mac values keyed by (idx_zone, MAC address)
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = select(Mac.idx_zone, Mac.mac, Mac.idx_mac).where(
+            Mac.idx_zone.in_(list(set(idx_zones)))
+        )
+        if macs is not None:
+            statement = statement.where(
+                Mac.mac.in_(list(set([_.encode() for _ in macs])))
+            )
+        rows = db.db_select(2038, statement)
+
+    # Return
+    for row in rows:
+        if bool(row.mac) is True:
+            result[(row.idx_zone, row.mac.decode())] = row.idx_mac
+    return result
+
+
 def insert_row(rows):
     """Create a Mac table entry.
 
@@ -147,7 +180,7 @@ def insert_row(rows):
 
         # Do the insertion
         inserts.append(
-            Mac(
+            dict(
                 idx_oui=idx_oui,
                 idx_zone=row.idx_zone,
                 mac=(null() if bool(mac) is False else mac.encode()),
@@ -157,7 +190,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1087, inserts)
+        db.db_insert(1087, Mac, inserts)
 
 
 def update_row(idx, row):
@@ -1,12 +1,16 @@
 """Module for querying the MacIp table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, tuple_, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import MacIp
+from switchmap.server.db.models import Mac
 from switchmap.server.db.misc import rows as _rows
 
+# Maximum number of mappings deleted per statement
+_DELETE_CHUNK = 1000
+
 
 def idx_exists(idx):
     """Determine whether primary key exists.
@@ -131,6 +135,35 @@ def exists(idx_mac, idx_ip):
 #     return result
 
 
+def pairs(idx_zones):
+    """Get all the MAC to IP address mappings in zones.
+
+    Args:
+        idx_zones: List of zone indexes
+
+    Returns:
+        result: Set of (idx_mac, idx_ip) tuples
+
+    """
+    # Initialize key variables
+    result = set()
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = (
+            select(MacIp.idx_mac, MacIp.idx_ip)
+            .join(Mac, Mac.idx_mac == MacIp.idx_mac)
+            .where(Mac.idx_zone.in_(list(set(idx_zones))))
+        )
+        rows = db.db_select(2040, statement)
+
+    # Return
+    for row in rows:
+        result.add((row.idx_mac, row.idx_ip))
+    return result
+
+
 def insert_row(rows):
     """Create a MacIp table entry.
 
@@ -154,7 +187,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            MacIp(
+            dict(
                 idx_ip=row.idx_ip,
                 idx_mac=row.idx_mac,
                 enabled=int(bool(row.enabled) is True),
@@ -163,7 +196,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1091, inserts)
+        db.db_insert(1091, MacIp, inserts)
 
 
 def update_row(idx, row):
@@ -190,3 +223,24 @@ def update_row(idx, row):
         )
     )
     db.db_update(1115, statement)
+
+
+def delete_pairs(items):
+    """Delete MAC to IP address mappings.
+
+    Args:
+        items: List of (idx_mac, idx_ip) tuples
+
+    Returns:
+        None
+
+    """
+    # Delete a chunk at a time to keep statements small
+    items = list(items)
+    for index in range(0, len(items), _DELETE_CHUNK):
+        statement = _delete(MacIp).where(
+            tuple_(MacIp.idx_mac, MacIp.idx_ip).in_(
+                items[index : index + _DELETE_CHUNK]
+            )
+        )
+        db.db_delete(2053, statement)
@@ -1,10 +1,11 @@
 """Module for querying the MacPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
 from switchmap.server.db.models import MacPort
+from switchmap.server.db.models import Mac
 from switchmap.server.db.misc import rows as _rows
 
 
@@ -88,6 +89,36 @@ def find_idx_mac(idx_mac):
     return result
 
 
+def ports(idx_zones):
+    """Find the ports on which the MAC addresses of zones have been found.
+
+    Args:
+        idx_zones: List of zone indexes
+
+    Returns:
+        result: Dict of lists of MacPort.idx_l1interface values keyed by
+            Mac.idx_mac
+
+    """
+    # Initialize key variables
+    result = {}
+    rows = []
+
+    # Get rows from database
+    if bool(idx_zones) is True:
+        statement = (
+            select(MacPort.idx_mac, MacPort.idx_l1interface)
+            .join(Mac, Mac.idx_mac == MacPort.idx_mac)
+            .where(Mac.idx_zone.in_(list(set(idx_zones))))
+        )
+        rows = db.db_select(2042, statement)
+
+    # Return
+    for row in rows:
+        result.setdefault(row.idx_mac, []).append(row.idx_l1interface)
+    return result
+
+
 def insert_row(rows):
     """Create a MacPort table entry.
 
@@ -111,7 +142,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            MacPort(
+            dict(
                 idx_l1interface=row.idx_l1interface,
                 idx_mac=row.idx_mac,
                 enabled=int(bool(row.enabled) is True),
@@ -120,7 +151,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1092, inserts)
+        db.db_insert(1092, MacPort, inserts)
 
 
 def update_row(idx, row):
@@ -147,3 +178,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1117, statement)
+
+
+def delete_row(idxs):
+    """Delete MacPort table entries.
+
+    Args:
+        idxs: List of idx_macport values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs) is True:
+        statement = _delete(MacPort).where(MacPort.idx_macport.in_(idxs))
+        db.db_delete(2050, statement)
@@ -104,7 +104,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Oui(
+            dict(
                 oui=(null() if bool(row.oui) is False else row.oui.encode()),
                 organization=(
                     null()
@@ -117,7 +117,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1096, inserts)
+        db.db_insert(1096, Oui, inserts)
 
 
 def update_row(idx, row):
@@ -1,6 +1,6 @@
 """Module for querying the Vlan table."""
 
-from sqlalchemy import select, update, null, and_
+from sqlalchemy import select, update, null, and_, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
@@ -108,7 +108,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            Vlan(
+            dict(
                 idx_device=row.idx_device,
                 vlan=null() if row.vlan is None else row.vlan,
                 name=null() if bool(row.name) is False else row.name.encode(),
@@ -119,7 +119,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1093, inserts)
+        db.db_insert(1093, Vlan, inserts)
 
 
 def update_row(idx, row):
@@ -150,3 +150,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1120, statement)
+
+
+def delete_row(idxs):
+    """Delete Vlan table entries.
+
+    Args:
+        idxs: List of idx_vlan values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs) is True:
+        statement = _delete(Vlan).where(Vlan.idx_vlan.in_(idxs))
+        db.db_delete(2048, statement)
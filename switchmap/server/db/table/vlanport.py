@@ -1,6 +1,6 @@
 """Module for querying the VlanPort table."""
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, delete as _delete
 
 # Import project libraries
 from switchmap.server.db import db
@@ -111,7 +111,7 @@ def insert_row(rows):
     # Create objects
     for row in rows:
         inserts.append(
-            VlanPort(
+            dict(
                 idx_l1interface=row.idx_l1interface,
                 idx_vlan=row.idx_vlan,
                 enabled=int(bool(row.enabled) is True),
@@ -120,7 +120,7 @@ def insert_row(rows):
 
     # Insert
     if bool(inserts):
-        db.db_add_all(1185, inserts)
+        db.db_insert(1185, VlanPort, inserts)
 
 
 def update_row(idx, row):
@@ -147,3 +147,23 @@ def update_row(idx, row):
         )
     )
     db.db_update(1187, statement)
+
+
+def delete_row(idxs):
+    """Delete VlanPort table entries.
+
+    Args:
+        idxs: List of idx_vlanport values
+
+    Returns:
+        None
+
+    """
+    # Create list
+    if isinstance(idxs, list) is False:
+        idxs = [idxs]
+
+    # Delete
+    if bool(idxs) is True:
+        statement = _delete(VlanPort).where(VlanPort.idx_vlanport.in_(idxs))
+        db.db_delete(2049, statement)
@@ -128,6 +128,86 @@ class Test_ConfigCore(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestConfigurationFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Create a configuration file
+        self._config = setup.Config(data.configtester(), randomizer=True)
+        self._config.save()
+        self._filepath = test_module.files.config_filepath()
+
+    def tearDown(self):
+        """Execute these steps after each test."""
+        # Cleanup
+        self._config.cleanup()
+        test_module.reload()
+
+    def _age(self, seconds):
+        """Make the configuration file older.
+
+        Args:
+            seconds: Number of seconds
+
+        Returns:
+            None
+
+        """
+        status = os.stat(self._filepath)
+        os.utime(
+            self._filepath,
+            ns=(
+                status.st_atime_ns - seconds * 10**9,
+                status.st_mtime_ns - seconds * 10**9,
+            ),
+        )
+
+    def test_reload(self):
+        """Testing function reload."""
+        # Cache the configuration
+        self._age(60)
+        first = test_module._read(self._filepath)
+        self.assertIs(test_module._read(self._filepath), first)
+
+        # The file is parsed again after a reload
+        test_module.reload()
+        second = test_module._read(self._filepath)
+        self.assertIsNot(second, first)
+        self.assertEqual(second, first)
+
+        # Reloading doesn't wait for the lock held by readers
+        with test_module._LOCK:
+            test_module.reload()
+        self.assertIsNot(test_module._read(self._filepath), second)
+
+    def test__read(self):
+        """Testing function _read."""
+        # Recently modified files are always parsed
+        first = test_module._read(self._filepath)
+        self.assertIsNot(test_module._read(self._filepath), first)
+
+        # Files are only parsed once while they are unchanged
+        self._age(60)
+        first = test_module._read(self._filepath)
+        self.assertIs(test_module._read(self._filepath), first)
+
+        # Changed files are parsed again
+        with open(self._filepath, "a") as f_handle:
+            f_handle.write("\nextra: value\n")
+        self._age(60)
+        result = test_module._read(self._filepath)
+        self.assertIsNot(result, first)
+        self.assertEqual(result["extra"], "value")
+
+
 if __name__ == "__main__":
     # Do the unit test
     unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Test the files module."""
+
+import unittest
+import tempfile
+import gzip
+import json
+import io
+import os
+import sys
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import files
+
+
+class TestCacheFiles(unittest.TestCase):
+    """Checks the cache file functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    data = {
+        "misc": {"host": "switch-01", "zone": "default"},
+        "layer1": {"1": {"ifAlias": "uplink", "ifSpeed": 1000}},
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of another test module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Test setup."""
+        # Create a directory for the cache files
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Test cleanup."""
+        # Delete the directory
+        self.directory.cleanup()
+
+    def test_cache_format(self):
+        """Testing function cache_format."""
+        # Test
+        expected = [
+            ("host-01.json", "json"),
+            ("host-01.JSON.GZ", "json.gz"),
+            ("host-01.yaml", "yaml"),
+            ("host-01.json.gz.tmp", None),
+            ("host-01.txt", None),
+        ]
+        for filepath, value in expected:
+            self.assertEqual(files.cache_format(filepath), value)
+
+    def test_read_cache_file(self):
+        """Testing function read_cache_file."""
+        # Test every format. Keys must be converted to integers
+        for item in files.CACHE_FORMATS:
+            filepath = os.path.join(
+                self.directory.name, "host-01.{}".format(item)
+            )
+            files.write_cache_file(filepath, self.data)
+            result = files.read_cache_file(filepath)
+            self.assertEqual(result["misc"], self.data["misc"])
+            self.assertEqual(result["layer1"][1]["ifSpeed"], 1000)
+
+        # Test a corrupt file
+        filepath = os.path.join(self.directory.name, "host-02.json.gz")
+        with open(filepath, "w") as f_handle:
+            f_handle.write("{")
+        self.assertEqual(files.read_cache_file(filepath, die=False), {})
+        with self.assertRaises(SystemExit):
+            files.read_cache_file(filepath)
+
+    def test_write_cache_file(self):
+        """Testing function write_cache_file."""
+        # Test. No temporary file is left behind
+        filepath = os.path.join(self.directory.name, "host-01.json")
+        files.write_cache_file(filepath, self.data)
+        self.assertEqual(os.listdir(self.directory.name), ["host-01.json"])
+        with open(filepath) as f_handle:
+            self.assertNotIn(" ", f_handle.read())
+
+        # Test an unknown format
+        with self.assertRaises(SystemExit):
+            files.write_cache_file(
+                os.path.join(self.directory.name, "host-01.txt"), self.data
+            )
+
+    def test_write_cache_stream(self):
+        """Testing function write_cache_stream."""
+        # Initialize key variables
+        plain = json.dumps(self.data).encode()
+        compressed = gzip.compress(plain)
+
+        # Test every format with compressed and uncompressed data
+        for item in files.CACHE_FORMATS:
+            for value in [plain, compressed]:
+                filepath = os.path.join(
+                    self.directory.name, "host-01.{}".format(item)
+                )
+                result = files.write_cache_stream(
+                    filepath,
+                    io.BytesIO(value),
+                    compressed=bool(value == compressed),
+                )
+                self.assertTrue(result)
+                result = files.read_cache_file(filepath)
+                self.assertEqual(result["misc"], self.data["misc"])
+                self.assertEqual(result["layer1"][1]["ifSpeed"], 1000)
+
+        # Test truncated compressed data. No file is left behind
+        filepath = os.path.join(self.directory.name, "host-02.json")
+        result = files.write_cache_stream(
+            filepath, io.BytesIO(compressed[:-10]), compressed=True
+        )
+        self.assertFalse(result)
+        self.assertFalse(os.path.exists(filepath))
+        self.assertFalse(os.path.exists("{}.tmp".format(filepath)))
+
+        # Test truncated and mismatched uncompressed data
+        for item in files.CACHE_FORMATS:
+            filepath = os.path.join(
+                self.directory.name, "host-03.{}".format(item)
+            )
+            for value, misc in [
+                (plain[:-10], None),
+                (plain, {"host": "host-04"}),
+            ]:
+                result = files.write_cache_stream(
+                    filepath, io.BytesIO(value), misc=misc
+                )
+                self.assertFalse(result)
+                self.assertFalse(os.path.exists(filepath))
+                self.assertFalse(os.path.exists("{}.tmp".format(filepath)))
+
+            # Data of the expected device is written
+            result = files.write_cache_stream(
+                filepath, io.BytesIO(plain), misc=self.data["misc"]
+            )
+            self.assertTrue(result)
+            self.assertTrue(os.path.exists(filepath))
+
+    def test__validate_cache(self):
+        """Testing function _validate_cache."""
+        # Test
+        self.assertIsNone(files._validate_cache(self.data))
+        self.assertIsNone(
+            files._validate_cache(self.data, misc=self.data["misc"])
+        )
+        with self.assertRaises(ValueError):
+            files._validate_cache([self.data])
+        with self.assertRaises(ValueError):
+            files._validate_cache({}, misc={"host": "host-01"})
+        with self.assertRaises(ValueError):
+            files._validate_cache(self.data, misc={"zone": "other"})
+
+    def test_move_cache_files(self):
+        """Testing function move_cache_files."""
+        # Create files
+        filenames = ["host-01.json", "host-02.json.gz", "host-03.yaml"]
+        for filename in filenames + ["host-04.json.tmp"]:
+            with open(
+                os.path.join(self.directory.name, filename), "w"
+            ) as f_handle:
+                f_handle.write("{}")
+
+        # Test. Partially written files aren't moved
+        with tempfile.TemporaryDirectory() as dst:
+            files.move_cache_files(self.directory.name, dst)
+            self.assertEqual(sorted(os.listdir(dst)), filenames)
+            self.assertEqual(
+                os.listdir(self.directory.name), ["host-04.json.tmp"]
+            )
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Test the rest module."""
+
+import unittest
+import threading
+import gzip
+import json
+import os
+import sys
+from unittest.mock import patch, MagicMock
+from collections import namedtuple
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import rest
+from switchmap.core.log import ExceptionWrapper
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    data = {
+        "misc": {"host": "switch-01", "zone": "default"},
+        "layer1": {"Gi1/0/{}".format(_): {"ifIndex": _} for _ in range(5000)},
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of another test module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_post(self):
+        """Testing function post."""
+        # Initialize key variables
+        config = MagicMock()
+        config.server_username.return_value = None
+        config.server_url_root.return_value = "http://localhost:7000"
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+
+        # Test a compressed post
+        with patch.object(rest, "_session", return_value=session):
+            result = rest.post("post", self.data, config, compress=True)
+        self.assertTrue(result.success)
+        self.assertEqual(session.post.call_count, 1)
+        kwargs = session.post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        body = gzip.decompress(b"".join(kwargs["data"]))
+        self.assertEqual(json.loads(body), self.data)
+
+        # Test a server that rejects compressed posts
+        session.reset_mock()
+        session.post.side_effect = [
+            MagicMock(status_code=415),
+            MagicMock(status_code=200),
+        ]
+        with patch.object(rest, "_session", return_value=session):
+            result = rest.post("post", self.data, config, compress=True)
+        self.assertTrue(result.success)
+        self.assertEqual(session.post.call_count, 2)
+        self.assertEqual(session.post.call_args.kwargs["json"], self.data)
+
+        # Compression is attempted again on the next post
+        session.reset_mock()
+        session.post.side_effect = None
+        with patch.object(rest, "_session", return_value=session):
+            result = rest.post("post", self.data, config, compress=True)
+        self.assertTrue(result.success)
+        self.assertEqual(session.post.call_count, 1)
+        kwargs = session.post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+
+        # Other bad requests aren't posted again uncompressed
+        session.reset_mock()
+        session.post.side_effect = [
+            MagicMock(status_code=400, text="Invalid data"),
+        ]
+        with patch.object(rest, "_session", return_value=session):
+            result = rest.post("post", self.data, config, compress=True)
+        self.assertFalse(result.success)
+        self.assertEqual(session.post.call_count, 1)
+
+    def test__rejected(self):
+        """Testing function _rejected."""
+        # Initialize key variables
+        Post = namedtuple("Post", "success response")
+
+        # Test
+        self.assertTrue(
+            rest._rejected(Post(False, MagicMock(status_code=415, text="")))
+        )
+        self.assertTrue(
+            rest._rejected(
+                Post(
+                    False,
+                    MagicMock(
+                        status_code=400, text="Unsupported Content-Encoding"
+                    ),
+                )
+            )
+        )
+        self.assertFalse(
+            rest._rejected(
+                Post(False, MagicMock(status_code=400, text="Invalid data"))
+            )
+        )
+        self.assertFalse(
+            rest._rejected(Post(False, MagicMock(status_code=500, text="")))
+        )
+        self.assertFalse(
+            rest._rejected(Post(True, MagicMock(status_code=200, text="")))
+        )
+        self.assertFalse(rest._rejected(ExceptionWrapper(Exception())))
+
+    def test__session(self):
+        """Testing function _session."""
+        # Sessions are reused by the same thread
+        session = rest._session()
+        self.assertIs(rest._session(), session)
+
+        # Other threads get their own session
+        result = []
+        thread = threading.Thread(target=lambda: result.append(rest._session()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(result[0], session)
+
+    def test_post_batch(self):
+        """Testing function post_batch."""
+        # Initialize key variables
+        config = MagicMock()
+        config.server_username.return_value = None
+        config.server_url_root.return_value = "http://localhost:7000"
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        items = [self.data, {"misc": {"host": "switch-02"}}]
+
+        # Test
+        with patch.object(rest, "_session", return_value=session):
+            result = rest.post_batch("batch", iter(items), config, True, True)
+        self.assertTrue(result.success)
+        kwargs = session.post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        body = gzip.decompress(b"".join(kwargs["data"])).decode()
+        self.assertEqual([json.loads(_) for _ in body.splitlines()], items)
+
+    def test__encoded(self):
+        """Testing function _encoded."""
+        # Test. Large documents are compressed a chunk at a time
+        chunks = list(rest._encoded([self.data], compress=True))
+        self.assertGreater(len(chunks), 1)
+        body = gzip.decompress(b"".join(chunks))
+        self.assertNotIn(b" ", body)
+        self.assertEqual(json.loads(body), self.data)
+
+        # Test newline delimited documents
+        items = [{"a": 1}, {"b": [1, 2]}]
+        result = b"".join(rest._encoded(items, delimiter="\n"))
+        self.assertEqual(result, b'{"a":1}\n{"b":[1,2]}\n')
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
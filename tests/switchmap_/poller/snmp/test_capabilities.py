@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Test the capabilities module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.snmp import capabilities as testimport
+
+_SYSOBJECTID = ".1.3.6.1.4.1.9.1.1208"
+_OID = ".1.3.6.1.2.1.2.2.1.1"
+
+
+class TestCapabilities(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_enabled(self):
+        """Testing function enabled."""
+        # Test
+        cache = testimport.Capabilities("localhost", ConfigPoller())
+        self.assertTrue(cache.enabled())
+
+    def test_validate(self):
+        """Testing function validate."""
+        # Initialize key variables
+        hostname = "capability-validate"
+        config = ConfigPoller()
+
+        # Populate the cache
+        cache = testimport.Capabilities(hostname, config)
+        cache.validate(_SYSOBJECTID, 100000)
+        cache.set(_OID, True)
+        cache.save()
+
+        # The cache must survive a reload
+        cache = testimport.Capabilities(hostname, config)
+        cache.validate(_SYSOBJECTID, 101000)
+        self.assertTrue(cache.get(_OID))
+
+        # The cache is discarded if the device changes
+        cache = testimport.Capabilities(hostname, config)
+        cache.validate(".1.3.6.1.4.1.2636.1.1.1.2.29", 101000)
+        self.assertIsNone(cache.get(_OID))
+
+    def test_get(self):
+        """Testing function get."""
+        # Test
+        cache = testimport.Capabilities("capability-get", ConfigPoller())
+        cache.validate(_SYSOBJECTID, 100)
+        self.assertIsNone(cache.get(_OID))
+        cache.set(_OID, False)
+        self.assertFalse(cache.get(_OID))
+
+    def test_set(self):
+        """Testing function set."""
+        # Test
+        cache = testimport.Capabilities("capability-set", ConfigPoller())
+        cache.validate(_SYSOBJECTID, 100)
+        cache.set(_OID, 1)
+        self.assertEqual(cache.get(_OID), True)
+
+    def test_save(self):
+        """Testing function save."""
+        # Initialize key variables
+        hostname = "capability-save"
+        config = ConfigPoller()
+
+        # Test
+        cache = testimport.Capabilities(hostname, config)
+        cache.validate(_SYSOBJECTID, 100)
+        cache.set(_OID, True)
+        cache.save()
+        self.assertTrue(os.path.isfile(cache._filename))
+
+
+class TestCapabilitiesFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__fresh(self):
+        """Testing function _fresh."""
+        # Initialize key variables
+        now = int(time.time())
+        ttl = 3600
+        data = {
+            "sysobjectid": _SYSOBJECTID,
+            "boottime": now - 1000,
+            "timestamp": now - 100,
+            "oids": {_OID: True},
+        }
+
+        # Valid
+        self.assertTrue(
+            testimport._fresh(data, _SYSOBJECTID, now - 1000, now, ttl)
+        )
+
+        # Device changed
+        self.assertFalse(testimport._fresh(data, ".1.3", now - 1000, now, ttl))
+
+        # Device rebooted
+        self.assertFalse(
+            testimport._fresh(data, _SYSOBJECTID, now - 50, now, ttl)
+        )
+
+        # Cache expired
+        self.assertFalse(
+            testimport._fresh(data, _SYSOBJECTID, now - 1000, now + ttl, ttl)
+        )
+
+        # No data
+        self.assertFalse(
+            testimport._fresh({}, _SYSOBJECTID, now - 1000, now, ttl)
+        )
+        self.assertFalse(testimport._fresh(data, _SYSOBJECTID, None, now, ttl))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
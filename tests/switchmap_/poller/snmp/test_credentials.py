@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Test the credentials module."""
+
+import unittest
+import os
+import sys
+import sqlite3
+from unittest.mock import patch
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.core import files
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.snmp import credentials as testimport
+
+
+class TestStore(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_group(self):
+        """Testing function group."""
+        # Test
+        store = testimport.Store(ConfigPoller())
+        self.assertIsNone(store.group("store-group"))
+        store.succeeded("store-group", "group")
+        self.assertEqual(store.group("store-group"), "group")
+
+    def test_last_success(self):
+        """Testing function last_success."""
+        # Test
+        store = testimport.Store(ConfigPoller())
+        self.assertIsNone(store.last_success("store-last"))
+        store.succeeded("store-last", "group", now=1000)
+        self.assertEqual(store.last_success("store-last"), 1000)
+
+    def test_succeeded(self):
+        """Testing function succeeded."""
+        # Initialize key variables
+        hostname = "store-succeeded"
+        store = testimport.Store(ConfigPoller())
+
+        # Success replaces the group and clears its failures
+        store.succeeded(hostname, "group1", now=1000)
+        store.failed(hostname, "group2", now=1000)
+        store.succeeded(hostname, "group2", now=2000)
+        self.assertEqual(store.group(hostname), "group2")
+        self.assertEqual(store.last_success(hostname), 2000)
+        self.assertTrue(store.retry(hostname, "group2", now=1000))
+
+        # Updates must be visible to other stores
+        self.assertEqual(
+            testimport.Store(ConfigPoller()).group(hostname), "group2"
+        )
+
+    def test_failed(self):
+        """Testing function failed."""
+        # Initialize key variables
+        store = testimport.Store(ConfigPoller())
+
+        # The backoff doubles after each failure up to the maximum
+        backoff = testimport._BACKOFF
+        for _ in range(10):
+            store.failed("store-failed", "group", now=0)
+            self.assertFalse(
+                store.retry("store-failed", "group", now=backoff - 1)
+            )
+            self.assertTrue(store.retry("store-failed", "group", now=backoff))
+            backoff = min(backoff * 2, testimport._BACKOFF_MAXIMUM)
+
+    def test_retry(self):
+        """Testing function retry."""
+        # Test
+        store = testimport.Store(ConfigPoller())
+        self.assertTrue(store.retry("store-retry", "group"))
+        store.failed("store-retry", "group", now=1000)
+        self.assertFalse(store.retry("store-retry", "group", now=1000))
+        self.assertTrue(store.retry("store-retry", "other", now=1000))
+
+    def test__migrate(self):
+        """Testing function _migrate."""
+        # Initialize key variables
+        hostname = "store-migrate"
+        config = ConfigPoller()
+        filename = files.snmp_file(hostname, config)
+        with open(filename, "w") as f_handle:
+            f_handle.write("legacy")
+
+        # Legacy files are imported and removed
+        store = testimport.Store(config)
+        self.assertEqual(store.group(hostname), "legacy")
+        self.assertFalse(os.path.isfile(filename))
+        self.assertEqual(store.group(hostname), "legacy")
+
+    def test__query(self):
+        """Testing function _query."""
+        pass
+
+    def test__update(self):
+        """Testing function _update."""
+        pass
+
+
+class TestCredentialsFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of the other test class
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test__connect(self):
+        """Testing function _connect."""
+        # Test
+        filename = files.credentials_file(ConfigPoller())
+        connection = testimport._connect(filename)
+        self.assertIsNot(testimport._connect(filename), connection)
+        self.assertEqual(
+            connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "ORDER BY name"
+            ).fetchall(),
+            [("credentials",), ("failures",)],
+        )
+        connection.close()
+
+        # Store operations don't leave connections open
+        connections = []
+
+        def _connect(filename):
+            """Record the connections to the store.
+
+            Args:
+                filename: Name of the store's database file
+
+            Returns:
+                result: sqlite3 Connection object
+
+            """
+            # Return
+            result = connect(filename)
+            connections.append(result)
+            return result
+
+        connect = testimport._connect
+        store = testimport.Store(ConfigPoller())
+        with patch.object(testimport, "_connect", side_effect=_connect):
+            store.succeeded("host1", "group1")
+            self.assertEqual(store.group("host1"), "group1")
+        self.assertEqual(len(connections), 2)
+        for connection in connections:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Test the repetitions module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from collections import namedtuple
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.snmp import repetitions as testimport
+
+_VARIABLE = namedtuple("_VARIABLE", "oid oid_index value")
+
+
+class _ConfigPoller(ConfigPoller):
+    """ConfigPoller with adaptive bulkwalks enabled."""
+
+    def bulkwalk_adaptive(self):
+        """Get bulkwalk_adaptive.
+
+        Args:
+            None
+
+        Returns:
+            result: True
+
+        """
+        return True
+
+    def bulkwalk_max_pdu_size(self):
+        """Get bulkwalk_max_pdu_size.
+
+        Args:
+            None
+
+        Returns:
+            result: 8192
+
+        """
+        return 8192
+
+    def bulkwalk_max_repetitions(self):
+        """Get bulkwalk_max_repetitions.
+
+        Args:
+            None
+
+        Returns:
+            result: 40
+
+        """
+        return 40
+
+
+def _results(rows, value="0"):
+    """Create simulated bulkwalk results.
+
+    Args:
+        rows: Number of rows
+        value: Value of each row
+
+    Returns:
+        result: List of simulated easysnmp SNMPVariable results
+
+    """
+    # Return
+    result = [
+        _VARIABLE(oid=".1.3.6.1.2.1.2.2.1.1", oid_index=str(_), value=value)
+        for _ in range(rows)
+    ]
+    return result
+
+
+class TestRepetitions(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_adaptive(self):
+        """Testing function adaptive."""
+        # Test
+        tuning = testimport.Repetitions("localhost", _ConfigPoller())
+        self.assertTrue(tuning.adaptive())
+
+    def test_value(self):
+        """Testing function value."""
+        # Test
+        tuning = testimport.Repetitions("repetitions-value", _ConfigPoller())
+        self.assertEqual(tuning.value(), 40)
+
+    def test_success(self):
+        """Testing function success."""
+        # Initialize key variables
+        tuning = testimport.Repetitions("repetitions-success", _ConfigPoller())
+
+        # Walks that fit in a single response teach nothing
+        tuning.success(40, _results(10), 0.01)
+        self.assertEqual(tuning.value(), 40)
+
+        # Slow responses teach nothing
+        tuning.success(40, _results(400), 10)
+        self.assertEqual(tuning.value(), 40)
+
+        # Fast responses grow the value
+        tuning.success(40, _results(400), 0.1)
+        self.assertEqual(tuning.value(), 60)
+
+        # Growth is limited by the PDU size
+        tuning.success(60, _results(400, value="x" * 1000), 0.1)
+        self.assertEqual(tuning.value(), 60)
+
+    def test_backoff(self):
+        """Testing function backoff."""
+        # Initialize key variables
+        tuning = testimport.Repetitions("repetitions-backoff", _ConfigPoller())
+
+        # The value is halved and can't grow back to the failed value
+        self.assertTrue(tuning.backoff(40))
+        self.assertEqual(tuning.value(), 20)
+        tuning.success(20, _results(400), 0.1)
+        self.assertEqual(tuning.value(), 30)
+        tuning.success(30, _results(400), 0.1)
+        self.assertEqual(tuning.value(), 39)
+
+        # Values are never lower than the minimum
+        for _ in range(10):
+            tuning.backoff(tuning.value())
+        self.assertEqual(tuning.value(), testimport._MINIMUM)
+        self.assertFalse(tuning.backoff(testimport._MINIMUM))
+
+    def test_backoff_timeout(self):
+        """Testing function backoff after timeouts."""
+        # Initialize key variables
+        hostname = "repetitions-backoff-timeout"
+        config = _ConfigPoller()
+        tuning = testimport.Repetitions(hostname, config)
+
+        # Timeouts halve the value
+        for _ in range(3):
+            self.assertTrue(tuning.backoff(tuning.value(), timeout=True))
+        self.assertEqual(tuning.value(), testimport._MINIMUM)
+        tuning.save()
+
+        # The value recovers once the device responds quickly again
+        tuning = testimport.Repetitions(hostname, config)
+        for _ in range(10):
+            tuning.success(tuning.value(), _results(1000), 0.1)
+        self.assertGreater(tuning.value(), 40)
+
+    def test_smaller(self):
+        """Testing function smaller."""
+        # Test. The value isn't changed
+        tuning = testimport.Repetitions("repetitions-smaller", _ConfigPoller())
+        self.assertEqual(tuning.smaller(40), 20)
+        self.assertEqual(tuning.smaller(8), testimport._MINIMUM)
+        self.assertIsNone(tuning.smaller(testimport._MINIMUM))
+        self.assertEqual(tuning.value(), 40)
+
+    def test_save(self):
+        """Testing function save."""
+        # Initialize key variables
+        hostname = "repetitions-save"
+        config = _ConfigPoller()
+
+        # Test
+        tuning = testimport.Repetitions(hostname, config)
+        tuning.backoff(40)
+        tuning.save()
+        self.assertTrue(os.path.isfile(tuning._filename))
+
+        # The learned value must survive a reload
+        tuning = testimport.Repetitions(hostname, config)
+        self.assertEqual(tuning.value(), 20)
+        tuning.success(20, _results(400), 0.1)
+        tuning.success(30, _results(400), 0.1)
+        self.assertEqual(tuning.value(), 39)
+
+    def test__load(self):
+        """Testing function _load."""
+        pass
+
+
+class TestRepetitionsFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__varbind_size(self):
+        """Testing function _varbind_size."""
+        # Test
+        result = testimport._varbind_size(
+            _VARIABLE(oid=".1.3.6", oid_index="1", value="abc")
+        )
+        self.assertEqual(result, 6 + 1 + 3 + testimport._VARBIND_OVERHEAD)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
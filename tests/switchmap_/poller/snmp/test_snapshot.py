@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Test the snapshot module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+from collections import defaultdict
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller.snmp import snapshot as testimport
+
+_SYSOBJECTID = ".1.3.6.1.4.1.9.1.1208"
+_IFLASTCHANGE = {1: 100, 2: 2000}
+
+
+def _layer1():
+    """Create layer 1 data.
+
+    Args:
+        None
+
+    Returns:
+        result: Layer 1 data
+
+    """
+    # Return
+    result = defaultdict(lambda: defaultdict(dict))
+    result[1]["ifName"] = "Gi1/1"
+    result[2]["ifName"] = "Gi1/2"
+    result[2]["ifLastChange"] = 2000
+    return result
+
+
+class TestSnapshot(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_layer1(self):
+        """Testing function layer1."""
+        # Initialize key variables
+        hostname = "snapshot-layer1"
+        config = ConfigPoller()
+        expected = {
+            1: {"ifName": "Gi1/1"},
+            2: {"ifName": "Gi1/2", "ifLastChange": 2000},
+        }
+
+        # Nothing to reuse on the first poll
+        snapshot = testimport.Snapshot(hostname, config)
+        self.assertIsNone(snapshot.layer1(_SYSOBJECTID, 5000, _IFLASTCHANGE))
+        snapshot.save(_layer1())
+
+        # Unchanged interfaces
+        snapshot = testimport.Snapshot(hostname, config)
+        result = snapshot.layer1(_SYSOBJECTID, 9000, _IFLASTCHANGE)
+        self.assertEqual(result, expected)
+
+        # Changed interface
+        snapshot = testimport.Snapshot(hostname, config)
+        self.assertIsNone(
+            snapshot.layer1(_SYSOBJECTID, 9000, {1: 100, 2: 8000})
+        )
+
+        # Rebooted device
+        snapshot = testimport.Snapshot(hostname, config)
+        self.assertIsNone(snapshot.layer1(_SYSOBJECTID, 10, _IFLASTCHANGE))
+
+    def test_save(self):
+        """Testing function save."""
+        # Initialize key variables
+        snapshot = testimport.Snapshot("snapshot-save", ConfigPoller())
+
+        # Nothing is saved if the state of the device is unknown
+        snapshot.save(_layer1())
+        self.assertFalse(os.path.isfile(snapshot._filename))
+
+        # Test
+        snapshot.layer1(_SYSOBJECTID, 5000, _IFLASTCHANGE)
+        snapshot.save(_layer1())
+        self.assertTrue(os.path.isfile(snapshot._filename))
+
+
+class TestSnapshotFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__unchanged(self):
+        """Testing function _unchanged."""
+        # Initialize key variables
+        now = int(time.time())
+        refresh = 3600
+        data = {
+            "version": testimport._VERSION,
+            "sysobjectid": _SYSOBJECTID,
+            "sysuptime": 5000,
+            "iflastchange": _IFLASTCHANGE,
+            "timestamp": now - 100,
+            "layer1": {1: {"ifName": "Gi1/1"}},
+        }
+        state = {
+            "version": testimport._VERSION,
+            "sysobjectid": _SYSOBJECTID,
+            "sysuptime": 9000,
+            "iflastchange": _IFLASTCHANGE,
+        }
+
+        # Unchanged
+        self.assertTrue(testimport._unchanged(data, state, now, refresh))
+
+        # Snapshot expired
+        self.assertFalse(
+            testimport._unchanged(data, state, now + refresh, refresh)
+        )
+
+        # Device changed, rebooted or had an interface change
+        for key, value in [
+            ("version", testimport._VERSION + 1),
+            ("sysobjectid", ".1.3"),
+            ("sysuptime", 10),
+            ("sysuptime", None),
+            ("iflastchange", {1: 100}),
+            ("iflastchange", {}),
+        ]:
+            _state = dict(state)
+            _state[key] = value
+            self.assertFalse(testimport._unchanged(data, _state, now, refresh))
+
+        # No data
+        self.assertFalse(testimport._unchanged({}, state, now, refresh))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
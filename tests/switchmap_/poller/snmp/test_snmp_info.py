@@ -46,6 +46,98 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from unittest.mock import patch, Mock, call
+from switchmap.poller.snmp import snmp_info as testimport
+
+
+class _Layer1QueryA:
+    """Mock MIB query class supporting layer1."""
+
+    def __init__(self, snmp_object):
+        """Instantiate the class.
+
+        Args:
+            snmp_object: SNMP Interact class object
+
+        Returns:
+            None
+
+        """
+        self.snmp_object = snmp_object
+
+    def supported(self):
+        """Return device's support for the MIB.
+
+        Args:
+            None
+
+        Returns:
+            result: True
+
+        """
+        return True
+
+    def layer1(self):
+        """Get layer 1 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer 1 data
+
+        """
+        return {1: {"ifName": "Gi1/1", "ifAlias": "A"}}
+
+
+class _Layer1QueryB(_Layer1QueryA):
+    """Mock MIB query class supporting layer1."""
+
+    def layer1(self):
+        """Get layer 1 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer 1 data
+
+        """
+        return {1: {"ifAlias": "B"}, 2: {"ifName": "Gi1/2"}}
+
+
+class _Layer1QueryUnsupported(_Layer1QueryA):
+    """Mock MIB query class not supported by the device."""
+
+    def supported(self):
+        """Return device's support for the MIB.
+
+        Args:
+            None
+
+        Returns:
+            result: False
+
+        """
+        return False
+
+
+class _Layer1QueryMacs(_Layer1QueryA):
+    """Mock MIB query class of the forwarding database."""
+
+    macs = []
+
+    def layer1(self):
+        """Get layer 1 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer 1 data
+
+        """
+        return {1: {"l1_macs": self.macs}}
 
 
 class TestSnmpInfo(unittest.TestCase):
@@ -81,7 +173,97 @@ class TestSnmpInfo(unittest.TestCase):
 
     def test_everything(self):
         """Testing function everything."""
-        pass
+        # Initialize key variables
+        static = {1: {"ifName": "Gi1/1"}}
+        volatile = {1: {"l1_macs": ["001122334455"]}}
+        snmp_object = Mock()
+        snmp_object.hostname.return_value = "localhost"
+        snmp_object.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1208"
+        snmp_object.sysuptime.return_value = 9000
+        snmp_object.swalk.return_value = {"1": 100}
+        snapshot = Mock()
+        query = testimport.Query(snmp_object, snapshot=snapshot)
+
+        # Only the volatile layer 1 data is polled if the interfaces are
+        # unchanged
+        snapshot.layer1.return_value = static
+        with patch.object(
+            query, "_execute", return_value={"layer1": volatile}
+        ) as execute:
+            result = query.everything()
+        execute.assert_called_once_with(
+            ["layer1", "layer2", "layer3", "system"], volatile=True
+        )
+        self.assertEqual(
+            result["layer1"],
+            {1: {"ifName": "Gi1/1", "l1_macs": ["001122334455"]}},
+        )
+        snapshot.layer1.assert_called_with(
+            ".1.3.6.1.4.1.9.1.1208", 9000, {1: 100}
+        )
+        snapshot.save.assert_not_called()
+
+        # The interface data is polled and saved otherwise
+        snapshot.layer1.return_value = None
+        with patch.object(
+            query,
+            "_execute",
+            side_effect=[{"layer1": static}, {"layer1": volatile}],
+        ) as execute:
+            result = query.everything()
+        self.assertEqual(
+            execute.call_args_list,
+            [
+                call(["layer1"], volatile=False),
+                call(["layer1", "layer2", "layer3", "system"], volatile=True),
+            ],
+        )
+        snapshot.save.assert_called_once_with(static)
+
+        # Everything is polled without a snapshot
+        query = testimport.Query(snmp_object)
+        with patch.object(
+            query, "_execute", return_value={"layer1": static}
+        ) as execute:
+            result = query.everything()
+        execute.assert_called_once_with(
+            ["layer1", "layer2", "layer3", "system"]
+        )
+        self.assertEqual(result["layer1"], static)
+
+    def test_everything_volatile(self):
+        """Testing function everything refreshing volatile layer 1 data."""
+        # Initialize key variables
+        snmp_object = Mock()
+        snmp_object.hostname.return_value = "localhost"
+        snmp_object.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1208"
+        snmp_object.sysuptime.return_value = 9000
+        snmp_object.swalk.return_value = {"1": 100}
+        snapshot = Mock()
+        snapshot.layer1.return_value = {1: {"ifName": "Gi1/1", "ifAlias": "A"}}
+        query = testimport.Query(snmp_object, snapshot=snapshot)
+
+        # The forwarding database is refreshed while no interface changed
+        with patch.object(
+            testimport, "VOLATILE", (_Layer1QueryMacs,)
+        ), patch.object(
+            testimport,
+            "get_queries",
+            side_effect=lambda layer: (
+                [_Layer1QueryA, _Layer1QueryMacs] if layer == "layer1" else []
+            ),
+        ), patch.object(
+            _Layer1QueryA, "layer1"
+        ) as interfaces:
+            for macs in [["001122334455"], ["66778899aabb"]]:
+                _Layer1QueryMacs.macs = macs
+                result = query.everything()
+                self.assertEqual(
+                    result["layer1"],
+                    {1: {"ifName": "Gi1/1", "ifAlias": "A", "l1_macs": macs}},
+                )
+        interfaces.assert_not_called()
+        snapshot.save.assert_not_called()
 
     def test_misc(self):
         """Testing function misc."""
@@ -103,6 +285,31 @@ class TestSnmpInfo(unittest.TestCase):
         """Testing function layer3."""
         pass
 
+    def test__unchanged_layer1(self):
+        """Testing function _unchanged_layer1."""
+        pass
+
+    def test__execute(self):
+        """Testing function _execute."""
+        # Initialize key variables
+        plans = [
+            [_Layer1QueryA, _Layer1QueryUnsupported, _Layer1QueryB],
+            [_Layer1QueryUnsupported],
+        ]
+        expected = [
+            {1: {"ifName": "Gi1/1", "ifAlias": "B"}, 2: {"ifName": "Gi1/2"}},
+            None,
+        ]
+
+        # Results must be the same regardless of the parallelism and must
+        # be merged in the order of the plan
+        for parallelism in [1, 3]:
+            for plan, _expected in zip(plans, expected):
+                with patch.object(testimport, "get_queries", return_value=plan):
+                    query = testimport.Query(None, parallelism=parallelism)
+                    result = query._execute(["layer1"])
+                self.assertEqual(result, {"layer1": _expected})
+
     def test__add_data(self):
         """Testing function _add_data."""
         pass
@@ -123,6 +330,24 @@ class TestSnmpInfo(unittest.TestCase):
         """Testing function _add_system."""
         pass
 
+    def test__merge_system(self):
+        """Testing function _merge_system."""
+        # Initialize key variables
+        target = testimport.defaultdict(lambda: testimport.defaultdict(dict))
+        target["SNMPv2-MIB"]["sysName"] = {0: "a"}
+        source = {
+            "SNMPv2-MIB": {"sysName": {0: "b"}, "sysDescr": {0: "c"}},
+            "IF-MIB": {"ifStackStatus": {1: 1}},
+        }
+        expected = {
+            "SNMPv2-MIB": {"sysName": {0: "b"}, "sysDescr": {0: "c"}},
+            "IF-MIB": {"ifStackStatus": {1: 1}},
+        }
+
+        # Test
+        result = testimport._merge_system(source, target)
+        self.assertEqual(result, expected)
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -46,6 +46,24 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
+from switchmap.poller import POLL, POLLING_OPTIONS, SNMP
+from switchmap.poller.snmp import snmp_manager as testimport
+
+_AUTHORIZATION = SNMP(
+    enabled=True,
+    group="PmAygbwzg8rcJSeA",
+    authpassword=None,
+    authprotocol=None,
+    community="9YqCMGnn599bre9W",
+    port=161,
+    privpassword=None,
+    privprotocol=None,
+    secname=None,
+    version=2,
+)
 
 
 class TestSnmpManagerValidate(unittest.TestCase):
@@ -87,6 +105,59 @@ class TestSnmpManagerValidate(unittest.TestCase):
         """Testing function _credentials."""
         pass
 
+    def test_validation(self):
+        """Testing function validation."""
+        # Initialize key variables
+        good = _AUTHORIZATION._replace(group="good")
+        slow = _AUTHORIZATION._replace(group="slow")
+        bad = _AUTHORIZATION._replace(group="bad")
+        disabled = _AUTHORIZATION._replace(group="disabled", enabled=False)
+        validate = testimport.Validate(
+            POLLING_OPTIONS(
+                hostname="validation-host",
+                authorizations=[bad, slow, disabled, good],
+            )
+        )
+
+        def _contactable(authorization):
+            """Simulate probing the device.
+
+            Args:
+                authorization: SNMP object
+
+            Returns:
+                result: True if contactable
+
+            """
+            if authorization.group == "slow":
+                time.sleep(2)
+            if authorization.group == "good":
+                time.sleep(0.2)
+            return authorization.group in ["good", "slow"]
+
+        with patch.object(
+            validate, "_contactable", side_effect=_contactable
+        ) as probe:
+            # The first group that works is used without waiting for the
+            # slower probes
+            start = time.time()
+            self.assertEqual(validate.validation(), good)
+            self.assertLess(time.time() - start, 1.5)
+            self.assertEqual(probe.call_count, 3)
+
+            # Specific groups
+            self.assertEqual(validate.validation(group="slow"), slow)
+            self.assertIsNone(validate.validation(group="disabled"))
+
+            # Failed groups aren't probed until their backoff expires
+            probe.reset_mock()
+            self.assertEqual(validate.validation(), good)
+            self.assertNotIn(bad, [_.args[0] for _ in probe.call_args_list])
+
+    def test__contactable(self):
+        """Testing function _contactable."""
+        pass
+
 
 class TestSnmpManagerInteract(unittest.TestCase):
     """Checks all methods."""
@@ -119,6 +190,70 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test___enter__(self):
+        """Testing function __enter__."""
+        # Test
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION)
+        )
+        with interact as result:
+            self.assertEqual(result, interact)
+
+    def test___exit__(self):
+        """Testing function __exit__."""
+        # Test
+        with patch.object(testimport, "_Session"):
+            with testimport.Interact(
+                POLL(hostname="localhost", authorization=_AUTHORIZATION)
+            ) as interact:
+                interact._session()
+                self.assertEqual(len(interact._sessions), 1)
+        self.assertEqual(len(interact._sessions), 0)
+
+    def test_close(self):
+        """Testing function close."""
+        # Test
+        with patch.object(testimport, "_Session"):
+            interact = testimport.Interact(
+                POLL(hostname="localhost", authorization=_AUTHORIZATION)
+            )
+            interact._session()
+            interact._session(context_name="vlan-10")
+            self.assertEqual(len(interact._sessions), 2)
+            interact.close()
+            self.assertEqual(len(interact._sessions), 0)
+
+    def test_session_stats(self):
+        """Testing function session_stats."""
+        # Test
+        with patch.object(testimport, "_Session"):
+            interact = testimport.Interact(
+                POLL(hostname="localhost", authorization=_AUTHORIZATION)
+            )
+            self.assertEqual(interact.session_stats(), (0, 0))
+            interact._session()
+            interact._session()
+            interact._session(context_name="vlan-10")
+            self.assertEqual(interact.session_stats(), (2, 1))
+
+    def test__session(self):
+        """Testing function _session."""
+        # Test
+        with patch.object(testimport, "_Session") as mock_session:
+            interact = testimport.Interact(
+                POLL(hostname="localhost", authorization=_AUTHORIZATION)
+            )
+
+            # Sessions with the same context must be reused
+            session_a = interact._session()
+            session_b = interact._session()
+            self.assertEqual(session_a, session_b)
+            self.assertEqual(mock_session.call_count, 1)
+
+            # New contexts get new sessions
+            interact._session(context_name="vlan-10")
+            self.assertEqual(mock_session.call_count, 2)
+
     def test_enterprise_number(self):
         """Testing function enterprise_number."""
         pass
@@ -135,8 +270,50 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function sysobjectid."""
         pass
 
+    def test_sysuptime(self):
+        """Testing function sysuptime."""
+        pass
+
     def test_oid_exists(self):
         """Testing function oid_exists."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.2.2.1.1"
+        capabilities = Mock()
+        capabilities.enabled.return_value = True
+        capabilities.get.return_value = None
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION),
+            capabilities=capabilities,
+        )
+
+        # Probe results must be cached
+        with patch.object(
+            interact, "_oid_exists", return_value=True
+        ), patch.object(interact, "sysobjectid"), patch.object(
+            interact, "sysuptime"
+        ):
+            self.assertTrue(interact.oid_exists(oid))
+        capabilities.set.assert_called_once_with(oid, True)
+
+        # Cached results must not be probed
+        capabilities.get.return_value = False
+        with patch.object(interact, "_oid_exists") as mock_probe:
+            self.assertFalse(interact.oid_exists(oid))
+            mock_probe.assert_not_called()
+
+        # Context specific probes are never cached
+        with patch.object(
+            interact, "_oid_exists", return_value=True
+        ) as mock_probe:
+            self.assertTrue(interact.oid_exists(oid, context_name="vlan-1"))
+            mock_probe.assert_called_once()
+
+    def test__capability_cache(self):
+        """Testing function _capability_cache."""
+        pass
+
+    def test__oid_exists(self):
+        """Testing function _oid_exists."""
         pass
 
     def test__oid_exists_get(self):
@@ -147,13 +324,115 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function _oid_exists_walk."""
         pass
 
+    def test_context_walk(self):
+        """Testing function context_walk."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.1"
+        contexts = ["", "vlan-1", "vlan-2", "vlan-3"]
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION),
+            context_parallelism=2,
+            context_timeout=1,
+        )
+
+        def _swalk(oid_to_get, normalized=False, context_name=""):
+            """Simulate a swalk that hangs for one context.
+
+            Args:
+                oid_to_get: OID to get
+                normalized: Normalize if True
+                context_name: Context name
+
+            Returns:
+                result: Simulated results
+
+            """
+            if context_name == "vlan-2":
+                time.sleep(4)
+            return {"{}.{}".format(oid_to_get, context_name): 1}
+
+        # The slow context must be skipped
+        with patch.object(interact, "swalk", side_effect=_swalk):
+            result = interact.context_walk(oid, contexts)
+        self.assertEqual(sorted(result.keys()), ["", "vlan-1", "vlan-3"])
+        self.assertEqual(result["vlan-1"], {"{}.vlan-1".format(oid): 1})
+
     def test_swalk(self):
         """Testing function swalk."""
         pass
 
     def test_walk(self):
         """Testing function walk."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.2.2.1.1"
+        values = {"{}.1".format(oid): 1, "{}.2".format(oid): 2}
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION)
+        )
+
+        # Each OID is walked once per poll
+        with patch.object(
+            interact, "query", return_value=(True, True, values)
+        ) as mock_query:
+            self.assertEqual(interact.walk(oid), values)
+            self.assertEqual(interact.swalk(oid), values)
+            self.assertEqual(mock_query.call_count, 1)
+
+            # Different contexts and normalization are walked separately
+            interact.walk(oid, normalized=True)
+            interact.walk(oid, context_name="vlan-10")
+            self.assertEqual(mock_query.call_count, 3)
+
+        # Failed walks aren't cached
+        interact.close()
+        with patch.object(
+            interact, "query", return_value=(None, None, {})
+        ) as mock_query:
+            interact.swalk(oid)
+            interact.swalk(oid)
+            self.assertEqual(mock_query.call_count, 2)
+
+    def test_walk_stats(self):
+        """Testing function walk_stats."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.2.2.1.1"
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION)
+        )
+
+        # Test
+        with patch.object(interact, "query", return_value=(True, True, {})):
+            interact.walk(oid)
+            interact.walk(oid)
+            interact.walk(oid)
+        self.assertEqual(interact.walk_stats(), (2, 1))
+
+        # Concurrent walks of an OID wait for the walk already in progress
+        def _query(oid_to_get, **kwargs):
+            """Walk an OID slowly.
+
+            Args:
+                oid_to_get: OID to walk
+                kwargs: Keyword arguments of Interact.query
+
+            Returns:
+                result: Tuple of (contactable, validity, results)
+
+            """
+            # Return
+            time.sleep(0.2)
+            result = (True, True, {oid_to_get: 1})
+            return result
+
+        interact.close()
+        with patch.object(interact, "query", side_effect=_query) as mock_query:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(lambda _: interact.walk(oid), range(4))
+                )
+        self.assertEqual(mock_query.call_count, 1)
+        self.assertEqual(results, [{oid: 1}] * 4)
+        self.assertEqual(interact.walk_stats(), (5, 2))
 
     def test_get(self):
         """Testing function get."""
@@ -163,6 +442,64 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function query."""
         pass
 
+    def test__bulkwalk(self):
+        """Testing function _bulkwalk."""
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.1"
+        repetitions = Mock()
+        repetitions.value.return_value = 40
+        repetitions.smaller.return_value = 20
+        repetitions.backoff.return_value = True
+        session = Mock()
+        session.bulkwalk.side_effect = [
+            testimport.exceptions.EasySNMPTimeoutError("timeout"),
+            ["result"],
+        ]
+        interact = testimport.Interact(
+            POLL(hostname="localhost", authorization=_AUTHORIZATION),
+            repetitions=repetitions,
+        )
+
+        # The walk is retried with the reduced value after a timeout
+        result = interact._bulkwalk(session, oid)
+        self.assertEqual(result, ["result"])
+        repetitions.backoff.assert_called_once_with(40, timeout=True)
+        session.bulkwalk.assert_called_with(
+            oid, non_repeaters=0, max_repetitions=20
+        )
+        self.assertEqual(repetitions.success.call_args[0][:2], (20, ["result"]))
+
+        # Unreachable hosts are only retried once and nothing is learned
+        repetitions.reset_mock()
+        session.bulkwalk.reset_mock()
+        session.bulkwalk.side_effect = (
+            testimport.exceptions.EasySNMPTimeoutError("timeout")
+        )
+        with self.assertRaises(testimport.exceptions.EasySNMPTimeoutError):
+            interact._bulkwalk(session, oid)
+        self.assertEqual(session.bulkwalk.call_count, 2)
+        repetitions.backoff.assert_not_called()
+
+        # tooBig errors are retried with the reduced value
+        repetitions.value.side_effect = [40, 20]
+        session.bulkwalk.side_effect = [SystemError("tooBig"), ["result"]]
+        self.assertEqual(interact._bulkwalk(session, oid), ["result"])
+        repetitions.backoff.assert_called_once_with(40)
+
+        # Errors are raised if the value can't be reduced
+        repetitions.value.side_effect = None
+        repetitions.value.return_value = 5
+        repetitions.smaller.return_value = None
+        repetitions.backoff.return_value = False
+        session.bulkwalk.side_effect = (
+            testimport.exceptions.EasySNMPTimeoutError("timeout")
+        )
+        with self.assertRaises(testimport.exceptions.EasySNMPTimeoutError):
+            interact._bulkwalk(session, oid)
+        session.bulkwalk.side_effect = SystemError("tooBig")
+        with self.assertRaises(SystemError):
+            interact._bulkwalk(session, oid)
+
 
 class TestSnmpManagerSession(unittest.TestCase):
     """Checks all methods."""
@@ -243,6 +580,23 @@ class TestSnmpManagerFunctions(unittest.TestCase):
         """Testing function _process_error."""
         pass
 
+    def test__oversized(self):
+        """Testing function _oversized."""
+        # Test
+        self.assertTrue(
+            testimport._oversized(
+                testimport.exceptions.EasySNMPTimeoutError("timed out")
+            )
+        )
+        self.assertTrue(
+            testimport._oversized(SystemError("error: Response too big"))
+        )
+        self.assertFalse(
+            testimport._oversized(
+                testimport.exceptions.EasySNMPNoSuchNameError("no such name")
+            )
+        )
+
     def test__format_results(self):
         """Testing function _format_results."""
         pass
@@ -255,10 +609,6 @@ class TestSnmpManagerFunctions(unittest.TestCase):
         """Testing function _oid_valid_format."""
         pass
 
-    def test__update_cache(self):
-        """Testing function _update_cache."""
-        pass
-
 
 if __name__ == "__main__":
     # Do the unit test
@@ -63,6 +63,41 @@ class Test_ConfigPoller(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_bulkwalk_adaptive(self):
+        """Testing function bulkwalk_adaptive."""
+        # Run test
+        expected = True
+        result = self.config.bulkwalk_adaptive()
+        self.assertEqual(result, expected)
+
+    def test_bulkwalk_max_pdu_size(self):
+        """Testing function bulkwalk_max_pdu_size."""
+        # Run test
+        expected = 8192
+        result = self.config.bulkwalk_max_pdu_size()
+        self.assertEqual(result, expected)
+
+    def test_bulkwalk_max_repetitions(self):
+        """Testing function bulkwalk_max_repetitions."""
+        # Run test
+        expected = 40
+        result = self.config.bulkwalk_max_repetitions()
+        self.assertEqual(result, expected)
+
+    def test_capability_cache_ttl(self):
+        """Testing function capability_cache_ttl."""
+        # Run test
+        expected = 43200
+        result = self.config.capability_cache_ttl()
+        self.assertEqual(result, expected)
+
+    def test_host_polling_intervals(self):
+        """Testing function host_polling_intervals."""
+        # Run test
+        expected = {"hostname1": 60, "hostnameA": 1800}
+        result = self.config.host_polling_intervals()
+        self.assertEqual(result, expected)
+
     def test_polling_interval(self):
         """Testing function polling_interval."""
         # Run test
@@ -70,6 +105,62 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_polling_concurrency(self):
+        """Testing function polling_concurrency."""
+        # Run test
+        expected = 250
+        result = self.config.polling_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_polling_context_parallelism(self):
+        """Testing function polling_context_parallelism."""
+        # Run test
+        expected = 12
+        result = self.config.polling_context_parallelism()
+        self.assertEqual(result, expected)
+
+    def test_polling_context_timeout(self):
+        """Testing function polling_context_timeout."""
+        # Run test
+        expected = 90
+        result = self.config.polling_context_timeout()
+        self.assertEqual(result, expected)
+
+    def test_polling_device_timeout(self):
+        """Testing function polling_device_timeout."""
+        # Run test
+        expected = 1200
+        result = self.config.polling_device_timeout()
+        self.assertEqual(result, expected)
+
+    def test_polling_engine(self):
+        """Testing function polling_engine."""
+        # Run test
+        expected = "asyncio"
+        result = self.config.polling_engine()
+        self.assertEqual(result, expected)
+
+    def test_polling_incremental(self):
+        """Testing function polling_incremental."""
+        # Run test
+        expected = True
+        result = self.config.polling_incremental()
+        self.assertEqual(result, expected)
+
+    def test_polling_incremental_refresh(self):
+        """Testing function polling_incremental_refresh."""
+        # Run test
+        expected = 7200
+        result = self.config.polling_incremental_refresh()
+        self.assertEqual(result, expected)
+
+    def test_polling_query_parallelism(self):
+        """Testing function polling_query_parallelism."""
+        # Run test
+        expected = 6
+        result = self.config.polling_query_parallelism()
+        self.assertEqual(result, expected)
+
     def test_server_address(self):
         """Testing function server_address."""
         # Run test
@@ -84,6 +175,27 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_bind_port()
         self.assertEqual(result, expected)
 
+    def test_server_batch_interval(self):
+        """Testing function server_batch_interval."""
+        # Run test
+        expected = 15
+        result = self.config.server_batch_interval()
+        self.assertEqual(result, expected)
+
+    def test_server_batch_size(self):
+        """Testing function server_batch_size."""
+        # Run test
+        expected = 50
+        result = self.config.server_batch_size()
+        self.assertEqual(result, expected)
+
+    def test_server_compression(self):
+        """Testing function server_compression."""
+        # Run test
+        expected = False
+        result = self.config.server_compression()
+        self.assertEqual(result, expected)
+
     def test_server_https(self):
         """Testing function server_https."""
         # Run test
@@ -112,6 +224,13 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_username()
         self.assertEqual(result, expected)
 
+    def test_spool_max_files(self):
+        """Testing function spool_max_files."""
+        # Run test
+        expected = 250
+        result = self.config.spool_max_files()
+        self.assertEqual(result, expected)
+
     def test_snmp_auth(self):
         """Testing function snmp_auth."""
         # Run test
@@ -159,13 +278,15 @@ class Test_ConfigPoller(unittest.TestCase):
             ZONE(
                 name="SITE-A",
                 hostnames=["hostname1", "hostname2", "hostname3"],
+                polling_interval=300,
             ),
             ZONE(
                 name="SITE-B",
                 hostnames=["hostnameA", "hostnameB", "hostnameC"],
+                polling_interval=None,
             ),
-            ZONE(name="SITE-C", hostnames=None),
-            ZONE(name=None, hostnames=None),
+            ZONE(name="SITE-C", hostnames=None, polling_interval=None),
+            ZONE(name=None, hostnames=None, polling_interval=None),
         ]
         result = self.config.zones()
         self.assertEqual(result, expected)
@@ -233,6 +354,26 @@ class Test_ConfigPoller(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestConfigurationFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__interval(self):
+        """Testing function _interval."""
+        # Test
+        self.assertEqual(test_module._interval(300), 300)
+        self.assertEqual(test_module._interval("300"), 300)
+        self.assertIsNone(test_module._interval(0))
+        self.assertIsNone(test_module._interval(None))
+        self.assertIsNone(test_module._interval("invalid"))
+
+
 if __name__ == "__main__":
     # Do the unit test
     unittest.main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Test the poll module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+import asyncio
+import threading
+from collections import namedtuple
+from multiprocessing import Process
+from unittest.mock import patch, Mock
+from switchmap.poller import poll as testimport
+from switchmap.poller import schedule
+
+_Zone = namedtuple("_Zone", "name hostnames polling_interval")
+
+
+def _device(poll):
+    """Simulate polling a device.
+
+    Args:
+        poll: _META object. The hostname is the poll's duration
+
+    Returns:
+        None
+
+    """
+    time.sleep(poll.hostname)
+
+
+class TestPoll(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_devices(self):
+        """Testing function devices."""
+        pass
+
+    def test__devices_multiprocessing(self):
+        """Testing function _devices_multiprocessing."""
+        # Initialize key variables
+        arguments = [
+            testimport._META(zone="TEST", hostname=_, config=None)
+            for _ in [0, 60, 0, 0, 0]
+        ]
+
+        # The hung device is killed and the other devices are polled
+        start = time.time()
+        with patch.object(testimport, "device", _device):
+            result = testimport._devices_multiprocessing(arguments, 2, 2)
+        self.assertEqual(result, [60])
+        self.assertLess(time.time() - start, 30)
+
+    def test__kill(self):
+        """Testing function _kill."""
+        # Test
+        process = Process(target=time.sleep, args=(60,))
+        process.start()
+        testimport._kill(process)
+        self.assertFalse(process.is_alive())
+
+    def test__devices(self):
+        """Testing function _devices."""
+        pass
+
+    def test_forkserver(self):
+        """Testing function forkserver."""
+        pass
+
+    def test_scheduled(self):
+        """Testing function scheduled."""
+        # Initialize key variables
+        config = Mock()
+        config.host_polling_intervals.return_value = {}
+        config.zones.return_value = [_Zone("TEST", ["host1"], None)]
+
+        # Test
+        self.assertFalse(testimport.scheduled(config))
+        config.zones.return_value = [_Zone("TEST", ["host1"], 60)]
+        self.assertTrue(testimport.scheduled(config))
+        config.zones.return_value = [_Zone("TEST", ["host1"], None)]
+        config.host_polling_intervals.return_value = {"host1": 60}
+        self.assertTrue(testimport.scheduled(config))
+
+    def test_scheduler(self):
+        """Testing function scheduler."""
+        # Initialize key variables
+        config = Mock()
+        config.polling_interval.return_value = 300
+        config.host_polling_intervals.return_value = {}
+        config.zones.return_value = [_Zone("TEST", ["host1"], None)]
+
+        # Each device is scheduled at its own interval
+        config.host_polling_intervals.return_value = {"host2": 60}
+        config.zones.return_value = [_Zone("TEST", ["host1", "host2"], None)]
+        result = testimport.scheduler(config)
+        self.assertEqual(
+            {_: result._jobs[_]["interval"] for _ in result.keys()},
+            {("TEST", "host1"): 300, ("TEST", "host2"): 60},
+        )
+
+        # Schedules are updated with the latest configuration
+        config.host_polling_intervals.return_value = {}
+        config.zones.return_value = [_Zone("TEST", ["host1", "host3"], None)]
+        self.assertIs(testimport.scheduler(config, result), result)
+        self.assertEqual(
+            sorted(result.keys()), [("TEST", "host1"), ("TEST", "host3")]
+        )
+        self.assertEqual(result._jobs[("TEST", "host1")]["item"].config, config)
+
+    def test__start(self):
+        """Testing function _start."""
+        pass
+
+    def test__reap(self):
+        """Testing function _reap."""
+        pass
+
+    def test_Dispatcher(self):
+        """Testing class Dispatcher."""
+        # Initialize key variables
+        config = Mock()
+        config.multiprocessing.return_value = True
+        config.polling_engine.return_value = "multiprocessing"
+        config.agent_subprocesses.return_value = 1
+        config.polling_device_timeout.return_value = 2
+        dispatcher = testimport.Dispatcher()
+        for hostname in [60, 0.5]:
+            dispatcher.schedule.add(
+                ("TEST", hostname),
+                testimport._META(zone="TEST", hostname=hostname, config=None),
+                3600,
+                now=0,
+            )
+
+        with patch.object(testimport, "device", _device):
+            # Polls are started without waiting for them, within the limit
+            start = time.time()
+            self.assertEqual(dispatcher.poll(config), 1)
+            self.assertLess(time.time() - start, 1)
+            self.assertEqual(dispatcher.busy(), 2)
+
+            # Devices still queued or being polled are skipped when due
+            self.assertEqual(dispatcher.schedule.due(now=start + 7200), [])
+
+            # Hung polls are killed at the deadline and marked as done
+            timed_out = []
+            while dispatcher.busy() > 0 and time.time() - start < 30:
+                timed_out.extend(dispatcher.reap(2))
+                dispatcher.poll(config)
+                time.sleep(0.1)
+        self.assertEqual(timed_out, [60])
+        self.assertEqual(dispatcher.schedule.busy(), 0)
+
+    def test__devices_asyncio(self):
+        """Testing function _devices_asyncio."""
+        # Initialize key variables
+        arguments = [
+            testimport._META(zone="TEST", hostname=_, config=None)
+            for _ in [0.5, 60, 0.5, 0.5]
+        ]
+
+        # Hung polls are reported and don't outlive their sub process,
+        # even when only one process is used
+        threads = threading.active_count()
+        start = time.time()
+        with patch.object(testimport, "device", _device):
+            self.assertEqual(testimport._devices_asyncio([], 1, 2, 1), [])
+            result = testimport._devices_asyncio(arguments, 1, 2, 1)
+        self.assertEqual(result, [60])
+        self.assertLessEqual(threading.active_count(), threads)
+        self.assertLess(time.time() - start, 30)
+
+    def test__poll_asyncio(self):
+        """Testing function _poll_asyncio."""
+        # Initialize key variables
+        polled = []
+
+        def _record(poll):
+            """Simulate polling a device and record the poll.
+
+            Args:
+                poll: _META object. The hostname is the poll's duration
+
+            Returns:
+                None
+
+            """
+            _device(poll)
+            polled.append(poll.hostname)
+
+        # More hung devices than can be polled at the same time. The
+        # deadline of queued devices starts when their poll starts
+        arguments = [
+            testimport._META(zone="TEST", hostname=_, config=None)
+            for _ in [60, 60, 60, 0.5, 0.5, 0.5]
+        ]
+        start = time.time()
+        with patch.object(testimport, "device", _record):
+            result = testimport._poll_asyncio(arguments, 2, 1)
+        self.assertEqual(result, [60, 60, 60])
+        self.assertEqual(polled, [0.5, 0.5, 0.5])
+        self.assertLess(time.time() - start, 30)
+
+    def test__async_devices(self):
+        """Testing function _async_devices."""
+        pass
+
+    def test__async_device(self):
+        """Testing function _async_device."""
+        pass
+
+    def test__thread(self):
+        """Testing function _thread."""
+
+        async def _test():
+            """Run functions in threads.
+
+            Args:
+                None
+
+            Returns:
+                None
+
+            """
+            # Test
+            self.assertEqual(await testimport._thread(max, [1, 2]), 2)
+            with self.assertRaises(ValueError):
+                await testimport._thread(int, "invalid")
+
+        asyncio.run(_test())
+
+    def test_device(self):
+        """Testing function device."""
+        pass
+
+    def test_cli_device(self):
+        """Testing function cli_device."""
+        pass
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Test the schedule module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.poller import schedule as testimport
+
+
+class TestSchedule(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_add(self):
+        """Testing function add."""
+        # Initialize key variables
+        now = 1000000
+        interval = 300
+        scheduler = testimport.Schedule()
+        keys = ["host{}".format(_) for _ in range(50)]
+
+        # Start times must be within the first interval and spread across it
+        for key in keys:
+            scheduler.add(key, key, interval, now=now)
+        dues = [scheduler._jobs[_]["due"] for _ in keys]
+        for due in dues:
+            self.assertTrue(now <= due < now + interval)
+        self.assertGreater(len(set(dues)), 25)
+
+        # Start times are stable
+        other = testimport.Schedule()
+        other.add("host1", "host1", interval, now=now + 7)
+        self.assertEqual(
+            other._jobs["host1"]["due"], scheduler._jobs["host1"]["due"]
+        )
+
+        # Scheduled devices keep their due time unless the interval changes
+        due = scheduler._jobs["host1"]["due"]
+        scheduler.add("host1", "new", interval, now=due + 1)
+        self.assertEqual(scheduler._jobs["host1"]["due"], due)
+        self.assertEqual(scheduler._jobs["host1"]["item"], "new")
+        scheduler.add("host1", "new", 60, now=due + 1)
+        self.assertEqual(scheduler._jobs["host1"]["interval"], 60)
+        self.assertGreater(scheduler._jobs["host1"]["due"], due + 1)
+
+    def test_remove(self):
+        """Testing function remove."""
+        # Test
+        scheduler = testimport.Schedule()
+        scheduler.add("host", "H", 60, now=0)
+        scheduler.remove("host")
+        scheduler.remove("unknown")
+        self.assertEqual(scheduler.keys(), [])
+
+    def test_keys(self):
+        """Testing function keys."""
+        # Test
+        scheduler = testimport.Schedule()
+        self.assertEqual(scheduler.keys(), [])
+        scheduler.add("host1", "H", 60, now=0)
+        scheduler.add("host2", "H", 60, now=0)
+        self.assertEqual(sorted(scheduler.keys()), ["host1", "host2"])
+
+    def test_due(self):
+        """Testing function due."""
+        # Initialize key variables
+        now = 1000000
+        scheduler = testimport.Schedule()
+        scheduler.add("fast", "F", 60, now=now)
+        scheduler.add("slow", "S", 3600, now=now)
+
+        # Each device is due once per interval
+        result = scheduler.due(now=now + 3600)
+        self.assertEqual(sorted(result), [("fast", "F"), ("slow", "S")])
+        self.assertEqual(scheduler.due(now=now + 3600), [])
+
+        # Devices still being polled are skipped
+        self.assertEqual(scheduler.due(now=now + 3660), [])
+        scheduler.done("fast")
+        self.assertEqual(scheduler.due(now=now + 3720), [("fast", "F")])
+
+    def test_done(self):
+        """Testing function done."""
+        # Test
+        scheduler = testimport.Schedule()
+        scheduler.add("host", "H", 60, now=0)
+        scheduler.due(now=60)
+        self.assertEqual(scheduler.busy(), 1)
+        scheduler.done("host")
+        scheduler.done("unknown")
+        self.assertEqual(scheduler.busy(), 0)
+
+    def test_busy(self):
+        """Testing function busy."""
+        # Test
+        scheduler = testimport.Schedule()
+        self.assertEqual(scheduler.busy(), 0)
+        scheduler.add("host", "H", 60, now=0)
+        scheduler.due(now=60)
+        self.assertEqual(scheduler.busy(), 1)
+
+    def test_wait(self):
+        """Testing function wait."""
+        # Test
+        scheduler = testimport.Schedule()
+        self.assertIsNone(scheduler.wait())
+        scheduler.add("host", "H", 60, now=0)
+        due = scheduler._jobs["host"]["due"]
+        self.assertEqual(scheduler.wait(now=due - 10), 10)
+        self.assertEqual(scheduler.wait(now=due + 10), 0)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""Test the spool module."""
+
+import unittest
+from unittest.mock import patch
+from collections import namedtuple
+import time
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.core import rest
+from switchmap.core import files
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.poller import spool as testimport
+
+Post = namedtuple("Post", "success response")
+Response = namedtuple("Response", "status_code")
+
+
+class _ConfigPoller(ConfigPoller):
+    """ConfigPoller with a small spool."""
+
+    def spool_max_files(self):
+        """Get spool_max_files.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of spooled devices
+
+        """
+        # Return
+        return 3
+
+
+class _ConfigPollerBatch(_ConfigPoller):
+    """ConfigPoller with a small spool that posts in batches."""
+
+    def server_batch_size(self):
+        """Get server_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of devices posted in each request
+
+        """
+        # Return
+        return 2
+
+    def server_batch_interval(self):
+        """Get server_batch_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of seconds data waits to be posted
+
+        """
+        # Return
+        return 60
+
+
+def _data(hostname, timestamp=1000):
+    """Create device data.
+
+    Args:
+        hostname: Hostname of the device
+        timestamp: Poll timestamp
+
+    Returns:
+        result: Device data
+
+    """
+    # Return
+    result = {
+        "misc": {"host": hostname, "zone": "default", "timestamp": timestamp},
+        "layer1": {1: {"ifAlias": "uplink"}},
+    }
+    return result
+
+
+class TestSpool(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of another test module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Test setup."""
+        # Empty the spool
+        self.spool = testimport.Spool(_ConfigPoller())
+        for filepath in self.spool.filepaths():
+            os.remove(filepath)
+
+    def _add(self, hostnames):
+        """Add devices to the spool, oldest first.
+
+        Args:
+            hostnames: List of hostnames
+
+        Returns:
+            None
+
+        """
+        # Add
+        for index, hostname in enumerate(hostnames):
+            self.spool.add(_data(hostname))
+            filepath = self.spool.filepaths()[-1]
+            os.utime(filepath, (time.time() - 100 + index,) * 2)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_add(self):
+        """Testing function add."""
+        # Test
+        self._add(["host1", "host2", "host3"])
+        self.assertEqual(len(self.spool.filepaths()), 3)
+
+        # Only the latest data of a device is kept
+        self.spool.add(_data("host1", timestamp=2000))
+        filepaths = self.spool.filepaths()
+        self.assertEqual(len(filepaths), 3)
+        self.assertIn("host1", os.path.basename(filepaths[-1]))
+
+        # The oldest device is discarded when the spool is full
+        self.spool.add(_data("host4"))
+        result = [os.path.basename(_) for _ in self.spool.filepaths()]
+        self.assertEqual(len(result), 3)
+        self.assertFalse([_ for _ in result if _.startswith("host2")])
+
+    def test_discard(self):
+        """Testing function discard."""
+        # Test
+        self._add(["host1", "host2"])
+        self.spool.discard(_data("host1"))
+        self.spool.discard(_data("host9"))
+        result = self.spool.filepaths()
+        self.assertEqual(len(result), 1)
+        self.assertIn("host2", os.path.basename(result[0]))
+
+    def test_filepaths(self):
+        """Testing function filepaths."""
+        # Test. Oldest files are first
+        self._add(["host3", "host1", "host2"])
+        result = [os.path.basename(_)[:5] for _ in self.spool.filepaths()]
+        self.assertEqual(result, ["host3", "host1", "host2"])
+
+    def test_drain(self):
+        """Testing function drain."""
+        # Initialize key variables
+        self._add(["host1", "host2", "host3"])
+        posted = []
+
+        def _post(uri, data, config, compress=False, params=None):
+            """Post data to a server that fails after two posts.
+
+            Args:
+                uri: URI for posting
+                data: Data to post
+                config: ConfigPoller object
+                compress: Compress the data if True
+                params: Dict of query string parameters
+
+            Returns:
+                result: Post named tuple
+
+            """
+            # Post
+            posted.append(data)
+            if len(posted) > 2:
+                return rest.ExceptionWrapper(Exception("Unreachable"))
+            return Post(success=True, response=Response(status_code=200))
+
+        # Test. Spooled data keeps its poll timestamp
+        with patch.object(testimport.rest, "post", side_effect=_post):
+            self.assertFalse(self.spool.drain())
+        self.assertEqual(
+            [_["misc"]["host"] for _ in posted], ["host1", "host2", "host3"]
+        )
+        self.assertEqual(posted[0]["misc"]["timestamp"], 1000)
+        result = self.spool.filepaths()
+        self.assertEqual(len(result), 1)
+        self.assertIn("host3", os.path.basename(result[0]))
+
+        # Data rejected by the server is discarded
+        with patch.object(
+            testimport.rest,
+            "post",
+            return_value=Post(success=False, response=Response(400)),
+        ):
+            self.assertTrue(self.spool.drain())
+        self.assertFalse(self.spool.filepaths())
+
+    def test_drain_replaced(self):
+        """Testing function drain with data spooled while posting."""
+        # Initialize key variables
+        self._add(["host1"])
+
+        def _post(uri, data, config, compress=False, params=None):
+            """Post data while a poll spools newer data of the device.
+
+            Args:
+                uri: URI for posting
+                data: Data to post
+                config: ConfigPoller object
+                compress: Compress the data if True
+                params: Dict of query string parameters
+
+            Returns:
+                result: Post named tuple
+
+            """
+            # Post
+            self.spool.add(_data("host1", timestamp=2000))
+            return Post(success=True, response=Response(status_code=200))
+
+        # Test. The newer data isn't deleted
+        with patch.object(testimport.rest, "post", side_effect=_post):
+            self.assertTrue(self.spool.drain())
+        result = self.spool.filepaths()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            files.read_cache_file(result[0])["misc"]["timestamp"], 2000
+        )
+
+    def test_ready(self):
+        """Testing function ready."""
+        # Test without batching
+        self.assertFalse(self.spool.ready())
+        self._add(["host1"])
+        self.assertTrue(self.spool.ready())
+
+        # Test with batching. The oldest file is 100s old
+        spool = testimport.Spool(_ConfigPollerBatch())
+        self.assertTrue(spool.ready())
+        self.spool.discard(_data("host1"))
+        self.spool.add(_data("host1"))
+        self.assertFalse(spool.ready())
+        self.spool.add(_data("host2"))
+        self.assertTrue(spool.ready())
+
+    def test__drain_batch(self):
+        """Testing function _drain_batch."""
+        # Initialize key variables
+        spool = testimport.Spool(_ConfigPollerBatch())
+        self._add(["host1", "host2", "host3"])
+        posted = []
+
+        def _post_batch(uri, items, config, compress=False):
+            """Post a batch of data.
+
+            Args:
+                uri: URI for posting
+                items: Iterable of data to post
+                config: ConfigPoller object
+                compress: Compress the data if True
+
+            Returns:
+                result: Post named tuple
+
+            """
+            # Post
+            posted.append([_["misc"]["host"] for _ in items])
+            return Post(success=True, response=Response(status_code=200))
+
+        # Test. Only the oldest batch is posted
+        with patch.object(
+            testimport.rest, "post_batch", side_effect=_post_batch
+        ):
+            self.assertTrue(spool.drain())
+        self.assertEqual(posted, [["host1", "host2"]])
+        self.assertEqual(len(spool.filepaths()), 1)
+
+        # Servers without a batch endpoint are sent one device at a time
+        with patch.object(
+            testimport.rest,
+            "post_batch",
+            return_value=Post(success=False, response=Response(404)),
+        ):
+            with patch.object(
+                testimport.rest,
+                "post",
+                return_value=Post(success=True, response=Response(200)),
+            ) as mock_post:
+                self.assertTrue(spool.drain())
+                self.assertTrue(spool.drain())
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertFalse(spool.filepaths())
+
+    def test__drain_batch_rejected(self):
+        """Testing function _drain_batch with a rejected batch."""
+        # Initialize key variables
+        spool = testimport.Spool(_ConfigPollerBatch())
+        self._add(["host1", "host2"])
+
+        def _post(uri, data, config, compress=False, params=None):
+            """Post data to a server that rejects host1.
+
+            Args:
+                uri: URI for posting
+                data: Data to post
+                config: ConfigPoller object
+                compress: Compress the data if True
+                params: Dict of query string parameters
+
+            Returns:
+                result: Post named tuple
+
+            """
+            # Post
+            code = 400 if data["misc"]["host"] == "host1" else 200
+            return Post(success=code == 200, response=Response(code))
+
+        # Test. The files are posted one at a time and only the rejected
+        # data is discarded
+        with patch.object(
+            testimport.rest,
+            "post_batch",
+            return_value=Post(success=False, response=Response(400)),
+        ):
+            with patch.object(
+                testimport.rest, "post", side_effect=_post
+            ) as mock_post:
+                self.assertTrue(spool.drain())
+        self.assertEqual(
+            [_.args[1]["misc"]["host"] for _ in mock_post.call_args_list],
+            ["host1", "host2"],
+        )
+        self.assertFalse(spool.filepaths())
+
+        # Batching is still used
+        self.assertTrue(spool._batching)
+
+    def test__stat(self):
+        """Testing function _stat."""
+        # Test
+        self._add(["host1"])
+        filepath = self.spool.filepaths()[0]
+        result = testimport._stat(filepath)
+        self.assertEqual(result, testimport._stat(filepath))
+        self.spool.add(_data("host1", timestamp=2000))
+        self.assertNotEqual(testimport._stat(filepath), result)
+        os.remove(filepath)
+        self.assertIsNone(testimport._stat(filepath))
+
+    def test__remove(self):
+        """Testing function _remove."""
+        # Initialize key variables
+        self._add(["host1"])
+        filepath = self.spool.filepaths()[0]
+        stat = testimport._stat(filepath)
+
+        # Files replaced while being posted are kept
+        self.spool.add(_data("host1", timestamp=2000))
+        testimport._remove(filepath, stat=stat)
+        self.assertTrue(os.path.isfile(filepath))
+
+        # Test
+        testimport._remove(filepath, stat=testimport._stat(filepath))
+        self.assertFalse(os.path.isfile(filepath))
+        testimport._remove(filepath)
+
+
+class TestSender(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of another test module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_cycle(self):
+        """Testing function cycle."""
+        # Initialize key variables
+        sender = testimport.Sender(_ConfigPoller())
+
+        # Wait for spooled data
+        with patch.object(testimport.Spool, "ready", return_value=False):
+            self.assertEqual(sender.cycle(), 30)
+            batcher = testimport.Sender(_ConfigPollerBatch())
+            self.assertEqual(batcher.cycle(), 1)
+
+        # Back off while the server is unavailable
+        patcher = patch.object(testimport.Spool, "ready", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with patch.object(testimport.Spool, "drain", return_value=False):
+            self.assertEqual(sender.cycle(), 60)
+            self.assertEqual(sender.cycle(), 120)
+            for _ in range(10):
+                sender.cycle()
+            self.assertEqual(sender.cycle(), 900)
+
+        # Drain without waiting while files remain
+        with patch.object(testimport.Spool, "drain", return_value=True):
+            with patch.object(
+                testimport.Spool, "filepaths", return_value=["file"]
+            ):
+                self.assertEqual(sender.cycle(), 0)
+            with patch.object(testimport.Spool, "filepaths", return_value=[]):
+                self.assertEqual(sender.cycle(), 30)
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted by the
+        # tearDownClass of another test module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_retry(self):
+        """Testing function retry."""
+        # Test
+        self.assertTrue(
+            testimport.retry(rest.ExceptionWrapper(Exception("Error")))
+        )
+        self.assertTrue(testimport.retry(Post(False, Response(503))))
+        self.assertFalse(testimport.retry(Post(False, Response(400))))
+        self.assertFalse(testimport.retry(Post(True, Response(200))))
+
+    def test_batching(self):
+        """Testing function batching."""
+        # Test
+        self.assertFalse(testimport.batching(_ConfigPoller()))
+        self.assertTrue(testimport.batching(_ConfigPollerBatch()))
+
+    def test__documents(self):
+        """Testing function _documents."""
+        # Test. Unreadable files are skipped
+        spool = testimport.Spool(_ConfigPoller())
+        for filepath in spool.filepaths():
+            os.remove(filepath)
+        spool.add(_data("host1"))
+        filepaths = spool.filepaths() + ["/nonexistent.json.gz"]
+        result = list(testimport._documents(filepaths))
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["misc"]["host"], "host1")
+        spool.discard(_data("host1"))
+
+    def test__filepath(self):
+        """Testing function _filepath."""
+        # Test
+        result = testimport._filepath(_data("host1"), _ConfigPoller())
+        self.assertTrue(result.endswith("host1-c21f9.json.gz"))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
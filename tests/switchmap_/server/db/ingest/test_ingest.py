@@ -3,7 +3,9 @@
 
 import os
 import sys
+import tempfile
 import unittest
+from unittest.mock import patch
 from copy import deepcopy
 
 
@@ -67,12 +69,22 @@ from switchmap.server.db.ingest import ingest
 from switchmap.server.db.table import zone
 from switchmap.server.db.table import oui
 from switchmap.server.db.table import event
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import ip
+from switchmap.server.db.table import macip
+from switchmap.server.db.table import root
 from switchmap.server.db import db
 from switchmap.server.db import models
 from switchmap.server.db.models import IpPort
 from switchmap.server.db.table import RIpPort
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IOui
+from switchmap.server.db.table import IRoot
+from switchmap.server.db.table import IIp
+from switchmap.server.db.table import IMac
+from switchmap.server import ZoneObjects
+from switchmap.server import PairMacIp
+from switchmap.core import files
 
 from tests.testlib_ import db as dblib
 from tests.testlib_ import data as datalib
@@ -224,6 +236,178 @@ class TestFunctions(unittest.TestCase):
 
         self.assertEqual(result[: self.max_loops * 3], expected)
 
+    def test__live_event(self):
+        """Testing function _live_event."""
+        # Test. Event 1 is never used for the live topology
+        _root = root.idx_exists(1)
+        self.assertEqual(_root.idx_event, 1)
+        result = ingest._live_event()
+        self.assertNotEqual(result.idx_event, 1)
+
+        # The event displayed by the API is updated
+        root.update_row(
+            _root.idx_root,
+            IRoot(idx_event=result.idx_event, name=_root.name, enabled=1),
+        )
+        self.assertEqual(ingest._live_event().idx_event, result.idx_event)
+
+    def test_process_zone(self):
+        """Testing function process_zone."""
+        # Initialize key variables
+        rows = ZoneObjects(ips=[], macs=[], pairmacips=[])
+
+        with tempfile.TemporaryDirectory() as directory:
+            # Test. The file is only read once
+            filepath = os.path.join(directory, "device.json")
+            files.write_cache_file(filepath, {"misc": {"zone": "zone1"}})
+            with patch.object(
+                ingest.update_zone, "process", return_value=rows
+            ) as process, patch.object(
+                ingest.files, "read_cache_file", wraps=files.read_cache_file
+            ) as read:
+                result = ingest.process_zone(filepath, CONFIG)
+            self.assertEqual(
+                result,
+                ingest.ZoneRows(name="zone1", filepath=filepath, rows=rows),
+            )
+            process.assert_called_once_with({"misc": {"zone": "zone1"}}, None)
+            read.assert_called_once()
+
+            # Unreadable files have no zone
+            filepath = os.path.join(directory, "invalid.json")
+            with open(filepath, "w") as fh_:
+                fh_.write("{")
+            self.assertIsNone(ingest.process_zone(filepath, CONFIG))
+
+    def test__zone_objects(self):
+        """Testing function _zone_objects."""
+        # Initialize key variables
+        rows = ZoneObjects(
+            ips=[IIp(None, "10.0.0.1", 4, None, 1)],
+            macs=[IMac(1, None, "001122334455", 1)],
+            pairmacips=[PairMacIp("001122334455", "10.0.0.1", 4, None)],
+        )
+
+        # Test
+        result = ingest._zone_objects(rows, 5)
+        self.assertEqual(result.ips, [IIp(5, "10.0.0.1", 4, None, 1)])
+        self.assertEqual(result.macs, [IMac(1, 5, "001122334455", 1)])
+        self.assertEqual(
+            result.pairmacips,
+            [PairMacIp("001122334455", "10.0.0.1", 4, 5)],
+        )
+
+    def test__get_zone(self):
+        """Testing function _get_zone."""
+        # Test. Existing zones are reused
+        _event = event.create()
+        name = data.random_string()
+        result = ingest._get_zone(_event, name)
+        self.assertEqual(result.name, name)
+        self.assertEqual(result.idx_event, _event.idx_event)
+        self.assertEqual(
+            ingest._get_zone(_event, name).idx_zone, result.idx_zone
+        )
+
+    def test_Lookup(self):
+        """Testing class Lookup."""
+        # Test
+        lookup = ingest.Lookup()
+        lookup.load([self.idx_zone])
+        self.assertEqual(lookup.idx_macs, mac.idx_macs([self.idx_zone]))
+        self.assertEqual(lookup.pairs, macip.pairs([self.idx_zone]))
+        self.assertEqual(
+            {_: lookup.idx_ip(_) for _ in lookup.ips},
+            ip.idx_ips([self.idx_zone]),
+        )
+
+        # Zones are only loaded once
+        with patch.object(ingest._mac, "idx_macs") as idx_macs:
+            lookup.load([self.idx_zone])
+        idx_macs.assert_not_called()
+
+        # Only the inserted rows are added
+        mac.insert_row(IMac(1, self.idx_zone, "00aabbccddee", 1))
+        ip.insert_row(IIp(self.idx_zone, "192.0.2.200", 4, None, 1))
+        lookup.inserted(
+            [(self.idx_zone, "00aabbccddee")], [(self.idx_zone, "192.0.2.200")]
+        )
+        self.assertEqual(lookup.idx_macs, mac.idx_macs([self.idx_zone]))
+        self.assertEqual(
+            lookup.idx_ip((self.idx_zone, "192.0.2.200")),
+            ip.idx_ips([self.idx_zone])[(self.idx_zone, "192.0.2.200")],
+        )
+        self.assertIsNone(lookup.idx_ip((self.idx_zone, "192.0.2.201")))
+
+    def test__ZoneWriter(self):
+        """Testing class _ZoneWriter."""
+        # Initialize key variables
+        batches = []
+
+        def _insert_arptable(rows, lookup=None):
+            """Record the rows written to the database.
+
+            Args:
+                rows: List of ZoneObjects
+                lookup: Lookup object
+
+            Returns:
+                result: List of PairMacIp objects
+
+            """
+            # Return
+            batches.append(rows)
+            return [_.pairmacips[0] for _ in rows]
+
+        # Test. Skipped files are ignored
+        items = [
+            ZoneObjects(ips=[], macs=[], pairmacips=[index])
+            for index in range(5)
+        ]
+        with patch.object(
+            ingest, "insert_arptable", side_effect=_insert_arptable
+        ):
+            writer = ingest._ZoneWriter(batch=2)
+            writer.start()
+            for item in items[:2] + [None] + items[2:]:
+                writer.queue.put(item)
+            writer.queue.put(ingest._DONE)
+            writer.join()
+        self.assertEqual(batches, [items[:2], items[2:4], items[4:]])
+        self.assertEqual(writer.pairmacips, list(range(5)))
+        self.assertIsNone(writer.error)
+
+        # Superseded mappings of delta ingests are deleted once all the
+        # batches are written
+        batches = []
+        with patch.object(
+            ingest, "insert_arptable", side_effect=_insert_arptable
+        ), patch.object(ingest, "delete_macips") as mock_delete:
+            writer = ingest._ZoneWriter(delta=True, batch=2)
+            writer.start()
+            for item in items:
+                writer.queue.put(item)
+            writer.queue.put(ingest._DONE)
+            writer.join()
+        self.assertEqual(len(batches), 3)
+        mock_delete.assert_called_once_with(
+            list(range(5)), lookup=writer._lookup
+        )
+        self.assertIsNone(writer.error)
+
+        # Errors are recorded and the queue is still drained
+        with patch.object(
+            ingest, "insert_arptable", side_effect=ValueError("Error")
+        ) as mock_insert:
+            writer = ingest._ZoneWriter(batch=1)
+            writer.start()
+            for item in items:
+                writer.queue.put(item)
+            writer.queue.put(ingest._DONE)
+            writer.join()
+        self.assertIsInstance(writer.error, ValueError)
+        self.assertEqual(mock_insert.call_count, 1)
+
 
 if __name__ == "__main__":
     # Do the unit test
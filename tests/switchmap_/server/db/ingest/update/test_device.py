@@ -4,6 +4,7 @@
 import os
 import sys
 import unittest
+from unittest.mock import patch
 from copy import deepcopy
 from operator import attrgetter
 
@@ -71,6 +72,9 @@ from switchmap.server.db.ingest.update import zone as zone_update
 from switchmap.server.db.ingest import ingest
 from switchmap.server.db.table import zone
 from switchmap.server.db.table import oui
+from switchmap.server.db.table import mac
+from switchmap.server.db.table import changelog
+from switchmap.server.db.table import l1interface
 from switchmap.server.db.table import event
 from switchmap.server.db import db
 from switchmap.server.db import models
@@ -83,6 +87,7 @@ from switchmap.server.db.table import RMacPort
 from switchmap.server.db.table import RVlanPort
 from switchmap.server.db.table import RVlan
 from switchmap.server.db.table import RL1Interface
+from switchmap.server.db.table import IL1Interface
 from switchmap.server.db.table import RDevice
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IOui
@@ -260,6 +265,69 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
             )
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test__idx_macs(self):
+        """Testing function _idx_macs."""
+        # Initialize key variables
+        polled = device.Device(_polled_data()).process()
+        macs = [
+            _
+            for interface in polled["layer1"].values()
+            for _ in interface.get("l1_macs") or []
+        ]
+
+        # Test with small chunks. Every MAC in the zone must be found
+        with patch.object(testimport, "_MAC_CHUNK", 3):
+            result = testimport._idx_macs(self.idx_zone, macs + macs)
+        for item in macs:
+            exists = mac.exists(self.idx_zone, item)
+            if bool(exists) is True:
+                self.assertEqual(result[exists.mac], exists.idx_mac)
+        self.assertTrue(bool(result))
+
+        # Test with no MACs
+        self.assertEqual(testimport._idx_macs(self.idx_zone, []), {})
+
+    def test__changed(self):
+        """Testing function _changed."""
+        # Initialize key variables
+        values = {
+            "idx_device": 1,
+            "ifindex": 1,
+            "duplex": None,
+            "ethernet": 1,
+            "nativevlan": None,
+            "trunk": 0,
+            "ifspeed": 1000,
+            "iftype": 6,
+            "ifalias": None,
+            "ifdescr": "GigabitEthernet1/0/1",
+            "ifname": "Gi1/0/1",
+            "ifadminstatus": 1,
+            "ifoperstatus": 1,
+            "ts_idle": 0,
+            "cdpcachedeviceid": None,
+            "cdpcachedeviceport": None,
+            "cdpcacheplatform": None,
+            "lldpremportdesc": None,
+            "lldpremsyscapenabled": None,
+            "lldpremsysdesc": None,
+            "lldpremsysname": None,
+            "enabled": 1,
+        }
+        current = RL1Interface(
+            idx_l1interface=1, ts_modified=None, ts_created=None, **values
+        )._replace(ethernet=b"\x01", trunk=b"\x00")
+
+        # Test. BIT columns and empty strings are equivalent
+        row = IL1Interface(**values)._replace(ifalias="")
+        self.assertEqual(testimport._changed(current, row), [])
+
+        # Test with changes
+        row = row._replace(ifoperstatus=2, ts_idle=1000)
+        self.assertEqual(
+            testimport._changed(current, row), ["ifoperstatus", "ts_idle"]
+        )
+
 
 class TestPollUpdateTopologyClasses(unittest.TestCase):
     """Checks all functions and methods."""
@@ -1580,6 +1648,40 @@ class TestPollUpdateTopologyClasses(unittest.TestCase):
         result.sort(key=lambda x: (x.idx_macport))
         self.assertEqual(result[: self.max_loops], expected)
 
+    def test_changelog(self):
+        """Testing function changelog."""
+        # Process the device
+        _device = device.Device(_polled_data())
+        data = _device.process()
+        exists = testimport.device(self.idx_zone, data)
+
+        # Snapshot ingests don't record changes
+        tester = testimport.Topology(exists, data)
+        tester.changelog("Vlan", "insert", ["vlan 1"])
+        self.assertFalse(changelog.changes(exists.idx_device))
+
+        # Test. Everything is new the first time the device is ingested
+        testimport.Topology(exists, data, delta=True).process()
+        result = changelog.changes(exists.idx_device)
+        self.assertTrue(bool(result))
+        self.assertEqual(set([_.action for _ in result]), set(["insert"]))
+        count = len(result)
+
+        # Nothing changes when the same data is ingested again
+        testimport.Topology(exists, data, delta=True).process()
+        self.assertEqual(len(changelog.changes(exists.idx_device)), count)
+
+        # Interfaces the device no longer has are deleted
+        ifindex = sorted(data["layer1"])[0]
+        del data["layer1"][ifindex]
+        testimport.Topology(exists, data, delta=True).process()
+        result = changelog.changes(exists.idx_device)[count:]
+        self.assertIn(
+            ("L1Interface", "delete"),
+            [(_.tablename, _.action) for _ in result],
+        )
+        self.assertFalse(l1interface.exists(exists.idx_device, ifindex))
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Test the changelog module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db{0}table""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.server.db.table import changelog as testimport
+from switchmap.server.db.table import IChangeLog
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestDbTableChangeLog(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUp(cls):
+        """Execute these steps before starting each test."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+        # Pollinate db with prerequisites
+        db.populate()
+
+    @classmethod
+    def tearDown(cls):
+        """Execute these steps after each tests is completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_changes(self):
+        """Testing function changes."""
+        # Initialize key variables
+        rows = []
+
+        # Test before insertion of rows
+        result = testimport.changes(1)
+        self.assertFalse(result)
+
+        # Test after insertion of rows. Oldest changes are first
+        for _ in range(1, db.TEST_MAXIMUM):
+            row = _row()
+            rows.append(row)
+            testimport.insert_row(row)
+        result = testimport.changes(1)
+        self.assertEqual([_convert(_) for _ in result], rows)
+
+    def test_insert_row(self):
+        """Testing function insert_row."""
+        # Test
+        rows = [_row() for _ in range(1, db.TEST_MAXIMUM)]
+        testimport.insert_row(rows)
+        result = testimport.changes(1)
+        self.assertEqual(len(result), len(rows))
+        self.assertEqual(sorted([_convert(_) for _ in result]), sorted(rows))
+
+
+def _convert(row):
+    """Convert RChangeLog to IChangeLog record.
+
+    Args:
+        row: RChangeLog/IChangeLog record
+
+    Returns:
+        result: IChangeLog result
+
+    """
+    # Do conversion
+    result = IChangeLog(
+        idx_device=row.idx_device,
+        tablename=row.tablename,
+        action=row.action,
+        item=row.item,
+        enabled=row.enabled,
+    )
+    return result
+
+
+def _row():
+    """Create an IChangeLog record.
+
+    Args:
+        None
+
+    Returns:
+        result: IChangeLog object
+
+    """
+    # Create result
+    result = IChangeLog(
+        idx_device=1,
+        tablename=data.random_string(),
+        action=data.random_string(),
+        item=data.random_string(),
+        enabled=1,
+    )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
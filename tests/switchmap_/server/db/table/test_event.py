@@ -59,6 +59,8 @@ CONFIG.save()
 from switchmap.server.db.table import event as testimport
 from switchmap.server.db.table import IEvent
 from switchmap.server.db.table import root
+from switchmap.server.db.table import zone
+from switchmap.server.db.table import IZone
 from switchmap.server.db import models
 
 from tests.testlib_ import db
@@ -322,6 +324,69 @@ class TestDbTableEvent(unittest.TestCase):
         for index in [0, -1, -2]:
             self.assertEqual(indexes_before[index], indexes_after[index])
 
+    def test_purge_background(self):
+        """Testing function purge_background."""
+        # Create additional events
+        for _ in range(5):
+            testimport.create()
+
+        # Test
+        self.assertTrue(testimport.purge_background())
+        self.assertFalse(testimport.purge_background())
+        testimport._PURGER.join()
+        self.assertEqual(len(testimport.events()), 3)
+
+    def test__delete_children(self):
+        """Testing function _delete_children."""
+        # Create an event with zones
+        _event = testimport.create()
+        for name in ["zone1", "zone2", "zone3"]:
+            zone.insert_row(
+                IZone(
+                    idx_event=_event.idx_event,
+                    name=name,
+                    notes=None,
+                    enabled=1,
+                )
+            )
+        self.assertEqual(len(zone.zones(_event.idx_event)), 3)
+
+        # Test. The event itself isn't deleted
+        testimport._delete_children(_event.idx_event, batch=2)
+        self.assertFalse(zone.zones(_event.idx_event))
+        self.assertTrue(testimport.idx_exists(_event.idx_event))
+
+    def test__children(self):
+        """Testing function _children."""
+        # Create events
+        idxs = [testimport.create().idx_event for _ in range(3)]
+        expected = sorted(
+            [_.idx_root for _ in root.roots() if _.idx_event in idxs]
+        )
+
+        # Test
+        result = testimport._children(
+            models.Root.idx_root, models.Root.idx_event, idxs, batch=2
+        )
+        self.assertEqual(sorted(result), expected)
+        self.assertFalse(
+            testimport._children(
+                models.Root.idx_root, models.Root.idx_event, []
+            )
+        )
+
+    def test__delete_rows(self):
+        """Testing function _delete_rows."""
+        # Create events
+        idxs = [testimport.create().idx_event for _ in range(3)]
+
+        # Test
+        result = testimport._delete_rows(
+            models.Root.idx_root, models.Root.idx_event, idxs, batch=2
+        )
+        self.assertEqual(result, 3)
+        self.assertFalse([_ for _ in root.roots() if _.idx_event in idxs])
+
     def test__row(self):
         """Testing function _row."""
         # This function is tested by all the other tests
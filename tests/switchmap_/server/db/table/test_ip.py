@@ -193,6 +193,26 @@ class TestDbTableIp(unittest.TestCase):
             self.assertTrue(isinstance(result, list))
             self.assertEqual(len(result), 0)
 
+    def test_idx_ips(self):
+        """Testing function idx_ips."""
+        # Repeat test
+        for _ in range(self.loops):
+            # Create record
+            row = _row()
+
+            # Test before insertion of an initial row
+            result = testimport.idx_ips([row.idx_zone])
+            self.assertNotIn((row.idx_zone, row.address), result)
+
+            # Test after insertion of an initial row
+            testimport.insert_row(row)
+            found = testimport.exists(row.idx_zone, row.address)
+            result = testimport.idx_ips([row.idx_zone])
+            self.assertEqual(result[(row.idx_zone, row.address)], found.idx_ip)
+
+        # Test with no zones
+        self.assertEqual(testimport.idx_ips([]), {})
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Repeat test
@@ -56,6 +56,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 from switchmap.server.db.table import ipport as testimport
+from switchmap.server.db.table import ip
 from switchmap.server.db.models import IpPort
 from switchmap.server.db.table import IIpPort
 from switchmap.server.db import models
@@ -191,6 +192,26 @@ class TestDbTableIpPort(unittest.TestCase):
                 if exists.idx_ip not in finds:
                     finds.append(exists.idx_ip)
 
+    def test_pairs(self):
+        """Testing function pairs."""
+        # Start iterative tests
+        for _ in range(1, db.TEST_MAXIMUM):
+            # Create record
+            row = _row()
+            idx_zone = ip.idx_exists(row.idx_ip).idx_zone
+
+            # Test before insertion of an initial row
+            result = testimport.pairs([idx_zone])
+            self.assertNotIn((row.idx_l1interface, row.idx_ip), result)
+
+            # Test after insertion of an initial row
+            testimport.insert_row(row)
+            result = testimport.pairs([idx_zone])
+            self.assertIn((row.idx_l1interface, row.idx_ip), result)
+
+        # Test with no zones
+        self.assertEqual(testimport.pairs([]), set())
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Start iterative tests
@@ -156,6 +156,24 @@ class TestDbTableMac(unittest.TestCase):
         self.assertEqual(_convert(result[0]), _convert(row))
         self.assertTrue(row.idx_oui != 1)
 
+    def test_idx_macs(self):
+        """Testing function idx_macs."""
+        # Create record
+        row = _row()
+
+        # Test before insertion of an initial row
+        result = testimport.idx_macs([row.idx_zone])
+        self.assertNotIn((row.idx_zone, row.mac), result)
+
+        # Test after insertion of an initial row
+        testimport.insert_row(row)
+        found = testimport.exists(row.idx_zone, row.mac)
+        result = testimport.idx_macs([row.idx_zone])
+        self.assertEqual(result[(row.idx_zone, row.mac)], found.idx_mac)
+
+        # Test with no zones
+        self.assertEqual(testimport.idx_macs([]), {})
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Create record
@@ -142,6 +142,25 @@ class TestDbTableMacIp(unittest.TestCase):
             self.assertTrue(result)
             self.assertEqual(_convert(result), _convert(row))
 
+    def test_pairs(self):
+        """Testing function pairs."""
+        # Loop a lot of times
+        for _ in range(self.loops):
+            # Create record
+            row = _row()
+
+            # Test before insertion of an initial row
+            result = testimport.pairs([1])
+            self.assertNotIn((row.idx_mac, row.idx_ip), result)
+
+            # Test after insertion of an initial row
+            testimport.insert_row(row)
+            result = testimport.pairs([1])
+            self.assertIn((row.idx_mac, row.idx_ip), result)
+
+        # Test with no zones
+        self.assertEqual(testimport.pairs([]), set())
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Loop a lot of times
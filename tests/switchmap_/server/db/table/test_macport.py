@@ -56,6 +56,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 from switchmap.server.db.table import macport as testimport
+from switchmap.server.db.table import mac
 from switchmap.server.db.models import MacPort
 from switchmap.server.db.table import IMacPort
 from switchmap.server.db import models
@@ -187,6 +188,27 @@ class TestDbTableMacPort(unittest.TestCase):
                 if exists.idx_mac not in finds:
                     finds.append(exists.idx_mac)
 
+    def test_ports(self):
+        """Testing function ports."""
+        # Test with known MACs
+        for _ in range(1, db.TEST_MAXIMUM):
+            row = _row()
+            if bool(testimport.exists(row.idx_l1interface, row.idx_mac)):
+                continue
+            idx_zone = mac.idx_exists(row.idx_mac).idx_zone
+
+            # Test before insertion of an initial row
+            result = testimport.ports([idx_zone])
+            self.assertNotIn(row.idx_l1interface, result.get(row.idx_mac, []))
+
+            # Test after insertion of an initial row
+            testimport.insert_row(row)
+            result = testimport.ports([idx_zone])
+            self.assertIn(row.idx_l1interface, result[row.idx_mac])
+
+        # Test with no zones
+        self.assertEqual(testimport.ports([]), {})
+
     def test_insert_row(self):
         """Testing function insert_row."""
         # Find a row combination that does not exist
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Test the db module."""
+
+import os
+import sys
+import unittest
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from switchmap.server.db import db as testimport
+from switchmap.server.db.models import Oui
+from switchmap.server.db import models
+
+from tests.testlib_ import db
+from tests.testlib_ import data
+
+
+class TestDb(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        models.create_all_tables()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_db_add_all(self):
+        """Testing function db_add_all."""
+        # Initialize key variables
+        ouis = [data.random_string() for _ in range(3)]
+
+        # Test
+        testimport.db_add_all(
+            2067,
+            [Oui(oui=_.encode(), organization=b"org", enabled=1) for _ in ouis],
+        )
+        self.assertEqual(sorted(_organizations(ouis)), sorted(ouis))
+
+    def test_db_insert(self):
+        """Testing function db_insert."""
+        # Initialize key variables
+        ouis = [data.random_string() for _ in range(5)]
+
+        # Test. Primary keys are assigned in the order of the rows
+        self.assertTrue(testimport.db_insert(2068, Oui, []))
+        result = testimport.db_insert(2069, Oui, _rows(ouis, "org"), chunk=2)
+        self.assertTrue(result)
+        rows = _organizations(ouis)
+        self.assertEqual(list(rows), ouis)
+        self.assertEqual(sorted(rows.values()), list(rows.values()))
+
+    def test_db_insert_ignore(self):
+        """Testing function db_insert with ignore."""
+        # Initialize key variables
+        ouis = [data.random_string() for _ in range(3)]
+        testimport.db_insert(2070, Oui, _rows(ouis[:2], "org"))
+
+        # Test. Duplicates are skipped
+        testimport.db_insert(
+            2071, Oui, _rows(ouis, "new"), ignore=True, chunk=2
+        )
+        self.assertEqual(
+            _organizations(ouis, key="organization"),
+            {ouis[0]: "org", ouis[1]: "org", ouis[2]: "new"},
+        )
+
+    def test_db_insert_update(self):
+        """Testing function db_insert with update."""
+        # Initialize key variables
+        ouis = [data.random_string() for _ in range(3)]
+        testimport.db_insert(2072, Oui, _rows(ouis[:2], "org"))
+
+        # Test. Duplicates are updated
+        testimport.db_insert(
+            2073, Oui, _rows(ouis, "new"), update=["organization"], chunk=2
+        )
+        self.assertEqual(
+            _organizations(ouis, key="organization"),
+            {_: "new" for _ in ouis},
+        )
+
+    def test_db_insert_error(self):
+        """Testing function db_insert errors."""
+        # Initialize key variables
+        ouis = [data.random_string() for _ in range(3)]
+        testimport.db_insert(2074, Oui, _rows(ouis[-1:], "org"))
+
+        # Test. No rows are inserted if any chunk fails
+        with self.assertRaises(IntegrityError):
+            testimport.db_insert(2075, Oui, _rows(ouis, "new"), chunk=2)
+        self.assertEqual(list(_organizations(ouis)), ouis[-1:])
+
+
+def _rows(ouis, organization):
+    """Create Oui rows to insert.
+
+    Args:
+        ouis: List of OUIs
+        organization: Organization of the OUIs
+
+    Returns:
+        result: List of dicts of column values
+
+    """
+    # Return
+    result = [
+        dict(oui=_.encode(), organization=organization.encode(), enabled=1)
+        for _ in ouis
+    ]
+    return result
+
+
+def _organizations(ouis, key="idx_oui"):
+    """Get the OUI rows in the database.
+
+    Args:
+        ouis: List of OUIs
+        key: Column to return for each OUI
+
+    Returns:
+        result: Dict of column values keyed by OUI, ordered by idx_oui
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Get rows from database
+    statement = (
+        select(Oui)
+        .where(Oui.oui.in_([_.encode() for _ in ouis]))
+        .order_by(Oui.idx_oui)
+    )
+    rows = testimport.db_select_row(2076, statement)
+
+    # Return
+    for row in rows:
+        value = getattr(row, key)
+        result[row.oui.decode()] = (
+            value.decode() if isinstance(value, bytes) else value
+        )
+    return result
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
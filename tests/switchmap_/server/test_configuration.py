@@ -76,6 +76,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.cache_directory()
         self.assertEqual(result, expected)
 
+    def test_cache_format(self):
+        """Testing function cache_format."""
+        # Run test
+        expected = "json.gz"
+        result = self.config.cache_format()
+        self.assertEqual(result, expected)
+
     def test_db_host(self):
         """Testing function db_host."""
         # Run test
@@ -118,6 +125,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.db_user()
         self.assertEqual(result, expected)
 
+    def test_ingest_delta(self):
+        """Testing function ingest_delta."""
+        # Run test
+        expected = False
+        result = self.config.ingest_delta()
+        self.assertEqual(result, expected)
+
     def test_ingest_directory(self):
         """Testing function ingest_directory."""
         # Run test
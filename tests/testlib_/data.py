@@ -63,6 +63,8 @@ server:
   api_username: Baprat9udri2wed5LzUB
   api_password: z2vucEsOP3s1Rep6LSwe
   api_https: False
+  cache_format: json.gz
+  ingest_delta: False
   ingest_interval: 98712
   purge_after_ingest: False
   db_host: Mwxu7gnv29AbLGyz
@@ -85,18 +87,40 @@ dashboard:
 poller:
   username: nv2Mwx7gu9AbLGyz
   polling_interval: 21600
+  polling_engine: AsyncIO
+  polling_concurrency: 250
+  polling_device_timeout: 1200
+  polling_context_parallelism: 12
+  polling_context_timeout: 90
+  polling_query_parallelism: 6
+  polling_incremental: True
+  polling_incremental_refresh: 7200
+  host_polling_intervals:
+    hostname1: 60
+    hostnameA: 1800
+    hostnameB: invalid
+  capability_cache_ttl: 43200
+  bulkwalk_adaptive: True
+  bulkwalk_max_pdu_size: 8192
+  bulkwalk_max_repetitions: 40
   server_address: bwSeAzPmAygg8rcJ
   server_bind_port: 9876
+  server_batch_interval: 15
+  server_batch_size: 50
+  server_compression: False
+  spool_max_files: 250
   server_username: null
   server_password: None
   server_https: False
   zones:
     - zone: SITE-A
+      polling_interval: 300
       hostnames:
         - hostname1
         - hostname2
         - hostname3
     - zone: SITE-B
+      polling_interval: -300
       hostnames:
         - hostnameA
         - hostnameB
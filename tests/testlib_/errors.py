@@ -66,6 +66,7 @@ Minimum value {} is greater than {}. Please fix.\
         r".db_replace(",
         r".db_add(",
         ".db_add_all(",
+        ".db_insert(",
         r".db_select(",
         r".db_delete(",
         r".db_update(",